@@ -9,10 +9,30 @@ https://www.isogeo.com/
 # submodules
 from .__about__ import __version__  # noqa: F401
 from .api_hooks import IsogeoHooks  # noqa: F401
+from .budget import IsogeoRequestBudget  # noqa: F401
+from .cache import IsogeoCache  # noqa: F401
 from .checker import IsogeoChecker  # noqa: F401
 from .decorators import ApiDecorators  # noqa: F401
-from .exceptions import AlreadyExistError  # noqa: F401
+from .exceptions import (  # noqa: F401
+    AlreadyExistError,
+    DeadlineExceededError,
+    RequestBudgetExceededError,
+    ResponseNotRecordedError,
+)
 from .isogeo import Isogeo  # noqa: F401
+from .latency import IsogeoLatencyTracker, deadline  # noqa: F401
+from .limiter import IsogeoLimiter, priority  # noqa: F401
+from .profiling import IsogeoProfiler  # noqa: F401
+from .results_store import IsogeoDiskResults  # noqa: F401
+from .scheduler import IsogeoScheduler  # noqa: F401
+from .singleflight import IsogeoSingleFlight  # noqa: F401
+from .stream_parser import IsogeoStreamParser  # noqa: F401
+from .tracing import set_tracer  # noqa: F401
+from .transports import (  # noqa: F401
+    IsogeoHttp2Adapter,
+    IsogeoRecordAdapter,
+    IsogeoReplayAdapter,
+)
 from .translator import IsogeoTranslator  # noqa: F401
 from .utils import IsogeoUtils  # noqa: F401
 
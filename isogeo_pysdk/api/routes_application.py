@@ -69,9 +69,7 @@ class ApiApplication:
 
         # URL
         if workgroup_id is not None:
-            logger.debug(
-                "Listing applications for a workgroup: {}".format(workgroup_id)
-            )
+            logger.debug("Listing applications for a workgroup: %s", workgroup_id)
             if not checker.check_is_uuid(workgroup_id):
                 raise ValueError(
                     "Workgroup ID is not a correct UUID: {}".format(workgroup_id)
@@ -82,9 +80,8 @@ class ApiApplication:
                 )
         else:
             logger.debug(
-                "Listing applications for the authenticated user: {}".format(
-                    self.api_client._user.contact.name
-                )
+                "Listing applications for the authenticated user: %s",
+                self.api_client._user.contact.name,
             )
             url_applications = self.utils.get_request_base_url(route="applications")
 
@@ -185,9 +182,9 @@ class ApiApplication:
             # check
             if application.name in self.api_client._applications_names:
                 logger.debug(
-                    "Application with the same name already exists: {}. Use 'application_update' instead.".format(
-                        application.name
-                    )
+                    "Application with the same name already exists: %s. Use 'application_update' "
+                    "instead.",
+                    application.name,
                 )
                 return False
         else:
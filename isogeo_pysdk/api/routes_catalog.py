@@ -251,9 +251,8 @@ class ApiCatalog:
             # check
             if catalog.name in self.api_client._wg_catalogs_names:
                 logger.debug(
-                    "Catalog with the same name already exists: {}. Use 'catalog_update' instead.".format(
-                        catalog.name
-                    )
+                    "Catalog with the same name already exists: %s. Use 'catalog_update' instead.",
+                    catalog.name,
                 )
                 return False
         else:
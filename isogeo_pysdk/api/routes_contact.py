@@ -177,9 +177,8 @@ class ApiContact:
             # check
             if contact.name in self.api_client._wg_contacts_names:
                 logger.debug(
-                    "Contact with the same name already exists: {}. Use 'contact_update' instead.".format(
-                        contact.name
-                    )
+                    "Contact with the same name already exists: %s. Use 'contact_update' instead.",
+                    contact.name,
                 )
                 return self.get(self.api_client._wg_contacts_names.get(contact.name))
         elif check_exists == 2:
@@ -189,9 +188,8 @@ class ApiContact:
             # check
             if contact.email in self.api_client._wg_contacts_emails:
                 logger.debug(
-                    "Contact with the same email already exists: {}. Use 'contact_update' instead.".format(
-                        contact.email
-                    )
+                    "Contact with the same email already exists: %s. Use 'contact_update' instead.",
+                    contact.email,
                 )
                 return self.get(self.api_client._wg_contacts_emails.get(contact.email))
         else:
@@ -180,9 +180,9 @@ class ApiDatasource:
             # check
             if datasource.name in self.api_client._wg_datasources_names:
                 logger.debug(
-                    "Datasource with the same name already exists: {}. Use 'datasource_update' instead.".format(
-                        datasource.name
-                    )
+                    "Datasource with the same name already exists: %s. Use 'datasource_update' "
+                    "instead.",
+                    datasource.name,
                 )
                 return False
         elif check_exists == 2:  # check URL (location)
@@ -192,9 +192,9 @@ class ApiDatasource:
             # check
             if datasource.location in self.api_client._wg_datasources_urls:
                 logger.debug(
-                    "Datasource with the same url (location) already exists: {}. Use 'datasource_update' instead.".format(
-                        datasource.location
-                    )
+                    "Datasource with the same url (location) already exists: %s. Use "
+                    "'datasource_update' instead.",
+                    datasource.location,
                 )
                 return False
         else:
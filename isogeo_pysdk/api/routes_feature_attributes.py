@@ -391,17 +391,16 @@ class ApiFeatureAttribute:
                 # check if an attribute with the same name already exists and ignore it
                 if attribute.name in attributes_dest_names:
                     logger.info(
-                        "Attribute with the same name ({}) already exists. It has been ignored.".format(
-                            attribute.name
-                        )
+                        "Attribute with the same name (%s) already exists. It has been ignored.",
+                        attribute.name,
                     )
                     continue
                 # or create it
                 self.create(metadata_dest, attribute)
                 logger.debug(
-                    "Attribute {} has been added to the metadata {}".format(
-                        attribute.name, metadata_dest._id
-                    )
+                    "Attribute %s has been added to the metadata %s",
+                    attribute.name,
+                    metadata_dest._id,
                 )
         elif mode == "update":
             for attribute in attributes_source:
@@ -432,9 +431,7 @@ class ApiFeatureAttribute:
                 attr_dst.language = attr_src.language
                 self.update(metadata=metadata_dest, attribute=attr_dst)
                 logger.debug(
-                    "Attribute with the same name ({}) spotted. It has been updated.".format(
-                        attr_dst.name
-                    )
+                    "Attribute with the same name (%s) spotted. It has been updated.", attr_dst.name
                 )
         elif mode == "update_or_add":
             for attribute in attributes_source:
@@ -454,9 +451,8 @@ class ApiFeatureAttribute:
                     attr_dst.language = attr_src.language
                     self.update(metadata=metadata_dest, attribute=attr_dst)
                     logger.debug(
-                        "Attribute with the same name ({}) spotted. It has been updated.".format(
-                            attr_dst.name
-                        )
+                        "Attribute with the same name (%s) spotted. It has been updated.",
+                        attr_dst.name,
                     )
                 else:
                     # or create it
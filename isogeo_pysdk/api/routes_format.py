@@ -87,11 +87,7 @@ class ApiFormat:
                 url_formats = self.utils.get_request_base_url(
                     route="formats/{}".format(data_type)
                 )
-                logger.debug(
-                    "Listing available geographic formats for {} metadata...".format(
-                        data_type
-                    )
-                )
+                logger.debug("Listing available geographic formats for %s metadata...", data_type)
             else:
                 raise ValueError(
                     "Metadata type name '{}' is not one of accepted values: {}".format(
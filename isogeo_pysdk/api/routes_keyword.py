@@ -12,13 +12,12 @@
 
 # Standard library
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import logging
-from functools import partial
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
+from isogeo_pysdk.limiter import current_priority, priority
 from isogeo_pysdk.models import Keyword, KeywordSearch, Metadata, Workgroup
 
 # #############################################################################
@@ -39,18 +38,6 @@ class ApiKeyword:
         if api_client is not None:
             self.api_client = api_client
 
-        # create an asyncio AbstractEventLoop
-        try:
-            self.loop = asyncio.get_event_loop()
-        except RuntimeError as e:
-            logger.warning(
-                "Async get loop failed. Maybe because it's already executed in a separated thread. Original error: {}".format(
-                    e
-                )
-            )
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-
         # store API client (Request [Oauthlib] Session) and pass it to the decorators
         self.api_client = api_client
         ApiDecorators.api_client = api_client
@@ -194,10 +181,10 @@ class ApiKeyword:
             # avoid to launch async searches if it's possible in one request
             if total_results <= 100:
                 logger.debug(
-                    "Paginated (size={}) search changed into a unique search because "
-                    "the total of metadata {} is less than the maximum size (100).".format(
-                        page_size, total_results
-                    )
+                    "Paginated (size=%s) search changed into a unique search because the total of "
+                    "metadata %s is less than the maximum size (100).",
+                    page_size,
+                    total_results,
                 )
                 return self.thesaurus(
                     thesaurus_id=thesaurus_id,
@@ -231,28 +218,10 @@ class ApiKeyword:
                     "lang": lang
                 }
 
-                # check loop state
-                if self.loop.is_closed():
-                    logger.debug(
-                        "Current event loop is already closed. Creating a new one..."
-                    )
-                    self.loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(self.loop)
-
-                # launch async searches
-                future_searches_concatenated = asyncio.ensure_future(
-                    self.search_keyword_asynchronous(
-                        total_results=total_results, **search_params
-                    ),
-                    loop=self.loop,
+                # launch paginated searches through the client scheduler
+                req_keyword_search = self.search_keyword_pages(
+                    total_results=total_results, **search_params
                 )
-                self.loop.run_until_complete(future_searches_concatenated)
-
-                # check results structure
-                req_keyword_search = future_searches_concatenated.result()
-
-                # properly close the loop
-                self.loop.close()
         else:
             # request
             req_thesaurus_keywords = self.api_client.get(
@@ -274,6 +243,20 @@ class ApiKeyword:
         # end of method
         return req_keyword_search
 
+    async def thesaurus_async(self, *args, **kwargs) -> KeywordSearch:
+        """Coroutine version of :py:meth:`thesaurus`, with the same parameters, to be awaited \
+        from asynchronous code without blocking the running event loop.
+
+        The search is executed by the client scheduler (see \
+        :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`), so it counts against its concurrency \
+        cap.
+
+        :rtype: KeywordSearch
+        """
+        return await asyncio.wrap_future(
+            self.api_client.scheduler.submit(self.thesaurus, *args, **kwargs)
+        )
+
     @ApiDecorators._check_bearer_validity
     def workgroup(
         self,
@@ -694,9 +677,10 @@ class ApiKeyword:
             # then compare
             if keyword._tag in metadata_existing_keywords:
                 logger.info(
-                    "Keyword {} is already associated with the metadata {}. Tagging operation cancelled.".format(
-                        keyword._tag, metadata._id
-                    )
+                    "Keyword %s is already associated with the metadata %s. Tagging operation "
+                    "cancelled.",
+                    keyword._tag,
+                    metadata._id,
                 )
                 # return checker as true
                 return True, 204
@@ -725,12 +709,12 @@ class ApiKeyword:
             if req_check[1] == 409:
                 # log conflict
                 logger.info(
-                    "Metadata '{}' is already tagged by the keyword '{}'. Isogeo API reply: HTTP {} - {}.".format(
-                        metadata._id,
-                        keyword._id,
-                        req_check[1],
-                        req_keyword_associate.reason,
-                    )
+                    "Metadata '%s' is already tagged by the keyword '%s'. Isogeo API reply: HTTP "
+                    "%s - %s.",
+                    metadata._id,
+                    keyword._id,
+                    req_check[1],
+                    req_keyword_associate.reason,
                 )
                 # set checker as true
                 req_check = tuple([True, req_check[1]])
@@ -873,12 +857,12 @@ class ApiKeyword:
             if req_check[1] == 409:
                 # log conflict
                 logger.info(
-                    "Keyword '{}' is already associated to the workgroup '{}'. Isogeo API reply: HTTP {} - {}.".format(
-                        keyword._id,
-                        workgroup._id,
-                        req_check[1],
-                        req_keyword_associate.reason,
-                    )
+                    "Keyword '%s' is already associated to the workgroup '%s'. Isogeo API reply: "
+                    "HTTP %s - %s.",
+                    keyword._id,
+                    workgroup._id,
+                    req_check[1],
+                    req_keyword_associate.reason,
                 )
                 # set checker as true
                 return True, req_check[1]
@@ -975,12 +959,12 @@ class ApiKeyword:
             if req_check[1] == 404:
                 # log conflict
                 logger.info(
-                    "Keyword '{}' is already dissociated from the workgroup '{}'. Isogeo API reply: HTTP {} - {}.".format(
-                        keyword._id,
-                        workgroup._id,
-                        req_check[1],
-                        req_keyword_dissociate.reason,
-                    )
+                    "Keyword '%s' is already dissociated from the workgroup '%s'. Isogeo API "
+                    "reply: HTTP %s - %s.",
+                    keyword._id,
+                    workgroup._id,
+                    req_check[1],
+                    req_keyword_dissociate.reason,
                 )
                 # set checker as true
                 return True, req_check[1]
@@ -992,60 +976,78 @@ class ApiKeyword:
 
     # -- SEARCH SUB METHODS
     async def search_keyword_asynchronous(
-        self, total_results: int, max_workers: int = 10, **kwargs
+        self, total_results: int, **kwargs
     ) -> KeywordSearch:
-        """Meta async method used to request big searches (> 100 results), using asyncio. It's a
+        """Deprecated coroutine version of :py:meth:`search_keyword_pages`.
+
+        :param int total_results: total of results to retrieve
+
+        :rtype: KeywordSearch
+        """
+        logger.warning(
+            DeprecationWarning(
+                "'search_keyword_asynchronous' is deprecated. "
+                "Use 'search_keyword_pages' or 'thesaurus_async' instead."
+            )
+        )
+        return await asyncio.wrap_future(
+            self.api_client.scheduler.submit(
+                self.search_keyword_pages, total_results, **kwargs
+            )
+        )
+
+    def search_keyword_pages(self, total_results: int, **kwargs) -> KeywordSearch:
+        """Meta method used to request big searches (> 100 results), page by page. It's a \
         private method launched by the main search method.
 
+        Pages are requested through the client scheduler (see \
+        :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`) which caps the concurrency. No event \
+        loop is used, so it can be called from a running one (Jupyter, web frameworks...).
+
         :param int total_results: total of results to retrieve
-        :param int max_workers: maximum number of thread to use :class:`python.concurrent.futures`
 
         :rtype: KeywordSearch
         """
-        # prepare async searches
+        # prepare paginated searches
         total_pages = self.utils.pages_counter(total_results, page_size=100)
         li_offsets = [offset * 100 for offset in range(0, total_pages)]
-        logger.debug("Async search launched with {} pages.".format(total_pages))
-
-        with ThreadPoolExecutor(
-            max_workers=max_workers, thread_name_prefix="IsogeoSearch"
-        ) as executor:
-            self.loop = asyncio.get_event_loop()
-            tasks = [
-                self.loop.run_in_executor(
-                    executor,
-                    partial(
-                        self.thesaurus,
-                        # filters
-                        thesaurus_id=kwargs.get("thesaurus_id"),
-                        query=kwargs.get("query"),
-                        include=kwargs.get("include"),
-                        specific_md=kwargs.get("specific_md"),
-                        specific_tag=kwargs.get("specific_tag"),
-                        # sorting
-                        order_by=kwargs.get("order_by"),
-                        order_dir=kwargs.get("order_dir"),
-                        # pagination
-                        offset=offset,
-                        page_size=100,
-                        # options
-                        whole_results=0,
-                        # multilingualism
-                        lang=kwargs.get("lang"),
-                    ),
+        logger.debug("Paginated search launched with %s pages.", total_pages)
+
+        # pages are background traffic unless the caller chose a priority
+        with priority(current_priority() or "batch"):
+            futures = [
+                self.api_client.scheduler.submit(
+                    self.thesaurus,
+                    # filters
+                    thesaurus_id=kwargs.get("thesaurus_id"),
+                    query=kwargs.get("query"),
+                    include=kwargs.get("include"),
+                    specific_md=kwargs.get("specific_md"),
+                    specific_tag=kwargs.get("specific_tag"),
+                    # sorting
+                    order_by=kwargs.get("order_by"),
+                    order_dir=kwargs.get("order_dir"),
+                    # pagination
+                    offset=offset,
+                    page_size=100,
+                    # options
+                    whole_results=0,
+                    # multilingualism
+                    lang=kwargs.get("lang"),
                 )
                 for offset in li_offsets
             ]
 
-            # store responses in a fresh Metadata Search object
-            final_search = KeywordSearch(results=[])
-            for response in await asyncio.gather(*tasks):
-                final_search.limit = response.total
-                final_search.offset = 0
-                final_search.results.extend(response.results)
-                final_search.total = response.total
+        # store responses in a fresh Metadata Search object
+        final_search = KeywordSearch(results=[])
+        for future in futures:
+            response = future.result()
+            final_search.limit = response.total
+            final_search.offset = 0
+            final_search.results.extend(response.results)
+            final_search.total = response.total
 
-            return final_search
+        return final_search
 
 
 # ##############################################################################
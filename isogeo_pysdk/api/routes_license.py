@@ -165,9 +165,8 @@ class ApiLicense:
             # check
             if license.name in self.api_client._wg_licenses_names:
                 logger.debug(
-                    "License with the same name already exists: {}. Use 'license_update' instead.".format(
-                        license.name
-                    )
+                    "License with the same name already exists: %s. Use 'license_update' instead.",
+                    license.name,
                 )
                 return False
         else:
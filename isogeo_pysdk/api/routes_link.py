@@ -531,9 +531,10 @@ class ApiLink:
 
         # reading the file and sending it
         logger.debug(
-            "Uploading the file {} (type: {}) to the metadata '{}'".format(
-                filename, filetype, metadata._id
-            )
+            "Uploading the file %s (type: %s) to the metadata '%s'",
+            filename,
+            filetype,
+            metadata._id,
         )
         with filepath.open("rb") as opened_file:
             # request
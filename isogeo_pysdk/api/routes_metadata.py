@@ -73,7 +73,13 @@ class ApiMetadata:
         super(ApiMetadata, self).__init__()
 
     @ApiDecorators._check_bearer_validity
-    def get(self, metadata_id: str, include: Union[tuple, str] = (), lang: str = None) -> Metadata:
+    def get(
+        self,
+        metadata_id: str,
+        include: Union[tuple, str] = (),
+        lang: str = None,
+        fields: tuple = (),
+    ) -> Metadata:
         """Get complete or partial metadata about a specific metadata (= resource).
 
         :param str metadata_id: metadata UUID to get
@@ -81,6 +87,9 @@ class ApiMetadata:
 
           - one or various from MetadataSubresources (Enum)
           - "all" to get complete metadata with every subresource included
+
+        :param tuple fields: paths of the fields to keep, others being dropped. \
+            See: :py:meth:`~isogeo_pysdk.utils.IsogeoUtils.project_fields`. Empty by DEFAULT (all fields are kept).
         """
         # check metadata UUID
         if not checker.check_is_uuid(metadata_id):
@@ -118,7 +127,9 @@ class ApiMetadata:
             return req_check
 
         # end of method
-        return Metadata.clean_attributes(req_metadata.json())
+        return Metadata.clean_attributes(
+            self.utils.project_fields(req_metadata.json(), fields=fields)
+        )
 
     @ApiDecorators._check_bearer_validity
     def create(
@@ -9,6 +9,8 @@
 # ##################################
 
 # Standard library
+import gzip
+import json
 import logging
 
 # submodules
@@ -108,22 +110,13 @@ class ApiBulk:
         prepared_request.target = target
 
         # check metadatas uuid
-        metadatas = list(metadatas)
-        for i in metadatas:
-            if isinstance(i, str) and not checker.check_is_uuid(i):
-                logger.error("Not a correct UUID: {}".format(i))
-                metadatas.remove(i)
-            elif isinstance(i, Metadata) and not checker.check_is_uuid(i._id):
-                logger.error(
-                    "Metadata passed but with an incorrect UUID: {}".format(i._id)
-                )
-                metadatas.remove(i)
-            elif isinstance(i, Metadata) and checker.check_is_uuid(i._id):
-                logger.debug("Metadata passed, extracting the UUID: {}".format(i._id))
-                metadatas.append(i._id)
-                metadatas.remove(i)
-            else:
-                continue
+        metadatas, invalid_ids = checker.check_many_uuids(
+            i._id if isinstance(i, Metadata) else i for i in metadatas
+        )
+        if invalid_ids:
+            logger.error(
+                "Not correct UUIDs removed from the bulk request: %s", invalid_ids
+            )
 
         # add it to the prepared request query
         prepared_request.query = {"ids": metadatas}
@@ -145,20 +138,36 @@ class ApiBulk:
         return prepared_request
 
     @ApiDecorators._check_bearer_validity
-    def send(self) -> list:
+    def send(self, compress: bool = False) -> list:
         """Send prepared BULK_DATA to the `POST BULK resources/`.
 
+        :param bool compress: option to send the request body compressed with gzip \
+            (`Content-Encoding: gzip`), to save bandwidth on large bulks. Defaults to False.
+
         :rtype: List[BulkReport]
         """
 
         # build request url
         url_metadata_bulk = self.utils.get_request_base_url(route="resources")
 
+        # request body
+        headers = self.api_client.header
+        if compress:
+            body = json.dumps(self.BULK_DATA).encode("utf-8")
+            data = gzip.compress(body, compresslevel=6)
+            headers.update(
+                {"Content-Encoding": "gzip", "Content-Type": "application/json"}
+            )
+            logger.debug("Bulk request body compressed from %s to %s bytes.", len(body), len(data))
+        else:
+            data = None
+
         # request
         req_metadata_bulk = self.api_client.post(
             url=url_metadata_bulk,
-            json=self.BULK_DATA,
-            headers=self.api_client.header,
+            data=data,
+            json=None if compress else self.BULK_DATA,
+            headers=headers,
             proxies=self.api_client.proxies,
             stream=True,
             verify=self.api_client.ssl,
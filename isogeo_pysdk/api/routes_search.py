@@ -13,14 +13,21 @@
 
 # Standard library
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from concurrent.futures import as_completed
+import json
 import logging
 from functools import lru_cache, partial
+from typing import Union
 
 # submodules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.decorators import ApiDecorators
-from isogeo_pysdk.models import MetadataSearch
+from isogeo_pysdk.exceptions import IsogeoSdkError
+from isogeo_pysdk.limiter import current_priority, priority
+from isogeo_pysdk.models import MetadataSearch, SearchQuery
+from isogeo_pysdk.results_store import IsogeoDiskResults
+from isogeo_pysdk.stream_parser import IsogeoStreamParser
 
 # #############################################################################
 # ########## Globals ###############
@@ -29,6 +36,12 @@ from isogeo_pysdk.models import MetadataSearch
 logger = logging.getLogger(__name__)
 checker = IsogeoChecker()
 
+# size of the chunks read from the response in stream mode
+_STREAM_CHUNK_SIZE = 65536
+
+# fields which can be used to paginate searches by keyset
+_KEYSET_FIELDS = ("_created", "_modified")
+
 
 # #############################################################################
 # ########## Classes ###############
@@ -40,18 +53,6 @@ class ApiSearch:
         if api_client is not None:
             self.api_client = api_client
 
-        # create an asyncio AbstractEventLoop
-        try:
-            self.loop = asyncio.get_event_loop()
-        except RuntimeError as e:
-            logger.warning(
-                "Async get loop failed. Maybe because it's already executed in a separated thread. Original error: {}".format(
-                    e
-                )
-            )
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-
         # store API client (Request [Oauthlib] Session) and pass it to the decorators
         self.api_client = api_client
         ApiDecorators.api_client = api_client
@@ -69,11 +70,12 @@ class ApiSearch:
         # application or group
         group: str = None,
         # semantic and objects filters
-        query: str = "",
+        query: Union[str, SearchQuery] = "",
         share: str = None,
         specific_md: tuple = (),
         # results model
         include: tuple = (),
+        fields: tuple = (),
         # geographic filters
         bbox: tuple = None,
         poly: str = None,
@@ -90,6 +92,8 @@ class ApiSearch:
         augment: bool = False,
         check: bool = True,
         expected_total: int = None,
+        max_memory_results: int = None,
+        stream: bool = False,
         tags_as_dicts: bool = False,
         whole_results: bool = False,
     ) -> MetadataSearch:
@@ -102,7 +106,8 @@ class ApiSearch:
          **q** parameter in Isogeo API. It could be a simple
          string like *oil* or a tag like *keyword:isogeo:formations*
          or *keyword:inspire-theme:landcover*. The *AND* operator
-         is applied when various tags are passed.
+         is applied when various tags are passed. An already parsed
+         :py:class:`~isogeo_pysdk.models.search_query.SearchQuery` is also accepted.
         :param tuple bbox: Bounding box to limit the search. Must be a 4 tuple of \
             coordinates in WGS84 (EPSG 4326). Could be associated with *georel*.
         :param str poly: Geographic criteria for the search, in WKT format. \
@@ -138,10 +143,22 @@ class ApiSearch:
         :param str share: share UUID to filter on
         :param tuple specific_md: list of metadata UUIDs to filter on
         :param tuple include: subresources that should be returned. See: :py:class:`enums.MetadataSubresources`.
+        :param tuple fields: paths of the results fields to keep, others being dropped while parsing \
+            the response. Nested fields are separated with dots, e.g. `("_id", "links[].url")`. \
+            See: :py:meth:`~isogeo_pysdk.utils.IsogeoUtils.project_fields`. Empty by DEFAULT (all fields are kept).
         :param bool whole_results: option to return all results or only the page size. *False* by DEFAULT.
         :param bool check: option to check query parameters and avoid errors. *True* by DEFAULT.
         :param bool augment: option to improve API response by adding some tags on the fly (like shares_id)
         :param int expected_total: if different of None, value will be used to paginate. Can save a request.
+        :param int max_memory_results: for whole_results searches, maximum count of results to keep \
+            in memory. Above, results are spilled to a temporary file and the `results` attribute \
+            is a lazily-loading sequence (see :py:class:`~isogeo_pysdk.results_store.IsogeoDiskResults`). \
+            None by DEFAULT (everything is kept in memory).
+        :param bool stream: option to parse the response incrementally. The `results` attribute \
+            of the returned search is then an iterator yielding metadata one by one as they are \
+            received. Attributes returned before the results by the API (envelope, limit, offset, \
+            query) are set immediately, the others (tags, total) once results have been consumed. \
+            Not compatible with `augment`, `tags_as_dicts` and `whole_results` options.
         :param bool tags_as_dicts: option to store tags as key/values by filter.
 
         :rtype: MetadataSearch
@@ -171,7 +188,31 @@ class ApiSearch:
                 augment=1,
                 whole_results=1
             )
+
+            # retrieve only the links URLs of all metadata
+            search_links = isogeo.search(
+                include=("links",),
+                fields=("_id", "title", "links[].url", "links[].type"),
+                whole_results=1
+            )
+
+            # stream a big page, metadata being available as soon as they are received
+            search_stream = isogeo.search(page_size=100, include="all", stream=1)
+            for md in search_stream.results:
+                print(md.get("_id"))
+            print(search_stream.total)
         """
+        # stream mode is limited to one page without post-processing
+        if stream and (augment or tags_as_dicts or whole_results):
+            raise ValueError(
+                "'stream' option can't be combined with 'augment', 'tags_as_dicts' or "
+                "'whole_results' options."
+            )
+
+        # parse the query once: sub-searches reuse the same object
+        if not isinstance(query, SearchQuery):
+            query = SearchQuery.from_string(query or "")
+
         # handling request parameters
         payload = {
             "_id": checker._check_filter_specific_md(specific_md),
@@ -185,7 +226,7 @@ class ApiSearch:
             "rel": georel,
             "ob": order_by,
             "od": order_dir,
-            "q": query,
+            "q": query.raw,
             "s": share,
         }
 
@@ -241,10 +282,10 @@ class ApiSearch:
             # avoid to launch async searches if it's possible in one request
             if total_results <= 100:
                 logger.debug(
-                    "Paginated (size={}) search changed into a unique search because "
-                    "the total of metadata {} is less than the maximum size (100).".format(
-                        page_size, total_results
-                    )
+                    "Paginated (size=%s) search changed into a unique search because the total of "
+                    "metadata %s is less than the maximum size (100).",
+                    page_size,
+                    total_results,
                 )
                 return self.search(
                     # search context: application or group
@@ -258,6 +299,7 @@ class ApiSearch:
                     poly=poly,
                     # results
                     include=include,
+                    fields=fields,
                     # sorting
                     order_by=order_by,
                     order_dir=order_dir,
@@ -277,6 +319,7 @@ class ApiSearch:
                     # filters
                     "query": query,
                     "include": include,
+                    "fields": fields,
                     "share": share,
                     "specific_md": specific_md,
                     "bbox": bbox,
@@ -286,56 +329,58 @@ class ApiSearch:
                     "order_by": order_by,
                     "order_dir": order_dir,
                     # multilingualism
-                    "lang": lang
+                    "lang": lang,
+                    # storage
+                    "max_memory_results": max_memory_results,
                 }
 
-                # check loop state
-                if self.loop.is_closed():
-                    logger.debug(
-                        "Current event loop is already closed. Creating a new one..."
-                    )
-                    self.loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(self.loop)
-
-                # launch async searches
-                future_searches_concatenated = asyncio.ensure_future(
-                    self.search_metadata_asynchronous(
-                        total_results=total_results, **search_params
-                    ),
-                    loop=self.loop,
+                # launch paginated searches through the client scheduler
+                req_metadata_search = self.search_metadata_pages(
+                    total_results=total_results, **search_params
                 )
-                self.loop.run_until_complete(future_searches_concatenated)
-
-                # check results structure
-                req_metadata_search = future_searches_concatenated.result()
-
-                # properly close the loop
-                self.loop.close()
 
         # CASE - NO PAGINATION NEEDED
         elif page_size == 0 or not whole_results:
             logger.debug(
-                "Simple search with page parameters offset={} - page_size={}".format(
-                    offset, page_size
-                )
+                "Simple search with page parameters offset=%s - page_size=%s", offset, page_size
             )
 
-            # request
-            req_metadata_search = self.api_client.get(
-                url=url_resources_search,
-                headers=self.api_client.header,
-                params=payload,
-                proxies=self.api_client.proxies,
-                verify=self.api_client.ssl,
-                timeout=(5, 200),
-            )
-
-            # checking response
-            req_check = checker.check_api_response(req_metadata_search)
-            if isinstance(req_check, tuple):
-                return req_check
+            # cached response
+            search_cache = getattr(self.api_client, "_search_cache", None)
+            if search_cache is not None and not stream:
+                cache_key = self._search_cache_key(
+                    payload,
+                    group=group,
+                    lang=lang or self.utils.lang,
+                    fields=fields,
+                )
+                cache_generation = search_cache.generation
+                cached_search = search_cache.get(cache_key)
+            else:
+                cached_search = None
 
-            req_metadata_search = MetadataSearch(**req_metadata_search.json())
+            if cached_search is not None:
+                logger.debug("Search response retrieved from cache.")
+                req_metadata_search = MetadataSearch(**json.loads(cached_search))
+            else:
+                req_metadata_search = self._search_request(
+                    url_resources_search, payload, fields=fields, stream=stream
+                )
+                if stream or isinstance(req_metadata_search, tuple):
+                    return req_metadata_search
+                if search_cache is not None:
+                    # stored serialized: each hit gets its own copy
+                    search_cache.set(
+                        cache_key,
+                        json.dumps(
+                            {
+                                attr: getattr(req_metadata_search, attr)
+                                for attr in MetadataSearch.ATTR_TYPES
+                            },
+                            separators=(",", ":"),
+                        ),
+                        generation=cache_generation,
+                    )
 
         # add shares to tags and query
         if augment:
@@ -364,64 +409,377 @@ class ApiSearch:
         # end of method
         return req_metadata_search
 
+    async def search_async(self, *args, **kwargs) -> MetadataSearch:
+        """Coroutine version of :py:meth:`search`, with the same parameters, to be awaited from \
+        asynchronous code (web frameworks, Jupyter...) without blocking the running event loop.
+
+        The search is executed by the client scheduler (see \
+        :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`), so it counts against its concurrency \
+        cap. Pages of a `whole_results` search are then requested from the same worker.
+
+        :Example:
+
+        .. code-block:: python
+
+            async def handler():
+                search = await isogeo.search_async(query="type:dataset", whole_results=1)
+                return search.total
+
+        :rtype: MetadataSearch
+        """
+        return await asyncio.wrap_future(
+            self.api_client.scheduler.submit(self.search, *args, **kwargs)
+        )
+
+    def search_keyset(
+        self,
+        # application or group
+        group: str = None,
+        # semantic and objects filters
+        query: Union[str, SearchQuery] = "",
+        share: str = None,
+        specific_md: tuple = (),
+        # results model
+        include: tuple = (),
+        fields: tuple = (),
+        # geographic filters
+        bbox: tuple = None,
+        poly: str = None,
+        georel: str = None,
+        # sorting
+        order_by: str = "_modified",
+        order_dir: str = "asc",
+        # results size
+        page_size: int = 100,
+        # multilingualism
+        lang: str = None,
+        # specific options of implementation
+        check: bool = True,
+    ) -> MetadataSearch:
+        """Retrieve all the results of a search, page by page, consistently even if the catalog \
+        is edited meanwhile. Designed for big harvests, where offset pagination returns \
+        duplicates and misses metadata when records are created, edited or deleted during the \
+        harvest.
+
+        Results are sorted by metadata creation or last update date. Each page is requested from \
+        the last metadata received (the anchor): its date and the UUIDs of the metadata sharing \
+        it. If records moved before the anchor in the meantime, the page is requested again \
+        earlier. Results already received are skipped, so each metadata is returned once.
+
+        Parameters are the same as :py:meth:`search`, except for sorting and pagination. \
+        The `results` attribute of the returned search is an iterator, as with the `stream` \
+        option, pages being requested as results are consumed. Other attributes come from the \
+        first page.
+
+        :param str order_by: sorting field, one of: '_modified' [DEFAULT], '_created'.
+        :param str order_dir: sorting direction: 'asc' [DEFAULT] or 'desc'. In ascending order, \
+            metadata edited or created during the harvest are returned at the end.
+        :param int page_size: size of the requested pages, between 2 and 100 [DEFAULT].
+
+        :rtype: MetadataSearch
+
+        :Example:
+
+        .. code-block:: python
+
+            # harvest the whole catalog, even if it's being edited
+            harvest = isogeo.search_keyset(include=("contacts", "links"))
+            print(harvest.total)
+            for md in harvest.results:
+                print(md.get("_id"), md.get("_modified"))
+        """
+        if order_by not in _KEYSET_FIELDS:
+            raise ValueError(
+                "Keyset pagination is only available on: {}. Got: {}".format(
+                    ", ".join(_KEYSET_FIELDS), order_by
+                )
+            )
+        if not 1 < page_size <= 100:
+            raise ValueError("Page size must be between 2 and 100. Got: {}".format(page_size))
+
+        # keyset fields are required to paginate
+        if fields:
+            fields = tuple(fields) + tuple(f for f in ("_id", order_by) if f not in fields)
+
+        search_page = partial(
+            self.search,
+            # search context: application or group
+            group=group,
+            # filters
+            query=query,
+            share=share,
+            specific_md=specific_md,
+            bbox=bbox,
+            georel=georel,
+            poly=poly,
+            # results
+            include=include,
+            fields=fields,
+            # sorting
+            order_by=order_by,
+            order_dir=order_dir,
+            # options
+            page_size=page_size,
+            augment=0,
+            tags_as_dicts=0,
+            whole_results=0,
+            # multilingualism
+            lang=lang,
+        )
+
+        first_page = search_page(offset=0, check=check)
+        if isinstance(first_page, tuple):
+            return first_page
+
+        keyset_search = MetadataSearch(
+            envelope=first_page.envelope,
+            limit=first_page.total,
+            offset=0,
+            query=first_page.query,
+            tags=first_page.tags,
+            total=first_page.total,
+        )
+        keyset_search.results = self._iter_keyset(
+            partial(search_page, check=0),
+            first_page,
+            page_size=page_size,
+            order_by=order_by,
+            descending=str(order_dir).lower() == "desc",
+        )
+        return keyset_search
+
     # -- SEARCH SUB METHODS
+    def _search_request(
+        self, url: str, payload: dict, fields: tuple = (), stream: bool = False
+    ):
+        """Send a search request and parse its response. Private method used by :py:meth:`search`.
+
+        :param str url: search URL
+        :param dict payload: search parameters
+        :param tuple fields: fields to keep in results
+        :param bool stream: return results as an iterator
+
+        :rtype: MetadataSearch or tuple
+        """
+        # request
+        req_metadata_search = self.api_client.get(
+            url=url,
+            headers=self.api_client.header,
+            params=payload,
+            proxies=self.api_client.proxies,
+            stream=stream,
+            verify=self.api_client.ssl,
+            timeout=(5, 200),
+        )
+
+        # checking response
+        req_check = checker.check_api_response(req_metadata_search)
+        if isinstance(req_check, tuple):
+            req_metadata_search.close()
+            return req_check
+
+        if stream:
+            return self.search_stream_response(req_metadata_search, fields=fields)
+        elif fields:
+            # parse results one by one to prune them before the next one is decoded
+            req_metadata_search = self.search_stream_response(
+                req_metadata_search, fields=fields
+            )
+            req_metadata_search.results = list(req_metadata_search.results)
+            return req_metadata_search
+        else:
+            return MetadataSearch(**req_metadata_search.json())
+
+    @staticmethod
+    def _iter_keyset(
+        search_page, page: MetadataSearch, page_size: int, order_by: str, descending: bool
+    ):
+        """Yield the results of a keyset search. Private method used by :py:meth:`search_keyset`.
+
+        Pages overlap by one metadata: the next one starts at the last metadata of the previous \
+        one, which must still be found at or before the anchor. Otherwise (including when the \
+        page is empty), metadata have been moved or deleted before it and the page is requested \
+        again earlier, until the anchor is reached.
+
+        :param search_page: function requesting a page of results at the given offset
+        :param MetadataSearch page: first page of results
+        :param int page_size: size of the requested pages
+        :param str order_by: sorting field
+        :param bool descending: sorting direction
+        """
+        offset = 0
+        # last sorting value received and UUIDs of the metadata sharing it
+        anchor, ties = None, set()
+        seen = set()
+
+        def _before(value: str) -> bool:
+            return value > anchor if descending else value < anchor
+
+        def _reached(md: dict) -> bool:
+            """True if the metadata is at or before the anchor in the sort order."""
+            value = str(md.get(order_by) or "")
+            return _before(value) or (value == anchor and md.get("_id") in ties)
+
+        while True:
+            if isinstance(page, tuple):
+                raise IsogeoSdkError(
+                    "Keyset search interrupted at offset {}: {}".format(offset, page)
+                )
+            results = page.results
+            # the page must start at or before the anchor
+            if offset and not (results and _reached(results[0])):
+                if results or page.total is None:
+                    offset = max(0, offset - page_size + 1)
+                else:
+                    # past the end of the results: restart from the last one
+                    offset = max(0, min(offset - page_size + 1, page.total - 1))
+                logger.debug("Keyset page misses the anchor. Requested again at %s.", offset)
+                page = search_page(offset=offset)
+                continue
+
+            for md in results:
+                if anchor is not None and _reached(md):
+                    continue
+                value = str(md.get(order_by) or "")
+                md_id = md.get("_id")
+                # move the anchor forward
+                if value == anchor:
+                    ties.add(md_id)
+                else:
+                    anchor, ties = value, {md_id}
+                # metadata edited during the harvest are met again later
+                if md_id in seen:
+                    continue
+                seen.add(md_id)
+                yield md
+
+            if len(results) < page_size:
+                break
+            offset += len(results) - 1
+            page = search_page(offset=offset)
+
+    @staticmethod
+    def _search_cache_key(
+        payload: dict, group: str = None, lang: str = None, fields: tuple = ()
+    ) -> tuple:
+        """Build the key of a search in the responses cache. The query is normalized so that \
+        the order of its filters doesn't matter.
+
+        :param dict payload: search parameters
+        :param str group: workgroup UUID or None for application context
+        :param str lang: language of the response
+        :param tuple fields: fields kept in results
+
+        :rtype: tuple
+        """
+        return (
+            group,
+            lang,
+            tuple(fields or ()),
+            SearchQuery.from_string(payload.get("q") or "").normalized,
+            tuple(
+                (k, "" if v is None else str(v))
+                for k, v in sorted(payload.items())
+                if k != "q"
+            ),
+        )
+
     async def search_metadata_asynchronous(
-        self, total_results: int, max_workers: int = 10, **kwargs
+        self, total_results: int, **kwargs
     ) -> MetadataSearch:
-        """Meta async method used to request big searches (> 100 results), using asyncio. It's a
+        """Deprecated coroutine version of :py:meth:`search_metadata_pages`.
+
+        :param int total_results: total of results to retrieve
+
+        :rtype: MetadataSearch
+        """
+        logger.warning(
+            DeprecationWarning(
+                "'search_metadata_asynchronous' is deprecated. "
+                "Use 'search_metadata_pages' or 'search_async' instead."
+            )
+        )
+        return await asyncio.wrap_future(
+            self.api_client.scheduler.submit(
+                self.search_metadata_pages, total_results, **kwargs
+            )
+        )
+
+    def search_metadata_pages(self, total_results: int, **kwargs) -> MetadataSearch:
+        """Meta method used to request big searches (> 100 results), page by page. It's a \
         private method launched by the main search method.
 
+        Pages are requested through the client scheduler (see \
+        :class:`~isogeo_pysdk.scheduler.IsogeoScheduler`) which caps the concurrency. No event \
+        loop is used, so it can be called from a running one (Jupyter, web frameworks...).
+
+        Pages are merged in order as soon as they are received, so they can be released (or \
+        spilled to disk if `max_memory_results` is passed in kwargs) without waiting for the others.
+
         :param int total_results: total of results to retrieve
-        :param int max_workers: maximum number of thread to use :class:`python.concurrent.futures`
 
         :rtype: MetadataSearch
         """
-        # prepare async searches
+        # prepare paginated searches
         total_pages = self.utils.pages_counter(total_results, page_size=100)
         li_offsets = [offset * 100 for offset in range(0, total_pages)]
-        logger.debug("Async search launched with {} pages.".format(total_pages))
-
-        with ThreadPoolExecutor(
-            max_workers=max_workers, thread_name_prefix="IsogeoSearch"
-        ) as executor:
-            self.loop = asyncio.get_event_loop()
-            tasks = [
-                self.loop.run_in_executor(
-                    executor,
-                    partial(
-                        self.search,
-                        # search context: application or group
-                        group=kwargs.get("group"),
-                        # filters
-                        query=kwargs.get("query"),
-                        include=kwargs.get("include"),
-                        share=kwargs.get("share"),
-                        specific_md=kwargs.get("specific_md"),
-                        bbox=kwargs.get("bbox"),
-                        poly=kwargs.get("poly"),
-                        georel=kwargs.get("georel"),
-                        # sorting
-                        order_by=kwargs.get("order_by"),
-                        order_dir=kwargs.get("order_dir"),
-                        # pagination
-                        offset=offset,
-                        page_size=100,
-                        # options
-                        augment=0,
-                        check=0,
-                        expected_total=total_results,
-                        tags_as_dicts=0,
-                        whole_results=0,
-                        # multilingualism
-                        lang=kwargs.get("lang")
-                    ),
-                )
-                for offset in li_offsets
-            ]
+        logger.debug("Paginated search launched with %s pages.", total_pages)
+
+        # pages are background traffic unless the caller chose a priority
+        with priority(current_priority() or "batch"):
+            futures = {
+                self.api_client.scheduler.submit(
+                    self.search,
+                    # search context: application or group
+                    group=kwargs.get("group"),
+                    # filters
+                    query=kwargs.get("query"),
+                    include=kwargs.get("include"),
+                    fields=kwargs.get("fields"),
+                    share=kwargs.get("share"),
+                    specific_md=kwargs.get("specific_md"),
+                    bbox=kwargs.get("bbox"),
+                    poly=kwargs.get("poly"),
+                    georel=kwargs.get("georel"),
+                    # sorting
+                    order_by=kwargs.get("order_by"),
+                    order_dir=kwargs.get("order_dir"),
+                    # pagination
+                    offset=offset,
+                    page_size=100,
+                    # options
+                    augment=0,
+                    check=0,
+                    expected_total=total_results,
+                    tags_as_dicts=0,
+                    whole_results=0,
+                    # multilingualism
+                    lang=kwargs.get("lang"),
+                ): page_index
+                for page_index, offset in enumerate(li_offsets)
+            }
 
-            # store responses in a fresh Metadata Search object
-            final_search = MetadataSearch(results=[], query={}, tags={})
-            for response in await asyncio.gather(*tasks):
+        # store responses in a fresh Metadata Search object, page by page in order
+        final_search = MetadataSearch(results=[], query={}, tags={})
+        max_memory_results = kwargs.get("max_memory_results")
+        pages_done = {}
+        next_page = 0
+        for page_done in as_completed(futures):
+            # from here, each page is only referenced until it's merged
+            pages_done[futures.pop(page_done)] = page_done.result()
+            while next_page in pages_done:
+                response = pages_done.pop(next_page)
+                next_page += 1
+                # spill results to disk above the threshold
+                if (
+                    max_memory_results is not None
+                    and isinstance(final_search.results, list)
+                    and len(final_search.results) + len(response.results)
+                    > max_memory_results
+                ):
+                    disk_results = IsogeoDiskResults()
+                    disk_results.extend(final_search.results)
+                    final_search.results = disk_results
                 final_search.envelope = response.envelope
                 final_search.limit = response.total
                 final_search.offset = 0
@@ -430,7 +788,53 @@ class ApiSearch:
                 final_search.tags.update(response.tags)
                 final_search.total = response.total
 
-            return final_search
+        return final_search
+
+    def search_stream_response(self, response, fields: tuple = ()) -> MetadataSearch:
+        """Wrap a streamed search response into a MetadataSearch whose results are parsed on the
+        fly. The response is read until the beginning of the results, so the attributes sent
+        before them are available right away. It's a private method launched by the main search
+        method.
+
+        :param requests.models.Response response: search response opened with `stream=True`
+        :param tuple fields: paths of the results fields to keep. See: :py:meth:`~isogeo_pysdk.utils.IsogeoUtils.project_fields`.
+
+        :rtype: MetadataSearch
+        """
+        search = MetadataSearch(query={}, tags={})
+
+        def _set_attribute(key: str, value):
+            if key in MetadataSearch.ATTR_TYPES:
+                setattr(search, key, value)
+            else:
+                logger.debug("Unexpected search attribute ignored: %s", key)
+
+        parser = IsogeoStreamParser(
+            array_key="results",
+            on_member=_set_attribute,
+            item_hook=partial(self.utils.project_fields, fields=fields) if fields else None,
+        )
+        chunks = response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+
+        # read the response until the results array is reached
+        first_items = deque()
+        for chunk in chunks:
+            first_items.extend(parser.feed(chunk))
+            if parser.array_started:
+                break
+
+        def _iter_results():
+            try:
+                while first_items:
+                    yield first_items.popleft()
+                for chunk in chunks:
+                    yield from parser.feed(chunk)
+                yield from parser.close()
+            finally:
+                response.close()
+
+        search.results = _iter_results()
+        return search
 
     # -- UTILITIES -----------------------------------------------------------
     def add_tags_shares(self, search: MetadataSearch):
@@ -166,9 +166,7 @@ class ApiService:
                 )
                 return (False, req_check_reachable)
         else:
-            logger.debug(
-                "{} successed. Service {} is reachable.".format(http_verb, service_url)
-            )
+            logger.debug("%s successed. Service %s is reachable.", http_verb, service_url)
             pass
 
         # -- SERVICE URL
@@ -179,17 +177,13 @@ class ApiService:
         # get the base url cleaned
         url_clean = urlunparse(url_parsed._replace(query=None))
         logger.debug(
-            "Service URL has been cleaned: {} from query parameters {}".format(
-                url_clean, url_query
-            )
+            "Service URL has been cleaned: %s from query parameters %s", url_clean, url_query
         )
 
         # -- SERVICE TYPE
         if service_type == "guess":
             logger.debug(
-                "Let's try to guess the service type from the URL path: {}".format(
-                    url_parsed.path
-                )
+                "Let's try to guess the service type from the URL path: %s", url_parsed.path
             )
             if "FeatureServer" in url_parsed.path:
                 service_type = "esri"
@@ -200,7 +194,7 @@ class ApiService:
             else:
                 service_type = "ogc"
                 pass
-            logger.debug("Service type guessed: {}".format(service_type))
+            logger.debug("Service type guessed: %s", service_type)
         else:
             pass
 
@@ -216,9 +210,7 @@ class ApiService:
                 elif "service" in set(k.lower() for k in url_query):
                     service_format = url_query.get("service")[0].lower()
                     logger.debug(
-                        "Service format extracted from the query parameters: {}".format(
-                            service_format
-                        )
+                        "Service format extracted from the query parameters: %s", service_format
                     )
                 else:
                     raise Exception(
@@ -364,9 +356,8 @@ class ApiService:
             patch_srv = self.api_client.metadata.update(service)
         else:
             logger.info(
-                "Service has {} layers associated with datasets. Updating metadata with precaution.".format(
-                    len(li_associated_layers)
-                )
+                "Service has %s layers associated with datasets. Updating metadata with precaution.",
+                len(li_associated_layers),
             )
             # patch
             patch_srv = self.api_client.metadata.update(service)
@@ -387,9 +387,11 @@ class ApiServiceLayer:
             if req_check[1] == 409:
                 # log conflict
                 logger.info(
-                    "Layer is already associated with a dataset: '{}'. Isogeo API doesn't allow to create duplicates (HTTP {} - {}).".format(
-                        layer.name, req_check[1], req_layer_association.reason
-                    )
+                    "Layer is already associated with a dataset: '%s'. Isogeo API doesn't allow to "
+                    "create duplicates (HTTP %s - %s).",
+                    layer.name,
+                    req_check[1],
+                    req_layer_association.reason,
                 )
             else:
                 # if other error, then return it
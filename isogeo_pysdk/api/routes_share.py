@@ -60,7 +60,7 @@ class ApiShare:
         """
         # URL
         if workgroup_id is not None:
-            logger.debug("Listing shares for a workgroup: {}".format(workgroup_id))
+            logger.debug("Listing shares for a workgroup: %s", workgroup_id)
             if not checker.check_is_uuid(workgroup_id):
                 raise ValueError("Workgroup ID is not a correct UUID.")
             else:
@@ -159,9 +159,8 @@ class ApiShare:
             # check
             if share.name in self.api_client._wg_shares:
                 logger.debug(
-                    "Share with the same name already exists: {}. Use 'share_update' instead.".format(
-                        share.name
-                    )
+                    "Share with the same name already exists: %s. Use 'share_update' instead.",
+                    share.name,
                 )
                 return False
         else:
@@ -173,9 +173,9 @@ class ApiSpecification:
             # check
             if specification.name in self.api_client._wg_specifications_names:
                 logger.debug(
-                    "Specification with the same name already exists: {}. Use 'specification_update' instead.".format(
-                        specification.name
-                    )
+                    "Specification with the same name already exists: %s. Use "
+                    "'specification_update' instead.",
+                    specification.name,
                 )
                 return False
         else:
@@ -351,9 +351,7 @@ class ApiUser:
         # compare subscription status with required update
         if user_subscription.get("isInterested") == subscribe:
             logger.debug(
-                "Subscription '{}' has already the required value: {}".format(
-                    subscription, subscribe
-                )
+                "Subscription '%s' has already the required value: %s", subscription, subscribe
             )
             return user
         else:
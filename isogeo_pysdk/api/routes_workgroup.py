@@ -195,9 +195,9 @@ class ApiWorkgroup:
             # check
             if workgroup.contact.name in self.api_client._workgroups_names:
                 logger.debug(
-                    "Workgroup with the same name already exists: {}. Use 'workgroup_update' instead.".format(
-                        workgroup.contact.name
-                    )
+                    "Workgroup with the same name already exists: %s. Use 'workgroup_update' "
+                    "instead.",
+                    workgroup.contact.name,
                 )
                 return False
         else:
@@ -3,23 +3,126 @@
 
 """Complementary set of hooks to use with Isogeo API."""
 
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from bisect import bisect_left
+
+# submodules
+from isogeo_pysdk.utils import IsogeoUtils
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# upper bounds of the latency histograms buckets, in seconds
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def _escape_label(value) -> str:
+    """Escape a label value for Prometheus text format.
+
+    :param value: label value
+    """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
 # ##############################################################################
 # ########## Classes ###############
 # ##################################
 
 
+class _RouteMetrics(object):
+    """Counters of the requests sent to a route."""
+
+    __slots__ = (
+        "bytes_decoded",
+        "bytes_received",
+        "bytes_sent",
+        "latency_buckets",
+        "latency_sum",
+        "requests",
+        "responses_read",
+        "retries",
+        "statuses",
+        "wait_count",
+        "wait_sum",
+    )
+
+    def __init__(self):
+        self.bytes_decoded = 0
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # last one is +Inf
+        self.latency_sum = 0.0
+        self.requests = 0
+        self.responses_read = 0
+        self.retries = 0
+        self.statuses = {}
+        self.wait_count = 0
+        self.wait_sum = 0.0
+
+    def to_dict(self) -> dict:
+        cumulated, buckets = 0, {}
+        for upper, count in zip(LATENCY_BUCKETS + (float("inf"),), self.latency_buckets):
+            cumulated += count
+            buckets[upper] = cumulated
+        return {
+            "requests": self.requests,
+            "statuses": dict(self.statuses),
+            "errors": sum(n for status, n in self.statuses.items() if status >= 400),
+            "latency": {
+                "count": self.requests,
+                "sum": self.latency_sum,
+                "mean": self.latency_sum / self.requests if self.requests else None,
+                "buckets": buckets,
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "bytes_decoded": self.bytes_decoded,
+            "retries": self.retries,
+            "wait": {"count": self.wait_count, "sum": self.wait_sum},
+        }
+
+
 class IsogeoHooks(object):
     """Custom requests event hooks for Isogeo API.
 
     Requests has a hook system that you can use to manipulate portions of the request process,\
         or signal event handling. This module is a set of custom hooks to handle Isogeo API responses.
 
-        WIP
+    It's also the metrics surface of the client: :class:`~isogeo_pysdk.isogeo.Isogeo` registers \
+    :py:meth:`track_response` on its session and reports retries, limiter waits and token \
+    refreshes, grouped by route template (e.g. `resources/{id}`). Metrics are exposed as a \
+    dict (:py:attr:`stats`) or in Prometheus text format (:py:meth:`to_prometheus`).
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo.search(whole_results=1)
+        # in-process
+        print(isogeo.custom_hooks.stats["routes"]["resources/search"]["latency"]["mean"])
+        # Prometheus scrape endpoint
+        body = isogeo.custom_hooks.to_prometheus()
     """
 
     def __init__(self):
         """Instanciate IsogeoHooks module."""
         super(IsogeoHooks, self).__init__()
+        self._lock = threading.Lock()
+        self._routes = {}  # metrics by route template
+        self.token_refreshes = 0
 
     def check_for_error(self, resp, *args, **kwargs):
         resp.raise_for_status()
@@ -38,6 +141,268 @@ class IsogeoHooks(object):
         # return dumped dict (--> bytes)
         # resp.content = json.dumps(request_content).encode('utf-8')
 
+    def _route(self, url: str) -> _RouteMetrics:
+        """Returns the metrics of the route of an URL. Lock must be held.
+
+        :param str url: requested URL
+        """
+        route = IsogeoUtils.route_template(url or "")
+        metrics = self._routes.get(route)
+        if metrics is None:
+            metrics = self._routes[route] = _RouteMetrics()
+        return metrics
+
+    # -- RECORDING ------------------------------------------------------------
+    def track_response(self, resp, *args, **kwargs):
+        """Record the status code, the latency (time to response headers), the request body \
+        size and the response bytes (see :py:meth:`track_transfer`) of a response.
+
+        Registered on the session response hooks by :class:`~isogeo_pysdk.isogeo.Isogeo`.
+
+        :param requests.models.Response resp: response to track
+        """
+        body = resp.request.body if resp.request is not None else None
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        sent = len(body) if isinstance(body, bytes) else 0
+        latency = resp.elapsed.total_seconds()
+        with self._lock:
+            metrics = self._route(resp.url)
+            metrics.requests += 1
+            status = resp.status_code
+            metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+            metrics.latency_sum += latency
+            metrics.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+            metrics.bytes_sent += sent
+        self.track_transfer(resp, *args, **kwargs)
+
+    def track_transfer(self, resp, *args, **kwargs):
+        """Record the bytes of the response body, as received over the network (wire) and once \
+        decoded (decompressed), by route. Streamed responses are recorded once entirely read.
+
+        :param requests.models.Response resp: response to track
+        """
+        if resp._content_consumed:
+            # content already read by the transport adapter
+            self._record_transfer(resp, len(resp.content or b""))
+            return
+
+        iter_content = resp.iter_content
+
+        def counting_chunks(chunks):
+            decoded = 0
+            for chunk in chunks:
+                decoded += len(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+                yield chunk
+            self._record_transfer(resp, decoded)
+
+        def counting_iter_content(*args, **kwargs):
+            chunks = iter_content(*args, **kwargs)
+            if resp._content_consumed:
+                # body already read, so recorded: chunks are sliced from `content`
+                return chunks
+            return counting_chunks(chunks)
+
+        # shadow the method on this response only: also used to read `content`
+        resp.iter_content = counting_iter_content
+
+    def _record_transfer(self, resp, decoded: int):
+        """Add the bytes of a response to its route counters.
+
+        :param requests.models.Response resp: response read
+        :param int decoded: count of decoded bytes
+        """
+        tell = getattr(resp.raw, "tell", None)
+        try:
+            wire = tell() if callable(tell) else decoded
+        except (OSError, ValueError):
+            wire = decoded
+        with self._lock:
+            metrics = self._route(resp.url)
+            metrics.responses_read += 1
+            metrics.bytes_received += wire
+            metrics.bytes_decoded += decoded
+        logger.debug(
+            "%s: %s bytes received, %s decoded (Content-Encoding: %s).",
+            resp.url,
+            wire,
+            decoded,
+            resp.headers.get("Content-Encoding", "identity"),
+        )
+
+    def record_retry(self, url: str):
+        """Count a retry of a request.
+
+        :param str url: requested URL
+        """
+        with self._lock:
+            self._route(url).retries += 1
+
+    def record_wait(self, url: str, seconds: float):
+        """Record the time a request waited for a slot of the client concurrency limiter, \
+        before a pooled connection is checked out.
+
+        :param str url: requested URL
+        :param float seconds: waiting time
+        """
+        with self._lock:
+            metrics = self._route(url)
+            metrics.wait_count += 1
+            metrics.wait_sum += seconds
+
+    def record_token_refresh(self):
+        """Count a renewal of the API token."""
+        with self._lock:
+            self.token_refreshes += 1
+
+    def reset(self):
+        """Reset all the metrics."""
+        with self._lock:
+            self._routes.clear()
+            self.token_refreshes = 0
+
+    # -- EXPORTERS ------------------------------------------------------------
+    @property
+    def stats(self) -> dict:
+        """Snapshot of the metrics: by route template, count of requests, status codes, \
+        latency histogram (cumulative buckets by upper bound in seconds), bytes sent, \
+        received and decoded, retries and limiter waits; and count of token refreshes.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "routes": {
+                    route: metrics.to_dict() for route, metrics in self._routes.items()
+                },
+                "token_refreshes": self.token_refreshes,
+            }
+
+    @property
+    def transfers(self) -> dict:
+        """Bytes received by route: count of responses, bytes over the network (`wire`), \
+        decoded bytes (`decoded`) and compression `ratio` (wire / decoded).
+
+        :rtype: dict
+
+        :Example:
+
+        .. code-block:: python
+
+            >>> isogeo.search(whole_results=1)
+            >>> isogeo.custom_hooks.transfers
+            {'resources/search': {'responses': 3, 'wire': 251463, 'decoded': 2146728, 'ratio': 0.12}}
+        """
+        with self._lock:
+            return {
+                route: {
+                    "responses": metrics.responses_read,
+                    "wire": metrics.bytes_received,
+                    "decoded": metrics.bytes_decoded,
+                    "ratio": round(metrics.bytes_received / metrics.bytes_decoded, 2)
+                    if metrics.bytes_decoded
+                    else None,
+                }
+                for route, metrics in self._routes.items()
+                if metrics.responses_read
+            }
+
+    def to_prometheus(self, prefix: str = "isogeo_sdk") -> str:
+        """Export the metrics in Prometheus text exposition format.
+
+        :param str prefix: prefix of the metrics names
+
+        :rtype: str
+
+        :Example:
+
+        .. code-block:: python
+
+            # serve the metrics with the standard library
+            from wsgiref.simple_server import make_server
+
+            def metrics_app(environ, start_response):
+                start_response("200 OK", [("Content-Type", "text/plain; version=0.0.4")])
+                return [isogeo.custom_hooks.to_prometheus().encode("utf-8")]
+
+            make_server("", 9100, metrics_app).serve_forever()
+        """
+        stats = self.stats
+        routes = sorted(stats.get("routes").items())
+        lines = []
+
+        def metric(name: str, kind: str, doc: str):
+            lines.append("# HELP {}_{} {}".format(prefix, name, doc))
+            lines.append("# TYPE {}_{} {}".format(prefix, name, kind))
+
+        def sample(name: str, value, **labels):
+            labels = ",".join(
+                '{}="{}"'.format(k, _escape_label(v)) for k, v in labels.items()
+            )
+            lines.append(
+                "{}_{}{} {}".format(prefix, name, "{" + labels + "}" if labels else "", value)
+            )
+
+        metric(
+            "request_duration_seconds",
+            "histogram",
+            "Time to receive the response headers of Isogeo API.",
+        )
+        for route, values in routes:
+            latency = values.get("latency")
+            for upper, count in latency.get("buckets").items():
+                le = "+Inf" if upper == float("inf") else repr(upper)
+                sample("request_duration_seconds_bucket", count, route=route, le=le)
+            sample("request_duration_seconds_sum", latency.get("sum"), route=route)
+            sample("request_duration_seconds_count", latency.get("count"), route=route)
+
+        metric("responses_total", "counter", "Responses received by status code.")
+        for route, values in routes:
+            for status, count in sorted(values.get("statuses").items()):
+                sample("responses_total", count, route=route, status=status)
+
+        metric("request_bytes_total", "counter", "Bytes of the request bodies sent.")
+        for route, values in routes:
+            sample("request_bytes_total", values.get("bytes_sent"), route=route)
+
+        metric(
+            "response_bytes_total",
+            "counter",
+            "Bytes of the response bodies, over the network (wire) and decoded.",
+        )
+        for route, values in routes:
+            sample(
+                "response_bytes_total",
+                values.get("bytes_received"),
+                route=route,
+                encoding="wire",
+            )
+            sample(
+                "response_bytes_total",
+                values.get("bytes_decoded"),
+                route=route,
+                encoding="decoded",
+            )
+
+        metric("retries_total", "counter", "Requests retried.")
+        for route, values in routes:
+            sample("retries_total", values.get("retries"), route=route)
+
+        metric(
+            "limiter_wait_seconds",
+            "summary",
+            "Time spent waiting for a slot of the concurrency limiter.",
+        )
+        for route, values in routes:
+            wait = values.get("wait")
+            sample("limiter_wait_seconds_sum", wait.get("sum"), route=route)
+            sample("limiter_wait_seconds_count", wait.get("count"), route=route)
+
+        metric("token_refreshes_total", "counter", "API token renewals.")
+        sample("token_refreshes_total", stats.get("token_refreshes"))
+
+        return "\n".join(lines) + "\n"
+
 
 # #############################################################################
 # ##### Stand alone program ########
@@ -45,4 +410,5 @@ class IsogeoHooks(object):
 if __name__ == "__main__":
     """Standalone execution."""
     hooks = IsogeoHooks()
-    print(hooks)
+    hooks.record_retry("https://v1.api.isogeo.com/resources/search")
+    print(hooks.to_prometheus())
@@ -0,0 +1,309 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Request budgets: count the requests sent within a block, enforce limits and detect \
+request storms (repeated identical requests, N+1 patterns)."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from contextvars import ContextVar
+
+# submodules
+from isogeo_pysdk.exceptions import RequestBudgetExceededError
+from isogeo_pysdk.utils import IsogeoUtils
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# budgets active in the current context, innermost last. Context variables are copied to
+# the scheduler workers so the pages of a search are counted in the budget of the search.
+_budgets = ContextVar("isogeo_request_budgets", default=())
+
+# batch alternatives to per-item requests, by method and route template
+BATCH_ALTERNATIVES = {
+    ("GET", "resources/{id}"): "isogeo.search(specific_md=[...], include=[...]) retrieves "
+    "several metadata in one request",
+    ("GET", "resources/{id}/keywords"): "isogeo.search(specific_md=[...], include=['keywords']) "
+    "retrieves the keywords of several metadata in one request",
+    ("GET", "contacts/{id}"): "list the workgroup contacts once with "
+    "isogeo.contact.listing(workgroup_id) and look them up locally",
+    ("GET", "keywords/{id}"): "search keywords once with isogeo.keyword.thesaurus() or "
+    "isogeo.keyword.workgroup() and look them up locally",
+    ("POST", "resources/{id}/keywords/{id}"): "prepare the associations with "
+    "isogeo.metadata.bulk.prepare(action='add', target='keywords', ...) and send them at once",
+    ("DELETE", "resources/{id}/keywords/{id}"): "prepare the dissociations with "
+    "isogeo.metadata.bulk.prepare(action='delete', target='keywords', ...) and send them at once",
+    ("POST", "resources/{id}/contacts/{id}"): "prepare the associations with "
+    "isogeo.metadata.bulk.prepare(action='add', target='contacts', ...) and send them at once",
+    ("POST", "resources/{id}/catalogs/{id}"): "prepare the associations with "
+    "isogeo.metadata.bulk.prepare(action='add', target='catalogs', ...) and send them at once",
+    ("PUT", "resources/{id}"): "prepare the updates with isogeo.metadata.bulk.prepare(action="
+    "'update', ...) and send them at once",
+}
+
+# alternatives to repeated identical requests, by method and route template
+_SEARCH_CACHE = "enable the search responses cache with Isogeo(search_cache_size=...)"
+REPEAT_ALTERNATIVES = {
+    ("GET", "resources/search"): _SEARCH_CACHE,
+    ("GET", "groups/{id}/resources/search"): _SEARCH_CACHE,
+    ("GET", "shares"): "isogeo.share.listing(caching=1) keeps the shares on the client",
+    ("GET", "groups/{id}/shares"): "isogeo.share.listing(caching=1) keeps the shares on the "
+    "client",
+    ("GET", "groups/{id}/catalogs"): "isogeo.catalog.listing(caching=1) keeps the workgroup "
+    "catalogs on the client",
+    ("GET", "groups/{id}/contacts"): "isogeo.contact.listing(caching=1) keeps the workgroup "
+    "contacts on the client",
+    ("GET", "groups/{id}/data-sources"): "isogeo.datasource.listing(caching=1) keeps the "
+    "workgroup datasources on the client",
+    ("GET", "groups/{id}/licenses"): "isogeo.license.listing(caching=1) keeps the workgroup "
+    "licenses on the client",
+    ("GET", "groups/{id}/specifications"): "isogeo.specification.listing(caching=1) keeps the "
+    "workgroup specifications on the client",
+    ("GET", "coordinate-systems"): "isogeo.coordinate_system.listing(caching=1) keeps the "
+    "coordinate systems on the client",
+    ("GET", "groups/{id}/coordinate-systems"): "isogeo.coordinate_system.listing(caching=1) "
+    "keeps the workgroup coordinate systems on the client",
+    ("GET", "formats"): "isogeo.formats.listing(caching=1) keeps the formats on the client",
+    ("GET", "directives"): "isogeo.directive.listing(caching=1) keeps the directives on the "
+    "client",
+}
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def record_request(method: str, url: str, params=None):
+    """Count a request in the budgets of the current context. Called by \
+    :class:`~isogeo_pysdk.isogeo.Isogeo` for each request sent to the API.
+
+    :param str method: HTTP method
+    :param str url: requested URL
+    :param params: query parameters
+
+    :raises RequestBudgetExceededError: if a budget is exceeded
+    """
+    budgets = _budgets.get()
+    if not budgets:
+        return
+    route = IsogeoUtils.route_template(url)
+    for budget in budgets:
+        budget.record(method.upper(), route, url, params)
+
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoRequestBudget(object):
+    """Context manager counting the requests sent to the API within a block, by route \
+    template (e.g. `GET resources/{id}`), including the ones sent by scheduler workers \
+    (pages of whole_results searches...).
+
+    When the block ends, request storms are reported as warnings:
+
+    - identical requests sent `repeat_threshold` times or more;
+    - N+1 patterns: a route requested for `n_plus_one_threshold` different items or more, \
+        typically per-item requests inside a loop. A batch alternative is suggested when \
+        the SDK has one.
+
+    Budgets can be nested: requests are counted in all the active ones.
+
+    :param int max_requests: maximum count of requests. Unlimited if None.
+    :param dict per_route: maximum count of requests by route template, optionally \
+        prefixed by the method: `{"GET resources/{id}": 1, "groups/{id}/contacts": 2}`
+    :param int repeat_threshold: count of identical requests reported as repeated
+    :param int n_plus_one_threshold: count of items requested one by one on the same route \
+        reported as an N+1 pattern
+    :param str name: name of the budget, used in messages
+
+    :raises RequestBudgetExceededError: when a request exceeds the budget. It's raised \
+        before the request is sent.
+
+    :Example:
+
+    .. code-block:: python
+
+        # in tests: fail if an operation sends more requests than expected
+        with IsogeoRequestBudget(max_requests=3, per_route={"GET groups/{id}/contacts": 1}):
+            isogeo.contact.create(workgroup_id, contact, check_exists=1)
+
+        # in scripts: look for request storms
+        with isogeo.request_budget(name="tagging") as budget:
+            for md in mds:
+                isogeo.keyword.tagging(metadata=md, keyword=kw, check_exists=1)
+        print(budget.counts, budget.findings)
+    """
+
+    def __init__(
+        self,
+        max_requests: int = None,
+        per_route: dict = None,
+        repeat_threshold: int = 3,
+        n_plus_one_threshold: int = 10,
+        name: str = "requests",
+    ):
+        """Instanciate the budget."""
+        self.max_requests = max_requests
+        self.per_route = dict(per_route or {})
+        self.repeat_threshold = repeat_threshold
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.name = name
+
+        self.total = 0
+        self._counts = {}  # requests by (method, route)
+        self._route_counts = {}  # requests by route, all methods
+        self._items = {}  # distinct URLs by (method, route)
+        self._identical = {}  # requests by (method, url, params)
+        self._lock = threading.Lock()
+        self._token = None
+
+    def __repr__(self) -> str:
+        return "<IsogeoRequestBudget '{}': {} requests{}>".format(
+            self.name,
+            self.total,
+            "" if self.max_requests is None else " / {}".format(self.max_requests),
+        )
+
+    def __enter__(self):
+        self._token = _budgets.set(_budgets.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _budgets.reset(self._token)
+        self._token = None
+        for finding in self.findings:
+            logger.warning("Budget '%s': %s", self.name, finding)
+        return False
+
+    # -- COUNTING -------------------------------------------------------------
+    def record(self, method: str, route: str, url: str, params=None):
+        """Count a request.
+
+        :param str method: HTTP method
+        :param str route: route template of the URL
+        :param str url: requested URL
+        :param params: query parameters
+
+        :raises RequestBudgetExceededError: if the request exceeds the budget
+        """
+        key = (method, route)
+        if isinstance(params, dict):
+            params = sorted((k, str(v)) for k, v in params.items())
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            route_count = self._route_counts.get(route, 0) + 1
+            if self.max_requests is not None and self.total >= self.max_requests:
+                raise RequestBudgetExceededError(
+                    "Budget '{}' exceeded: more than {} requests, at {} {} ({}).".format(
+                        self.name, self.max_requests, method, route, self._top_routes()
+                    )
+                )
+            for limited, current in (
+                ("{} {}".format(method, route), count),
+                (route, route_count),
+            ):
+                limit = self.per_route.get(limited)
+                if limit is not None and current > limit:
+                    raise RequestBudgetExceededError(
+                        "Budget '{}' exceeded: more than {} requests to {}.".format(
+                            self.name, limit, limited
+                        )
+                    )
+            self.total += 1
+            self._counts[key] = count
+            self._route_counts[route] = route_count
+            self._items.setdefault(key, set()).add(url.split("?")[0])
+            identical = (method, url, str(params))
+            self._identical[identical] = self._identical.get(identical, 0) + 1
+
+    def _top_routes(self, top: int = 3) -> str:
+        """Describe the most requested routes, for messages. Lock must be held."""
+        routes = sorted(self._counts.items(), key=lambda i: i[1], reverse=True)[:top]
+        return "most requested: " + ", ".join(
+            "{} {} x{}".format(method, route, count) for (method, route), count in routes
+        )
+
+    # -- REPORTING ------------------------------------------------------------
+    @property
+    def counts(self) -> dict:
+        """Count of requests by method and route template: `{"GET resources/{id}": 12}`.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "{} {}".format(method, route): count
+                for (method, route), count in self._counts.items()
+            }
+
+    @property
+    def findings(self) -> list:
+        """Request storms detected: repeated identical requests and N+1 patterns, with an \
+        alternative (cache or batch route) when there is one.
+
+        :rtype: list
+        """
+        findings = []
+        with self._lock:
+            for (method, url, params), count in self._identical.items():
+                if count >= self.repeat_threshold:
+                    route = IsogeoUtils.route_template(url)
+                    alternative = REPEAT_ALTERNATIVES.get(
+                        (method, route), BATCH_ALTERNATIVES.get((method, route))
+                    )
+                    findings.append(
+                        "{} identical requests {} {}: reuse the first response{}.".format(
+                            count,
+                            method,
+                            url.split("?")[0],
+                            ". {}".format(alternative) if alternative else "",
+                        )
+                    )
+            for (method, route), items in self._items.items():
+                if len(items) >= self.n_plus_one_threshold:
+                    findings.append(
+                        "N+1 pattern: {} {} requested for {} different items. {}.".format(
+                            method,
+                            route,
+                            len(items),
+                            BATCH_ALTERNATIVES.get(
+                                (method, route),
+                                "Look for a route handling several items at once",
+                            ),
+                        )
+                    )
+        return findings
+
+    def report(self) -> str:
+        """Text report of the requests counted and of the findings.
+
+        :rtype: str
+        """
+        lines = [repr(self)]
+        lines.extend(
+            "  {:>5}  {}".format(count, route)
+            for route, count in sorted(self.counts.items(), key=lambda i: -i[1])
+        )
+        lines.extend("  ! {}".format(finding) for finding in self.findings)
+        return "\n".join(lines)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    with IsogeoRequestBudget(n_plus_one_threshold=3) as budget:
+        for i in range(5):
+            record_request("GET", "https://v1.api.isogeo.com/resources/{:032x}".format(i))
+    print(budget.report())
@@ -0,0 +1,125 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""In-memory cache with size and age limits, used to store responses of the API."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from collections import OrderedDict
+from time import monotonic
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoCache(object):
+    """Thread-safe LRU cache whose entries expire after a time to live.
+
+    Each :py:meth:`clear` increments a generation counter. Pass the generation read before \
+    sending a request to :py:meth:`set` so that a response received after an invalidation is \
+    not stored.
+
+    :param int maxsize: maximum count of entries. The least recently used is dropped when full.
+    :param float ttl: time to live of entries, in seconds
+
+    :Example:
+
+    .. code-block:: python
+
+        cache = IsogeoCache(maxsize=64, ttl=300)
+        generation = cache.generation
+        value = cache.get("key")
+        if value is None:
+            value = compute()
+            cache.set("key", value, generation=generation)
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300):
+        """Instanciate the cache."""
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer, not {}".format(maxsize))
+        if ttl <= 0:
+            raise ValueError("'ttl' must be a positive number, not {}".format(ttl))
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # key: (expiration time, value)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return "<IsogeoCache: {}/{} entries, ttl={}s, hits={}, misses={}>".format(
+            len(self), self.maxsize, self.ttl, self.hits, self.misses
+        )
+
+    def get(self, key, default=None):
+        """Returns the value stored for the key or default if it's missing or expired.
+
+        :param key: hashable key
+        :param default: value to return in case of miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[0] < monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, generation: int = None):
+        """Store a value.
+
+        :param key: hashable key
+        :param value: value to store
+        :param int generation: generation read before computing the value. If the cache has \
+            been cleared since, the value is ignored.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                logger.debug("Cache has been invalidated meanwhile, value is not stored.")
+                return
+            self._entries[key] = (monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and increment the generation."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    cache = IsogeoCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    print(cache, cache.get("a"), cache.get("c"))
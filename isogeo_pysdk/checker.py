@@ -9,15 +9,16 @@
 
 # Standard library
 import logging
+import re
 import socket
 import warnings
-from collections import Counter
+from functools import lru_cache
 from json import JSONDecodeError
-from uuid import UUID
-from typing import Union
+from typing import Iterable, Union
 
 # modules
 from isogeo_pysdk.enums import LinkActions, MetadataSubresources
+from isogeo_pysdk.models.search_query import SearchQuery
 
 # ##############################################################################
 # ########## Globals ###############
@@ -25,27 +26,10 @@ from isogeo_pysdk.enums import LinkActions, MetadataSubresources
 
 logger = logging.getLogger(__name__)
 
-FILTER_KEYS = {
-    "action": [],
-    "catalog": [],
-    "contact:group": [],
-    "contact:isogeo": [],
-    "coordinate-system": [],
-    "data-source": [],
-    "format": [],
-    "has-no": [],
-    "keyword:isogeo": [],
-    "keyword:inspire-theme": [],
-    "license:group": [],
-    "license:isogeo": [],
-    "owner": [],
-    "provider": [],
-    "text": [],
-    "type": [],
-}
-
 FILTER_PROVIDERS = ("manual", "auto")
 
+FILTERS_UNIQUE = ("coordinate-system", "format", "owner", "type")
+
 FILTER_TYPES = {
     "dataset": "dataset",
     "raster-dataset": "rasterDataset",
@@ -74,6 +58,9 @@ _SUBRESOURCES_KW = ("_abilities", "count", "thesaurus")
 
 _SUBRESOURCES_CT = ("count",)
 
+# UUID as accepted by Isogeo: 32 lowercase hex digits, optionally hyphenated and URN prefixed
+_regex_uuid = re.compile(r"(?:urn:uuid:)?-*(?:[0-9a-f]-*){32}")
+
 # ##############################################################################
 # ########## Classes ###############
 # ##################################
@@ -147,115 +134,66 @@ class IsogeoChecker(object):
         :param dict response: search request parameters
         """
         # -- SEMANTIC QUERY ---------------------------------------------------
-        li_args = parameters.get("q").split()
-        logger.debug(li_args)
+        query = parameters.get("q") or ""
+        if not isinstance(query, SearchQuery):
+            query = SearchQuery.from_string(query)
+        self._check_search_query(query)
+
+        # -- GEOGRAPHIC -------------------------------------------------------
+        in_box = parameters.get("box")
+        in_geo = parameters.get("geo")
+        # geometric relation
+        in_rel = parameters.get("rel")
+        if in_rel and in_box is None and in_geo is None:
+            raise ValueError("'rel' should'nt be used without box or geo.")
+        elif in_rel not in GEORELATIONS and in_rel is not None:
+            raise ValueError(
+                "{} is not a correct value for 'georel'."
+                " Must be one of: {}.".format(in_rel, " | ".join(GEORELATIONS))
+            )
 
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _check_search_query(cls, query: SearchQuery) -> bool:
+        """Check the semantic filters of a parsed search query. Results are cached since \
+        :py:class:`~isogeo_pysdk.models.search_query.SearchQuery` is immutable.
+
+        :param SearchQuery query: parsed search query
+        """
         # Unicity
-        li_filters = [i.split(":")[0] for i in li_args]
-        filters_count = Counter(li_filters)
-        li_filters_must_be_unique = ("coordinate-system", "format", "owner", "type")
-        for i in filters_count:
-            if i in li_filters_must_be_unique and filters_count.get(i) > 1:
+        for filter_name in FILTERS_UNIQUE:
+            count = len(query.filters.get(filter_name, ()))
+            if count > 1:
                 raise ValueError(
                     "This query filter must be unique: {}"
-                    " and it occurred {} times.".format(i, filters_count.get(i))
+                    " and it occurred {} times.".format(filter_name, count)
                 )
 
-        # dict
-        dico_query = FILTER_KEYS.copy()
-        for i in li_args:
-            if i.startswith("action"):
-                dico_query["action"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("catalog"):
-                dico_query["catalog"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("contact") and i.split(":")[1] == "group":
-                dico_query["contact:group"].append(i.split(":")[1:][1])
-                continue
-            elif i.startswith("contact"):
-                dico_query["contact:isogeo"].append(i.split(":", 1)[1])
-                continue
-            elif i.startswith("coordinate-system"):
-                dico_query["coordinate-system"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("data-source"):
-                dico_query["data-source"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("format"):
-                dico_query["format"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("has-no"):
-                dico_query["has-no"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("keyword:isogeo"):
-                dico_query["keyword:isogeo"].append(i.split(":")[1:][1])
-                continue
-            elif i.startswith("keyword:inspire-theme"):
-                dico_query["keyword:inspire-theme"].append(i.split(":")[1:][1])
-                continue
-            elif i.startswith("license:isogeo"):
-                dico_query["license:isogeo"].append(i.split(":")[1:][1:])
-                continue
-            elif i.startswith("license"):
-                dico_query["license:group"].append(i.split(":", 1)[1:][0:])
-                continue
-            elif i.startswith("owner"):
-                dico_query["owner"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("provider"):
-                dico_query["provider"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("share"):
-                dico_query["share"].append(i.split(":")[1:][0])
-                continue
-            elif i.startswith("type"):
-                dico_query["type"].append(i.split(":")[1:][0])
-                continue
-            else:
-                # logger.debug(i.split(":")[1], i.split(":")[1].isdigit())
-                dico_query["text"].append(i)
-                continue
+        # Values - every occurrence is checked, so that the result doesn't depend on the \
+        # order of the filters (ignored by SearchQuery equality, hence by the cache)
+        def _values(filter_name: str, default: str) -> set:
+            values = query.filters.get(filter_name) or (default,)
+            return {value.split(":")[0].lower() for value in values}
 
-        # Values
-        dico_filters = {i.split(":")[0]: i.split(":")[1:] for i in li_args}
-        if dico_filters.get("type", ("dataset",))[0].lower() not in FILTER_TYPES:
+        if not _values("type", "dataset").issubset(FILTER_TYPES):
             raise ValueError(
                 "type value must be one of: {}".format(" | ".join(FILTER_TYPES))
             )
-        elif (
-            dico_filters.get("action", ("download",))[0].lower()
-            not in LinkActions.__members__
-        ):
+        elif not _values("action", "download").issubset(LinkActions.__members__):
             raise ValueError(
                 "action value must be one of: {}".format(
                     " | ".join(LinkActions.__members__)
                 )
             )
-        elif (
-            dico_filters.get("provider", ("manual",))[0].lower() not in FILTER_PROVIDERS
-        ):
+        elif not _values("provider", "manual").issubset(FILTER_PROVIDERS):
             raise ValueError(
                 "provider value must be one of: {}".format(" | ".join(FILTER_PROVIDERS))
             )
-        else:
-            logger.debug(dico_filters)
 
-        # -- GEOGRAPHIC -------------------------------------------------------
-        in_box = parameters.get("box")
-        in_geo = parameters.get("geo")
-        # geometric relation
-        in_rel = parameters.get("rel")
-        if in_rel and in_box is None and in_geo is None:
-            raise ValueError("'rel' should'nt be used without box or geo.")
-        elif in_rel not in GEORELATIONS and in_rel is not None:
-            raise ValueError(
-                "{} is not a correct value for 'georel'."
-                " Must be one of: {}.".format(in_rel, " | ".join(GEORELATIONS))
-            )
+        return True
 
     @classmethod
-    def check_is_uuid(self, uuid_str: str):
+    def check_is_uuid(self, uuid_str: str) -> bool:
         """Check if it's an Isogeo UUID handling specific form.
 
         :param str uuid_str: UUID string to check
@@ -263,29 +201,49 @@ class IsogeoChecker(object):
         # check uuid type
         if not isinstance(uuid_str, str):
             logger.debug(
-                TypeError(
-                    "'uuid_str' parameter expects a str value. Got: {}".format(
-                        type(uuid_str)
-                    )
-                )
+                "'uuid_str' parameter expects a str value. Got: %s", type(uuid_str)
             )
             return False
-        else:
-            pass
         # handle Isogeo specific UUID in XML exports
         if "isogeo:metadata" in uuid_str:
             uuid_str = "urn:uuid:{}".format(uuid_str.split(":")[-1])
-        else:
-            pass
         # test it
-        try:
-            uid = UUID(uuid_str)
-            return uid.hex == uuid_str.replace("-", "").replace("urn:uuid:", "")
-        except ValueError as e:
-            logger.warning(
-                "uuid ValueError. {} ({}) -- {}".format(type(uuid_str), uuid_str, e)
-            )
+        if _regex_uuid.fullmatch(uuid_str) is None:
+            logger.debug("Not a valid UUID: %s", uuid_str)
             return False
+        return True
+
+    @classmethod
+    def check_many_uuids(self, uuids: Iterable) -> tuple:
+        """Check a batch of UUIDs at once, without logging each one. Order is preserved.
+
+        :param Iterable uuids: values to check, typically metadata UUIDs
+
+        :returns: (valid values, invalid values)
+        :rtype: tuple(list, list)
+
+        :Example:
+
+        .. code-block:: python
+
+            >>> checker.check_many_uuids(["0269803d50c446b09f5060ef7fe3e22b", "oops", None])
+            (['0269803d50c446b09f5060ef7fe3e22b'], ['oops', None])
+        """
+        fullmatch = _regex_uuid.fullmatch
+        valid = []
+        invalid = []
+        for uuid_str in uuids:
+            if isinstance(uuid_str, str) and (
+                fullmatch(uuid_str)
+                or (
+                    "isogeo:metadata" in uuid_str
+                    and fullmatch("urn:uuid:{}".format(uuid_str.split(":")[-1]))
+                )
+            ):
+                valid.append(uuid_str)
+            else:
+                invalid.append(uuid_str)
+        return valid, invalid
 
     def check_edit_tab(self, tab: str, md_type: str):
         """Check if asked tab is part of Isogeo web form and reliable with metadata type.
@@ -340,13 +298,11 @@ class IsogeoChecker(object):
         if isinstance(specific_md, (list, tuple)):
             if len(specific_md) > 0:
                 # checking UUIDs and popping bad ones
-                specific_md = list(specific_md)
-                for md in specific_md:
-                    if not self.check_is_uuid(md):
-                        specific_md.remove(md)
-                        logger.warning(
-                            "Incorrect metadata UUID has been removed: {}".format(md)
-                        )
+                specific_md, invalid_mds = self.check_many_uuids(specific_md)
+                if invalid_mds:
+                    logger.warning(
+                        "Incorrect metadata UUIDs have been removed: %s", invalid_mds
+                    )
                 # joining survivors
                 specific_md = ",".join(specific_md)
             else:
@@ -14,6 +14,10 @@ import logging
 from datetime import datetime
 from functools import wraps
 
+# submodules
+from isogeo_pysdk.profiling import profile_operation
+from isogeo_pysdk.tracing import span
+
 # ##############################################################################
 # ########## Globals ###############
 # ##################################
@@ -37,24 +41,35 @@ class ApiDecorators(object):
         comparing with actual datetime (UTC) and renews it if necessary.
         See: https://tools.ietf.org/html/rfc6750#section-2
 
+        The decorated function is traced as a span if a tracer is set (see
+        :func:`~isogeo_pysdk.tracing.set_tracer`) and profiled if profiling is
+        enabled (see :class:`~isogeo_pysdk.profiling.IsogeoProfiler`).
+
         :param decorated_func token: original function to execute after check
         """
 
+        span_name = decorated_func.__qualname__
+        span_attributes = {
+            "code.function": decorated_func.__name__,
+            "code.namespace": decorated_func.__module__,
+        }
+
         @wraps(decorated_func)
         def wrapper(*args, **kwargs):
-            # compare token expiration date and ask for a new one if it's expired
-            if datetime.utcnow() > datetime.utcfromtimestamp(
-                self.api_client.token.get("expires_at")
-            ):
-                self.api_client.refresh_token(
-                    token_url=self.api_client.auto_refresh_url
-                )
-                logger.debug("Token was about to expire, so has been renewed.")
-            else:
-                logger.debug("Token is still valid.")
-
-            # let continue running the original function
-            return decorated_func(*args, **kwargs)
+            with span(span_name, span_attributes), profile_operation(span_name):
+                # compare token expiration date and ask for a new one if it's expired
+                if datetime.utcnow() > datetime.utcfromtimestamp(
+                    self.api_client.token.get("expires_at")
+                ):
+                    self.api_client.refresh_token(
+                        token_url=self.api_client.auto_refresh_url
+                    )
+                    logger.debug("Token was about to expire, so has been renewed.")
+                else:
+                    logger.debug("Token is still valid.")
+
+                # let continue running the original function
+                return decorated_func(*args, **kwargs)
 
         return wrapper
 
@@ -35,3 +35,21 @@ class AlreadyExistError(IsogeoSdkError):
     """An object with similar properties already exists in Isogeo database."""
 
     pass
+
+
+class DeadlineExceededError(IsogeoSdkError, TimeoutError):
+    """The time budget of an operation has been consumed before its end."""
+
+    pass
+
+
+class RequestBudgetExceededError(IsogeoSdkError):
+    """More requests than allowed by a request budget have been sent."""
+
+    pass
+
+
+class ResponseNotRecordedError(IsogeoSdkError):
+    """A replayed request has no response in the archive."""
+
+    pass
@@ -13,19 +13,39 @@ Author: Julien Moura (@geojulien) for @Isogeo
 
 # Standard library
 import logging
+from concurrent.futures import FIRST_COMPLETED, wait
+from copy import copy
+from time import monotonic, sleep
 
 # 3rd party library
 from oauthlib.oauth2 import BackendApplicationClient, LegacyApplicationClient
+from requests import Request
 from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
 from requests_oauthlib import OAuth2Session
-from urllib3.util import Retry
+from urllib3.exceptions import NewConnectionError
+from urllib3.util import make_headers
 
 # modules
-from isogeo_pysdk import api
+from isogeo_pysdk import api, transports
 from isogeo_pysdk.__about__ import __version__ as version
 from isogeo_pysdk.api_hooks import IsogeoHooks
+from isogeo_pysdk.budget import IsogeoRequestBudget, record_request
+from isogeo_pysdk.cache import IsogeoCache
 from isogeo_pysdk.checker import IsogeoChecker
+from isogeo_pysdk.exceptions import DeadlineExceededError
+from isogeo_pysdk.latency import (
+    IsogeoLatencyTracker,
+    deadline,
+    deadline_timeout,
+    remaining_time,
+)
+from isogeo_pysdk.limiter import IsogeoLimiter, parse_retry_after, priority
+from isogeo_pysdk.profiling import IsogeoProfiler, record_network
 from isogeo_pysdk.models import Application, User
+from isogeo_pysdk.scheduler import IsogeoScheduler
+from isogeo_pysdk.singleflight import IsogeoSingleFlight
+from isogeo_pysdk.tracing import span
 from isogeo_pysdk.utils import IsogeoUtils
 
 # ##############################################################################
@@ -36,6 +56,15 @@ logger = logging.getLogger(__name__)
 checker = IsogeoChecker()
 utils = IsogeoUtils()
 
+IDEMPOTENT_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE")
+RETRY_STATUSES = (429, 502, 503, 504)
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# compression schemes which can be decoded: gzip, deflate and br/zstd if brotli/zstandard
+# packages are installed
+ACCEPT_ENCODING = ", ".join(
+    make_headers(accept_encoding=True).get("accept-encoding").split(",")
+)
+
 # #############################################################################
 # ########## Classes ###############
 # ##################################
@@ -61,13 +90,40 @@ class Isogeo(OAuth2Session):
     :param dict proxy: dictionary of proxy settings as described in `Requests <https://2.python-requests.org/en/master/user/advanced/#proxies>`_
     :param str lang: API localization ("en", "es", "pt" or "fr"). Defaults to 'fr'.
     :param str app_name: to custom the application name and user-agent
-    :param int max_retries: custom the maximum number of retries each connection should attempt.\
-        See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
+    :param int max_retries: custom the maximum number of retries each request should attempt when \
+        the API is throttling (429), unavailable (502, 503, 504), times out or can't be reached. \
+        Retries are delayed by a jittered backoff or the `Retry-After` header and limited by a \
+        client-wide budget (see :class:`~isogeo_pysdk.limiter.IsogeoLimiter`).
     :param int pool_connections: custom the number of urllib3 connection pools to cache.\
         See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
     :param int pool_maxsize: custom the maximum number of connections to save in the pool.\
         See: `Requests <http://2.python-requests.org/en/master/api/#requests.adapters.HTTPAdapter>`_
+    :param int max_workers: maximum count of requests sent concurrently by the operations \
+        splitted into multiple requests (whole_results searches...). Shared by all these \
+        operations and capped to `pool_maxsize`. Defaults to `pool_maxsize`.
+    :param bool coalesce_requests: send only once identical GET requests (same URL, parameters \
+        and authentication) running at the same time. A GET sent right after a write may then \
+        get the response of an identical GET started before it. Disabled by default.
+    :param bool hedge_requests: send a duplicate of GET requests still pending after the usual \
+        latency (see `hedge_percentile`) of their route, and use the first response. Reduces \
+        the latency tail at the cost of a few more requests. Disabled by default.
+    :param float hedge_percentile: latency percentile of the route after which a request is \
+        hedged. Defaults to 0.95 (p95).
+    :param bool http2: send requests over HTTP/2 with httpx (optional dependency: \
+        ``pip install httpx[http2]``), multiplexing concurrent requests over a few connections. \
+        The connection is opened while the token is fetched (see :py:meth:`warm_up`). \
+        See :class:`~isogeo_pysdk.transports.IsogeoHttp2Adapter`. Disabled by default.
+    :param str record: path of an archive (`.jsonl.gz`) where to record the API responses, \
+        to replay them later. See :class:`~isogeo_pysdk.transports.IsogeoRecordAdapter`.
+    :param str replay: path of an archive of recorded API responses used to answer the \
+        requests, without network. See :class:`~isogeo_pysdk.transports.IsogeoReplayAdapter`.
+    :param float replay_latency: factor applied to the recorded latencies when replaying: \
+        1 (default) for the original timing, 0 to answer immediately.
     :param dict isogeo_urls: Only needed when platform is "custom", a dictionnary of specific Isogeo URLs.
+    :param int search_cache_size: maximum count of search responses to keep in memory. Disabled \
+        (0) by default. The cache is cleared each time the client sends a write request \
+        (POST, PUT, PATCH, DELETE) to the API.
+    :param float search_cache_ttl: time to live of cached search responses, in seconds.
 
     :returns: authenticated requests Session you can use to send requests to the API.
     :rtype: requests_oauthlib.OAuth2Session
@@ -109,6 +165,11 @@ class Isogeo(OAuth2Session):
     """
 
     # -- ATTRIBUTES -----------------------------------------------------------
+    deadline = staticmethod(deadline)
+    priority = staticmethod(priority)
+    request_budget = IsogeoRequestBudget
+    profile = IsogeoProfiler
+
     AUTH_MODES = {
         "group": {"client_id": str, "client_secret": str},
         "user_legacy": {
@@ -145,7 +206,17 @@ class Isogeo(OAuth2Session):
         max_retries: int = 2,
         pool_connections: int = 20,
         pool_maxsize: int = 50,
+        max_workers: int = None,
+        coalesce_requests: bool = False,
+        hedge_requests: bool = False,
+        hedge_percentile: float = 0.95,
+        http2: bool = False,
+        record: str = None,
+        replay: str = None,
+        replay_latency: float = 1.0,
         isogeo_urls: dict = {},
+        search_cache_size: int = 0,
+        search_cache_ttl: float = 300,
         # additional
         **kwargs,
     ):
@@ -189,6 +260,11 @@ class Isogeo(OAuth2Session):
         self._shares = {}  # Isogeo applications by names
         self._thesauri_codes = {}  # Isogeo thesauri by codes
         self._workgroups_names = {}  # Isogeo workgroups by names
+        # search responses
+        if search_cache_size:
+            self._search_cache = IsogeoCache(maxsize=search_cache_size, ttl=search_cache_ttl)
+        else:
+            self._search_cache = None
         # user
         self._user = User()  # authenticated user profile
         # workgroup
@@ -203,8 +279,12 @@ class Isogeo(OAuth2Session):
         self._wg_shares = {}  # workgroup shares
         self._wg_specifications_names = {}  # workgroup specifications by names
 
-        # checking internet connection
-        if not checker.check_internet_connection() and platform.lower() != "custom":
+        # checking internet connection - replayed responses don't need it
+        if (
+            not replay
+            and platform.lower() != "custom"
+            and not checker.check_internet_connection()
+        ):
             raise EnvironmentError("Internet connection issue.")
         else:
             pass
@@ -249,6 +329,39 @@ class Isogeo(OAuth2Session):
         # pool settings
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
+        if http2 and transports.httpx is None:
+            raise ImportError(
+                "'http2' option requires httpx with HTTP/2 support: pip install httpx[http2]"
+            )
+        self.http2 = http2
+
+        # record or replay the API responses
+        if record and replay:
+            raise ValueError("'record' and 'replay' options can't be combined.")
+        self.record = record
+        self.replay = replay
+        self.replay_latency = replay_latency
+
+        # shared executor for concurrent requests: more workers than connections is useless
+        self.scheduler = IsogeoScheduler(
+            max_workers=min(max_workers or pool_maxsize, pool_maxsize),
+            thread_name_prefix="IsogeoWorker",
+        )
+        # identical GET requests in flight are coalesced
+        self._single_flight = IsogeoSingleFlight() if coalesce_requests else None
+        # latencies by route, used to hedge slow requests
+        self.latencies = IsogeoLatencyTracker()
+        self.hedge_percentile = hedge_percentile
+        if hedge_requests:
+            self._hedge_scheduler = IsogeoScheduler(
+                max_workers=pool_maxsize, thread_name_prefix="IsogeoHedge"
+            )
+        else:
+            self._hedge_scheduler = None
+        # adaptive limit of concurrent requests, growing up to the pool size
+        self.limiter = IsogeoLimiter(
+            max_limit=pool_maxsize, initial_limit=min(10, pool_maxsize)
+        )
 
         # setting language
         if lang.lower() not in ("fr", "en", "es", "pt"):
@@ -308,7 +421,10 @@ class Isogeo(OAuth2Session):
         self.invitation = api.ApiInvitation(self)
         self.license = api.ApiLicense(self)
         self.metadata = api.ApiMetadata(self)
-        self.search = api.ApiSearch(self).search
+        self._api_search = api.ApiSearch(self)
+        self.search = self._api_search.search
+        self.search_async = self._api_search.search_async
+        self.search_keyset = self._api_search.search_keyset
         self.services = api.ApiService(self)
         self.share = api.ApiShare(self)
         self.specification = api.ApiSpecification(self)
@@ -323,6 +439,8 @@ class Isogeo(OAuth2Session):
             auto_refresh_kwargs=self.auto_refresh_kwargs,
             **kwargs,
         )
+        # metrics by route: latency, status codes, bytes...
+        self.hooks["response"].append(self.custom_hooks.track_response)
 
     def connect(self, username: str = None, password: str = None):
         """Custom the HTTP client and authenticate application with user credentials \
@@ -334,25 +452,37 @@ class Isogeo(OAuth2Session):
         :param str username: user login (email). Not required for group apps (Client Credentials).
         :param str password: user password. Not required for group apps (Client Credentials).
         """
-        # customize HTTPAdapter
-        adapter = HTTPAdapter(
-            max_retries=Retry(
-                total=self.max_retries,
-                backoff_factor=1,
-                status_forcelist=[502, 503, 504],
-            ),
-            pool_connections=self.pool_connections,
-            pool_maxsize=self.pool_maxsize,
-        )
+        # customize transport adapter
+        if self.replay:
+            adapter = transports.IsogeoReplayAdapter(self.replay, latency=self.replay_latency)
+        elif self.http2:
+            adapter = transports.IsogeoHttp2Adapter(
+                max_connections=self.pool_maxsize, proxies=self.proxies, verify=self.ssl
+            )
+        else:
+            # no urllib3 retries: requests are retried by the client (see request method)
+            adapter = HTTPAdapter(
+                max_retries=0,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+            )
+        if self.record:
+            adapter = transports.IsogeoRecordAdapter(self.record, adapter)
         self.mount("https://", adapter)
         self.mount("http://", adapter)
         logger.debug(
-            "HTTP(S) requests will use the following configuration: "
-            "pool connections={} - pool max size={} - max retries={}".format(
-                self.pool_connections, self.pool_maxsize, self.max_retries
-            )
+            "HTTP(S) requests will use the following configuration: HTTP/2=%s - pool "
+            "connections=%s - pool max size=%s - max retries=%s",
+            self.http2,
+            self.pool_connections,
+            self.pool_maxsize,
+            self.max_retries,
         )
 
+        # open the multiplexed connection to the API while the token is fetched
+        if self.http2:
+            self.warm_up()
+
         # authenticate
         if self.auth_mode == "user_legacy":
             # get token
@@ -383,26 +513,345 @@ class Isogeo(OAuth2Session):
                 self.app_properties = None
             else:
                 # if application has associated shares, then retrieve informations
-                logger.info(
-                    "This application is feeded by {} share(s).".format(
-                        len(associated_shares)
-                    )
-                )
+                logger.info("This application is feeded by %s share(s).", len(associated_shares))
                 self.app_properties = Application(
                     **self.share.listing()[0].get("applications")[0]
                 )
 
+    def warm_up(self, connections: int = None) -> list:
+        """Open connections to the API in advance, so that the first requests don't pay the \
+        TCP and TLS handshakes. Called by :py:meth:`connect` with HTTP/2 only, where one \
+        connection carries all the requests.
+
+        Unauthenticated HEAD requests are sent in background through the scheduler, directly \
+        by the transport adapter: they are neither limited, counted in metrics and budgets, \
+        nor recorded.
+
+        :param int connections: count of connections to open. Defaults to 1 with HTTP/2 \
+            (requests are multiplexed) or to the current concurrency limit.
+
+        :returns: futures of the warm-up requests
+        :rtype: list
+        """
+        if self.replay:
+            return []
+        if connections is None:
+            connections = 1 if self.http2 else self.limiter.concurrency
+        url = "{}://{}/about".format(self.utils.api_prot, self.api_url)
+
+        # below the recording adapter, if any
+        adapter = self.get_adapter(url)
+        if isinstance(adapter, transports.IsogeoRecordAdapter):
+            adapter = adapter.adapter
+        settings = self.merge_environment_settings(url, self.proxies, False, self.ssl, None)
+        prepared = Request("HEAD", url, headers={"user-agent": self.app_name}).prepare()
+
+        def _open_connection():
+            try:
+                adapter.send(
+                    prepared.copy(),
+                    timeout=self.timeout,
+                    verify=settings.get("verify"),
+                    proxies=settings.get("proxies"),
+                ).close()
+            except Exception as exc:
+                logger.debug("Connection warm-up failed: %s", exc)
+
+        return [self.scheduler.submit(_open_connection) for _ in range(connections)]
+
+    def refresh_token(self, token_url: str, *args, **kwargs) -> dict:
+        """Overrides :meth:`requests_oauthlib.OAuth2Session.refresh_token` to count the token \
+        renewals in the client metrics.
+
+        :param str token_url: token endpoint
+        """
+        token = super().refresh_token(token_url, *args, **kwargs)
+        self.custom_hooks.record_token_refresh()
+        return token
+
     # -- PROPERTIES -----------------------------------------------------------
+    def close(self):
+        """Overrides :meth:`requests.Session.close` to also stop the workers of the schedulers."""
+        self.scheduler.shutdown(wait=True)
+        if self._hedge_scheduler is not None:
+            self._hedge_scheduler.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+    def request(self, method: str, url: str, *args, **kwargs):
+        """Overrides :meth:`requests_oauthlib.OAuth2Session.request` to handle the requests \
+        sent to the API:
+
+        - concurrency is limited by the client :class:`~isogeo_pysdk.limiter.IsogeoLimiter`;
+        - throttled (429), unavailable (502, 503, 504), timed out or failed requests are \
+            retried with a jittered backoff, honouring `Retry-After` and within the retry \
+            budget. It's the only retry layer: urllib3 doesn't retry;
+        - the search cache is invalidated when a write request is sent (metadata edition, \
+            bulk, associations...);
+        - identical GET requests running at the same time are sent only once if enabled, each \
+            caller receiving its own copy of the response;
+        - the deadline of the current context (see :func:`~isogeo_pysdk.latency.deadline`) \
+            bounds the wait for a slot or for an identical request in flight, then timeouts \
+            are reduced to the time left. Slow GET requests are hedged if enabled;
+        - requests are counted in the request budgets of the current context (see \
+            :class:`~isogeo_pysdk.budget.IsogeoRequestBudget`).
+
+        Token fetches and renewals sent to the authentication host are retried the same way.
+        """
+        if self.api_url not in url:
+            if url != self.auto_refresh_url:
+                return super().request(method, url, *args, **kwargs)
+            # token endpoint: urllib3 doesn't retry either
+            return self._request_with_retries(method, url, *args, **kwargs)
+
+        record_request(method, url, kwargs.get("params"))
+
+        if (
+            self._single_flight is not None
+            and method.upper() == "GET"
+            and not kwargs.get("stream")
+        ):
+            response, shared = self._single_flight.do(
+                self._request_key(method, url, kwargs),
+                self._request_with_retries,
+                method,
+                url,
+                *args,
+                **kwargs
+            )
+            return self._copy_response(response) if shared else response
+
+        if self._search_cache is not None and method.upper() not in SAFE_METHODS:
+            self._search_cache.clear()
+            try:
+                return self._request_with_retries(method, url, *args, **kwargs)
+            finally:
+                # the write is applied: responses stored meanwhile may be outdated
+                self._search_cache.clear()
+
+        return self._request_with_retries(method, url, *args, **kwargs)
+
+    def _request_key(self, method: str, url: str, kwargs: dict) -> tuple:
+        """Build the key identifying identical requests: method, URL, parameters, headers and \
+        authentication.
+
+        :param str method: HTTP method
+        :param str url: URL to request
+        :param dict kwargs: other arguments of the request
+
+        :rtype: tuple
+        """
+        params = kwargs.get("params") or {}
+        if isinstance(params, dict):
+            params = sorted((k, str(v)) for k, v in params.items())
+        return (
+            method.upper(),
+            url,
+            str(params),
+            tuple(sorted((kwargs.get("headers") or {}).items())),
+            (self.token or {}).get("access_token"),
+        )
+
+    @staticmethod
+    def _copy_response(response):
+        """Copy a response received by another caller, so that each one can use it freely.
+
+        :param requests.models.Response response: response to copy
+        """
+        response_copy = copy(response)
+        response_copy.headers = response.headers.copy()
+        return response_copy
+
+    def _request_with_retries(self, method: str, url: str, *args, **kwargs):
+        """Send a request, retrying it if the API is overloaded.
+
+        :param str method: HTTP method
+        :param str url: URL to request
+        """
+        # requests rejected before being processed can be retried whatever the method
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        hedged = (
+            self._hedge_scheduler is not None
+            and method.upper() == "GET"
+            and not kwargs.get("stream")
+        )
+        self.limiter.deposit()
+        attempt = 0
+        while True:
+            try:
+                if hedged:
+                    response = self._send_hedged(method, url, *args, **kwargs)
+                else:
+                    response = self._send(method, url, *args, **kwargs)
+            except (Timeout, ConnectionError) as exc:
+                if (
+                    not (idempotent or self._not_sent(exc))
+                    or attempt >= self.max_retries
+                    or not self.limiter.withdraw()
+                ):
+                    raise
+                delay = self.limiter.backoff(attempt)
+                if not self._can_wait(delay):
+                    raise
+                logger.warning(
+                    "%s %s failed (%s). Retry in %.1fs.", method, url, exc.__class__.__name__, delay
+                )
+            else:
+                if (
+                    response.status_code not in RETRY_STATUSES
+                    or not (idempotent or response.status_code in (429, 503))
+                    or attempt >= self.max_retries
+                    or not self.limiter.withdraw()
+                ):
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    self.limiter.pause(retry_after)
+                delay = self.limiter.backoff(attempt, retry_after)
+                if not self._can_wait(delay):
+                    return response
+                logger.warning(
+                    "%s %s answered %s. Retry in %.1fs.", method, url, response.status_code, delay
+                )
+                response.close()
+
+            self.custom_hooks.record_retry(url)
+            attempt += 1
+            sleep(delay)
+
+    @staticmethod
+    def _not_sent(exc: Exception) -> bool:
+        """Check if a request failed before being sent, while opening the connection. Such \
+        requests can be retried whatever the method.
+
+        :param Exception exc: exception raised by the request
+        """
+        if isinstance(exc, ConnectTimeout):
+            return True
+        reason = getattr(exc.args[0], "reason", None) if exc.args else None
+        return isinstance(reason, NewConnectionError)
+
+    @staticmethod
+    def _can_wait(delay: float) -> bool:
+        """Check that a retry delay ends before the deadline of the current context.
+
+        :param float delay: delay in seconds
+        """
+        remaining = remaining_time()
+        return remaining is None or delay < remaining
+
+    def _send(self, method: str, url: str, *args, **kwargs):
+        """Send one request through the limiter and record its latency.
+
+        :param str method: HTTP method
+        :param str url: URL to request
+        """
+        response, latency = self._send_timed(method, url, *args, **kwargs)
+        if latency is not None:
+            self.latencies.record(self.utils.route_template(url), latency)
+        return response
+
+    def _send_timed(self, method: str, url: str, *args, **kwargs) -> tuple:
+        """Send one request through the limiter, without recording its latency.
+
+        :param str method: HTTP method
+        :param str url: URL to request
+
+        :returns: the response and its latency, None if the API was overloaded
+        :rtype: tuple
+        """
+        route = self.utils.route_template(url)
+        with span(
+            "{} {}".format(method.upper(), route),
+            {"http.request.method": method.upper(), "http.route": route, "url.full": url},
+        ) as current_span:
+            # waiting for a slot counts against the deadline
+            start = monotonic()
+            acquired = self.limiter.acquire(timeout=remaining_time())
+            self.custom_hooks.record_wait(url, monotonic() - start)
+            if not acquired:
+                raise DeadlineExceededError("Deadline exceeded while waiting for a request slot.")
+            try:
+                kwargs["timeout"] = deadline_timeout(kwargs.get("timeout"))
+            except DeadlineExceededError:
+                self.limiter.cancel()
+                raise
+            start = monotonic()
+            overloaded = False
+            try:
+                response = super().request(method, url, *args, **kwargs)
+                overloaded = response.status_code in RETRY_STATUSES
+            except (Timeout, ConnectionError):
+                overloaded = True
+                raise
+            finally:
+                # the slot is given back whatever happened
+                latency = monotonic() - start
+                record_network(latency)
+                self.limiter.release(latency, overloaded=overloaded)
+            if current_span is not None:
+                current_span.set_attribute("http.response.status_code", response.status_code)
+                if response.status_code >= 400:
+                    current_span.set_attribute("error.type", str(response.status_code))
+            return response, None if overloaded else latency
+
+    def _send_hedged(self, method: str, url: str, *args, **kwargs):
+        """Send a request and, if it's still pending after the usual latency of its route, a \
+        duplicate. Returns the first response received, the other one is closed. Only the \
+        latency of the returned response is recorded.
+
+        :param str method: HTTP method
+        :param str url: URL to request
+        """
+        hedge_delay = self.latencies.percentile(
+            self.utils.route_template(url), self.hedge_percentile
+        )
+        if hedge_delay is None:
+            return self._send(method, url, *args, **kwargs)
+
+        futures = [
+            self._hedge_scheduler.submit(self._send_timed, method, url, *args, **kwargs)
+        ]
+        done, pending = wait(futures, timeout=hedge_delay)
+        if not done:
+            logger.debug(
+                "%s %s pending after %.2fs: sending a hedged request.", method, url, hedge_delay
+            )
+            futures.append(
+                self._hedge_scheduler.submit(self._send_timed, method, url, *args, **kwargs)
+            )
+            done, pending = wait(futures, return_when=FIRST_COMPLETED)
+
+        first = done.pop()
+        if first.exception() is not None and pending:
+            # the other request may succeed
+            done, pending = wait(pending)
+            first = done.pop()
+        for future in futures:
+            if future is not first:
+                future.add_done_callback(self._close_future_response)
+        response, latency = first.result()
+        if latency is not None:
+            self.latencies.record(self.utils.route_template(url), latency)
+        return response
+
+    @staticmethod
+    def _close_future_response(future):
+        """Close the response of a request which lost a hedging race. Its latency is not \
+        recorded: it would inflate the percentile deciding when to hedge."""
+        if not future.cancelled() and future.exception() is None:
+            future.result()[0].close()
+
     @property
     def header(self) -> dict:
         if self.auth_mode == "group":
             return {
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "Authorization": "Bearer {}".format(self.token.get("access_token")),
                 "user-agent": self.app_name,
             }
         elif self.auth_mode == "user_legacy":
             return {
-                "Accept-Encoding": "gzip, deflate, br",
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "User-Agent": self.app_name,
                 # "Content-Type": "application/json; charset=utf-8",
                 # "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
@@ -0,0 +1,179 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Latency tracking per route and deadlines propagated to the requests of an operation."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+
+# modules
+from isogeo_pysdk.exceptions import DeadlineExceededError
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# absolute deadline (time.monotonic) of the current operation. Context variables are copied
+# to the scheduler workers so the pages of a search share the deadline of the search.
+_deadline = ContextVar("isogeo_deadline", default=None)
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Context manager giving a total time budget to the requests sent within. Requests are \
+    not sent once it's consumed and their timeouts are reduced to the remaining time. A \
+    nested deadline can't extend the enclosing one.
+
+    :param float seconds: time budget in seconds
+
+    :raises DeadlineExceededError: when a request is sent after the deadline
+
+    :Example:
+
+    .. code-block:: python
+
+        with isogeo.deadline(10):
+            md = isogeo.metadata.get(md_id)
+            search = isogeo.search(whole_results=1)  # pages share the budget
+    """
+    new_deadline = monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(current, new_deadline)
+    token = _deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float:
+    """Returns the time left before the deadline of the current context.
+
+    :returns: seconds left (can be negative) or None if there is no deadline
+    :rtype: float
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - monotonic()
+
+
+def deadline_timeout(timeout):
+    """Reduce a requests timeout to the time left before the deadline of the current context.
+
+    :param timeout: timeout as accepted by requests: None, a number or a (connect, read) tuple
+
+    :raises DeadlineExceededError: if the deadline is already passed
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceededError("Deadline exceeded by {:.2f}s.".format(-remaining))
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
+
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoLatencyTracker(object):
+    """Keep the latest latencies of each route to compute percentiles, used to decide when \
+    hedging a request.
+
+    :param int window: count of latencies kept by route
+    :param int min_samples: count of latencies required before returning percentiles
+
+    :Example:
+
+    .. code-block:: python
+
+        tracker = IsogeoLatencyTracker()
+        tracker.record("resources/{id}", 0.12)
+        print(tracker.percentile("resources/{id}", 0.95))
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """Instanciate the tracker."""
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return "<IsogeoLatencyTracker: {} routes>".format(len(self._latencies))
+
+    def record(self, route: str, latency: float):
+        """Store the latency of a request.
+
+        :param str route: route template (see :meth:`~isogeo_pysdk.utils.IsogeoUtils.route_template`)
+        :param float latency: duration of the request, in seconds
+        """
+        with self._lock:
+            latencies = self._latencies.get(route)
+            if latencies is None:
+                latencies = self._latencies[route] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def percentile(self, route: str, percentile: float = 0.95) -> float:
+        """Returns a latency percentile of a route.
+
+        :param str route: route template
+        :param float percentile: percentile between 0 and 1
+
+        :returns: latency in seconds or None if there are not enough samples
+        :rtype: float
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(route, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        return latencies[min(len(latencies) - 1, int(percentile * len(latencies)))]
+
+    def routes(self) -> dict:
+        """Returns the p50 and p95 latencies of the routes with enough samples.
+
+        :rtype: dict
+        """
+        with self._lock:
+            li_routes = list(self._latencies)
+        return {
+            route: {
+                "p50": self.percentile(route, 0.5),
+                "p95": self.percentile(route, 0.95),
+            }
+            for route in li_routes
+            if self.percentile(route) is not None
+        }
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    tracker = IsogeoLatencyTracker(min_samples=1)
+    for i in range(100):
+        tracker.record("resources/search", i / 100)
+    print(tracker.routes())
@@ -0,0 +1,369 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Adaptive concurrency limiter and retry budget for requests sent to Isogeo API."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import random
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+PRIORITIES = ("interactive", "batch")
+
+# priority of the requests sent in the current context. None means interactive, except for
+# the pages of fan-out operations which are sent as batch.
+_priority = ContextVar("isogeo_priority", default=None)
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def current_priority() -> str:
+    """Returns the priority set in the current context, or None if it's not set.
+
+    :rtype: str
+    """
+    return _priority.get()
+
+
+@contextmanager
+def priority(name: str):
+    """Context manager setting the priority of the requests sent within:
+
+    - 'interactive': user-facing requests, served first and allowed to use all the \
+        concurrency of the client;
+    - 'batch': background requests (harvests...), limited to a share of the concurrency and \
+        waiting while interactive requests are queued.
+
+    Pages of `whole_results` operations are sent as batch unless a priority is set.
+
+    :param str name: priority name. Must be one of PRIORITIES.
+
+    :Example:
+
+    .. code-block:: python
+
+        with isogeo.priority("batch"):
+            harvest = isogeo.search(include="all", whole_results=1)
+        # meanwhile, in another thread
+        md = isogeo.metadata.get(md_id)  # interactive by default
+    """
+    if name not in PRIORITIES:
+        raise ValueError(
+            "Priority must be one of: {}, not {}".format(" | ".join(PRIORITIES), name)
+        )
+    token = _priority.set(name)
+    try:
+        yield name
+    finally:
+        _priority.reset(token)
+
+
+def parse_retry_after(value: str) -> float:
+    """Convert the value of a `Retry-After` header into a delay in seconds.
+
+    :param str value: header value, a count of seconds or an HTTP date
+
+    :returns: delay in seconds or None if the value can't be read
+    :rtype: float
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug("Unreadable Retry-After header: %s", value)
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoLimiter(object):
+    """Client-wide limit of concurrent requests, adjusted with an AIMD (Additive Increase, \
+    Multiplicative Decrease) algorithm:
+
+    - while responses come back as fast as usual, the limit grows by about one request \
+        per round-trip;
+    - on throttling (429), server errors (502, 503, 504) or timeouts, the limit is cut \
+        (halved by default), at most once per round-trip.
+
+    "As fast as usual" means a latency below `latency_tolerance` times the baseline latency, \
+    which is the lowest latency observed, slowly drifting up to follow the API.
+
+    Requests have a priority (see :func:`priority`): batch requests can only use \
+    `batch_ratio` of the limit and wait while interactive requests are queued, so that \
+    background harvests don't starve user-facing calls.
+
+    It also holds the retry budget: each request deposits `retry_ratio` token, each retry \
+    withdraws one, so retries can't multiply the load when the API is struggling.
+
+    :param int max_limit: maximum count of concurrent requests
+    :param int min_limit: minimum count of concurrent requests
+    :param int initial_limit: count of concurrent requests allowed at start
+    :param float decrease_factor: factor applied to the limit on overload
+    :param float latency_tolerance: latency ratio to the baseline considered as healthy
+    :param float batch_ratio: share of the limit usable by batch requests
+    :param float retry_ratio: retry tokens deposited by each request
+    :param float retry_reserve: retry tokens available at start and minimum budget cap
+    :param float backoff_base: base delay of the exponential backoff, in seconds
+    :param float backoff_max: maximum delay of the exponential backoff, in seconds
+
+    :Example:
+
+    .. code-block:: python
+
+        # the limiter of a client
+        print(isogeo.limiter)
+        # using it to protect a function
+        limiter = IsogeoLimiter(max_limit=20)
+        limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = send()
+        finally:
+            limiter.release(time.monotonic() - start, overloaded=response.status_code == 429)
+    """
+
+    def __init__(
+        self,
+        max_limit: int = 50,
+        min_limit: int = 1,
+        initial_limit: int = 10,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        batch_ratio: float = 0.75,
+        retry_ratio: float = 0.2,
+        retry_reserve: float = 10,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+    ):
+        """Instanciate the limiter."""
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError(
+                "Limits must verify 1 <= min_limit ({}) <= max_limit ({})".format(
+                    min_limit, max_limit
+                )
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("'decrease_factor' must be between 0 and 1.")
+        if not 0 < batch_ratio <= 1:
+            raise ValueError("'batch_ratio' must be between 0 (excluded) and 1.")
+
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.batch_ratio = batch_ratio
+        self.retry_ratio = retry_ratio
+        self.retry_reserve = retry_reserve
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.in_flight = 0
+        self.in_flight_batch = 0
+        self.baseline_latency = None
+        self.retry_balance = float(retry_reserve)
+        self.wait_time = 0.0  # cumulated time spent waiting for a slot, in seconds
+
+        self._condition = threading.Condition()
+        self._last_decrease = 0.0
+        self._paused_until = 0.0
+        self._waiting_interactive = 0
+
+    def __repr__(self) -> str:
+        return "<IsogeoLimiter: limit={:.1f} in flight={} (batch: {}) retry budget={:.1f}>".format(
+            self.limit, self.in_flight, self.in_flight_batch, self.retry_balance
+        )
+
+    @property
+    def concurrency(self) -> int:
+        """Count of requests currently allowed to run at the same time."""
+        return int(self.limit)
+
+    # -- SLOTS ----------------------------------------------------------------
+    def acquire(self, timeout: float = None, priority: str = None) -> bool:
+        """Wait for a slot to send a request.
+
+        :param float timeout: maximum time to wait, in seconds. Wait forever if None.
+        :param str priority: priority of the request. Defaults to the one of the current \
+            context or 'interactive'.
+
+        :returns: True if a slot has been acquired, False on timeout
+        :rtype: bool
+        """
+        batch = (priority or _priority.get()) == "batch"
+        start = monotonic()
+        deadline = None if timeout is None else start + timeout
+        with self._condition:
+            if not batch:
+                self._waiting_interactive += 1
+            try:
+                while True:
+                    now = monotonic()
+                    if now >= self._paused_until and self._has_slot(batch):
+                        self.in_flight += 1
+                        if batch:
+                            self.in_flight_batch += 1
+                        self.wait_time += now - start
+                        return True
+                    if deadline is not None and now >= deadline:
+                        self.wait_time += now - start
+                        return False
+                    wait = None
+                    if self._paused_until > now:
+                        wait = self._paused_until - now
+                    if deadline is not None:
+                        wait = deadline - now if wait is None else min(wait, deadline - now)
+                    self._condition.wait(wait)
+            finally:
+                if not batch:
+                    self._waiting_interactive -= 1
+                    # batch requests may have been held by this one
+                    self._condition.notify_all()
+
+    def _has_slot(self, batch: bool) -> bool:
+        """Check if a request of the given lane can be sent now. Lock must be held."""
+        if self.in_flight >= int(self.limit):
+            return False
+        if not batch:
+            return True
+        return self._waiting_interactive == 0 and self.in_flight_batch < max(
+            1, int(self.limit * self.batch_ratio)
+        )
+
+    def release(self, latency: float, overloaded: bool = False, priority: str = None):
+        """Release a slot and adjust the limit depending on the request outcome.
+
+        :param float latency: duration of the request, in seconds
+        :param bool overloaded: True if the API was throttling, failing or timing out
+        :param str priority: priority of the request, as passed to :py:meth:`acquire`
+        """
+        with self._condition:
+            self._free(priority)
+            if overloaded:
+                self._decrease(latency)
+            else:
+                self._increase(latency)
+            self._condition.notify_all()
+
+    def cancel(self, priority: str = None):
+        """Release a slot without adjusting the limit, when the request has not been sent.
+
+        :param str priority: priority of the request, as passed to :py:meth:`acquire`
+        """
+        with self._condition:
+            self._free(priority)
+            self._condition.notify_all()
+
+    def _free(self, priority: str = None):
+        """Decrement the counts of requests in flight. Lock must be held."""
+        self.in_flight = max(0, self.in_flight - 1)
+        if (priority or _priority.get()) == "batch":
+            self.in_flight_batch = max(0, self.in_flight_batch - 1)
+
+    def _increase(self, latency: float):
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+        else:
+            # drift slowly to follow the API latency on the long run
+            self.baseline_latency += (latency - self.baseline_latency) * 0.01
+        if latency <= self.baseline_latency * self.latency_tolerance:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _decrease(self, latency: float):
+        now = monotonic()
+        # responses of requests sent before the previous cut don't cut again
+        if now - self._last_decrease < max(latency, self.baseline_latency or 0, 0.1):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        logger.debug(
+            "API overloaded: concurrency limit decreased from %.1f to %.1f", previous, self.limit
+        )
+
+    def pause(self, delay: float):
+        """Hold all new requests during a delay, typically given by a `Retry-After` header.
+
+        :param float delay: delay in seconds
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, monotonic() + delay)
+        logger.info("API asked to wait %.1fs before next requests.", delay)
+
+    # -- RETRIES --------------------------------------------------------------
+    def deposit(self):
+        """Credit the retry budget for a new request."""
+        with self._condition:
+            self.retry_balance = min(
+                max(self.retry_reserve, self.max_limit),
+                self.retry_balance + self.retry_ratio,
+            )
+
+    def withdraw(self) -> bool:
+        """Take a token from the retry budget.
+
+        :returns: True if a retry is allowed
+        :rtype: bool
+        """
+        with self._condition:
+            if self.retry_balance < 1:
+                logger.warning("Retry budget exhausted: request is not retried.")
+                return False
+            self.retry_balance -= 1
+            return True
+
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        """Delay before a retry: exponential backoff with full jitter, or the delay asked by \
+        the API if it's longer.
+
+        :param int attempt: count of attempts already made, starting at 0
+        :param float retry_after: delay asked by the API, in seconds
+
+        :rtype: float
+        """
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    limiter = IsogeoLimiter(max_limit=20)
+    for _ in range(50):
+        limiter.acquire()
+        limiter.release(0.1)
+    print(limiter)
+    limiter.acquire()
+    limiter.release(1, overloaded=True)
+    print(limiter, parse_retry_after("120"))
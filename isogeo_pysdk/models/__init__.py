@@ -22,6 +22,7 @@ from .limitation import Limitation  # noqa: F401
 from .link import Link  # noqa: F401
 from .metadata import Metadata  # noqa: F401
 from .metadata_search import MetadataSearch  # noqa: F401
+from .search_query import SearchQuery  # noqa: F401
 from .share import Share  # noqa: F401
 from .service_layer import ServiceLayer  # noqa: F401
 from .service_operation import ServiceOperation  # noqa: F401
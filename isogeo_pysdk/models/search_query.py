@@ -0,0 +1,170 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""
+    Isogeo API v1 - Model of a parsed search query (the `q` parameter)
+
+    See: http://help.isogeo.com/api/complete/index.html#definition-search
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# standard library
+import pprint
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+class SearchQuery(object):
+    """Immutable and hashable representation of a search query, parsed once and cached.
+
+    The query is split into terms (free text) and filters (`filter:value` tokens). Two queries \
+    with the same tokens in a different order are equal, since the API applies an *AND* operator \
+    between them: :py:attr:`normalized` can be used as a cache key.
+
+    :Example:
+
+    .. code-block:: python
+
+        >>> query = SearchQuery.from_string("oil type:vector-dataset format:shp")
+        >>> query.terms
+        ('oil',)
+        >>> query.filters.get("type")
+        ('vector-dataset',)
+        >>> query == SearchQuery.from_string("format:shp oil type:vector-dataset")
+        True
+    """
+
+    __slots__ = ("_raw", "_tokens", "_terms", "_filters", "_normalized")
+
+    def __init__(self, q: str = ""):
+        """Parse a search query. Prefer :py:meth:`from_string` which caches parsed queries.
+
+        :param str q: search terms and semantic filters, as passed to the `q` parameter
+        """
+        if not isinstance(q, str):
+            raise TypeError("'q' expects a str, not {}".format(type(q)))
+
+        tokens = tuple(q.split())
+        terms = []
+        filters = {}
+        for token in tokens:
+            head, sep, value = token.partition(":")
+            if sep:
+                filters.setdefault(head, []).append(value)
+            else:
+                terms.append(token)
+
+        setter = super(SearchQuery, self).__setattr__
+        setter("_raw", q)
+        setter("_tokens", tokens)
+        setter("_terms", tuple(terms))
+        setter(
+            "_filters",
+            MappingProxyType({head: tuple(values) for head, values in filters.items()}),
+        )
+        setter("_normalized", " ".join(sorted(tokens)))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def from_string(cls, q: str = ""):
+        """Parse a search query string, returning the same object for the same string.
+
+        :param str q: search terms and semantic filters
+
+        :rtype: SearchQuery
+        """
+        return cls(q)
+
+    # -- PROPERTIES --------------------------------------------------------------------
+    @property
+    def raw(self) -> str:
+        """Query as it was passed.
+
+        :rtype: str
+        """
+        return self._raw
+
+    @property
+    def tokens(self) -> tuple:
+        """Tokens of the query, in the original order.
+
+        :rtype: tuple
+        """
+        return self._tokens
+
+    @property
+    def terms(self) -> tuple:
+        """Free text terms of the query.
+
+        :rtype: tuple
+        """
+        return self._terms
+
+    @property
+    def filters(self) -> MappingProxyType:
+        """Read-only mapping of filters names (part before the first colon) with their values \
+        (part after the first colon). Example: {"keyword": ("isogeo:2018",)}
+
+        :rtype: MappingProxyType
+        """
+        return self._filters
+
+    @property
+    def normalized(self) -> str:
+        """Query with its tokens sorted, suitable as a cache key.
+
+        :rtype: str
+        """
+        return self._normalized
+
+    # -- METHODS -----------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        """Returns the model properties as a dict."""
+        return {
+            "raw": self._raw,
+            "terms": list(self._terms),
+            "filters": {k: list(v) for k, v in self._filters.items()},
+        }
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model."""
+        return pprint.pformat(self.to_dict())
+
+    def __repr__(self) -> str:
+        """For `print` and `pprint`"""
+        return "SearchQuery({!r})".format(self._raw)
+
+    def __str__(self) -> str:
+        return self._raw
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SearchQuery is immutable.")
+
+    def __hash__(self) -> int:
+        return hash(self._normalized)
+
+    def __eq__(self, other) -> bool:
+        """Returns true if both objects are equal."""
+        if not isinstance(other, SearchQuery):
+            return False
+
+        return self._normalized == other._normalized
+
+    def __ne__(self, other) -> bool:
+        """Returns true if both objects are not equal."""
+        return not self == other
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """standalone execution."""
+    query = SearchQuery.from_string("oil type:vector-dataset")
+    print(query.to_str())
@@ -0,0 +1,470 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Profiling of the SDK operations: CPU profile (cProfile), memory allocations (tracemalloc) and \
+split of the wall time between network and CPU, per route method call.
+
+Profiling is enabled for a block with :class:`IsogeoProfiler` or for the whole process with the \
+`ISOGEO_PROFILE` environment variable, set to the folder where the reports are written at exit:
+
+.. code-block:: shell
+
+    ISOGEO_PROFILE=./profile python my_harvest.py
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import atexit
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from os import environ
+from pathlib import Path
+from time import perf_counter, thread_time
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# profiler of the current context and operation being profiled. Context variables are copied
+# to the scheduler workers so the pages of a search are profiled with the search.
+_profiler = ContextVar("isogeo_profiler", default=None)
+_operation = ContextVar("isogeo_profiled_operation", default=None)
+# a thread runs one cProfile at once: nested operations are part of the outer one
+_thread = threading.local()
+
+# profiler of the whole process, created at the first operation if ISOGEO_PROFILE is set
+_env_profiler = None
+_env_lock = threading.Lock()
+
+# allocations made by the profiling itself are not reported
+_MEMORY_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, pstats.__file__),
+)
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def _current_profiler():
+    """Returns the profiler of the current context, or the one of the process enabled by the \
+    `ISOGEO_PROFILE` environment variable, or None."""
+    global _env_profiler
+
+    profiler = _profiler.get()
+    if profiler is not None or not environ.get("ISOGEO_PROFILE"):
+        return profiler
+    with _env_lock:
+        if _env_profiler is None:
+            _env_profiler = IsogeoProfiler().start()
+            atexit.register(_env_profiler.dump, environ.get("ISOGEO_PROFILE"))
+            logger.info(
+                "SDK profiling enabled, reports will be written into: %s",
+                environ.get("ISOGEO_PROFILE"),
+            )
+    return _env_profiler
+
+
+@contextmanager
+def profile_operation(name: str):
+    """Profile an operation if a profiler is enabled. Used by \
+    :class:`~isogeo_pysdk.decorators.ApiDecorators` on the route methods.
+
+    :param str name: name of the operation (qualified name of the method)
+    """
+    profiler = _current_profiler()
+    if profiler is None or getattr(_thread, "profiling", False):
+        yield None
+        return
+
+    _thread.profiling = True
+    operation = _ProfiledOperation(name, _operation.get())
+    token = _operation.set(operation)
+    memory = profiler.memory and tracemalloc.is_tracing()
+    if memory:
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        memory_start = tracemalloc.get_traced_memory()[0]
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Python 3.12+: only one profiler at once in the process
+        profile = None
+    wall_start, cpu_start = perf_counter(), thread_time()
+    try:
+        yield operation
+    finally:
+        operation.wall = perf_counter() - wall_start
+        operation.cpu = thread_time() - cpu_start
+        if profile is not None:
+            profile.disable()
+        if memory:
+            operation.memory_peak = tracemalloc.get_traced_memory()[1] - memory_start
+            operation.memory_top = [
+                str(stat)
+                for stat in tracemalloc.take_snapshot()
+                .filter_traces(_MEMORY_FILTERS)
+                .compare_to(snapshot, "lineno")[: profiler.top]
+            ]
+        _operation.reset(token)
+        _thread.profiling = False
+        profiler.add(operation, profile)
+
+
+def record_network(elapsed: float):
+    """Add the time spent waiting for a response to the operations being profiled. Called by \
+    :class:`~isogeo_pysdk.isogeo.Isogeo` for each request sent to the API.
+
+    :param float elapsed: time between the request and the response, in seconds
+    """
+    operation = _operation.get()
+    while operation is not None:
+        operation.add_request(elapsed)
+        operation = operation.parent
+
+
+def _frame_label(func: tuple) -> str:
+    """Label of a function in collapsed stacks: `module.py:function`.
+
+    :param tuple func: function key in profile stats: (filename, line, name)
+    """
+    filename, _, name = func
+    if filename == "~":
+        label = name
+    else:
+        label = "{}:{}".format(Path(filename).name, name)
+    return label.replace(";", ",").replace(" ", "_")
+
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class _ProfiledOperation(object):
+    """Measures of an operation."""
+
+    __slots__ = (
+        "name",
+        "parent",
+        "wall",
+        "cpu",
+        "network",
+        "requests",
+        "memory_peak",
+        "memory_top",
+        "_lock",
+    )
+
+    def __init__(self, name: str, parent=None):
+        self.name = name
+        self.parent = parent
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.network = 0.0
+        self.requests = 0
+        self.memory_peak = None
+        self.memory_top = []
+        self._lock = threading.Lock()
+
+    def add_request(self, elapsed: float):
+        with self._lock:
+            self.network += elapsed
+            self.requests += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "network": self.network,
+            "requests": self.requests,
+            "memory_peak": self.memory_peak,
+            "memory_top": list(self.memory_top),
+        }
+
+
+class IsogeoProfiler(object):
+    """Context manager profiling the route methods called within a block (searches, metadata \
+    reads...), including their parts run by the scheduler workers (pages of whole_results \
+    searches...).
+
+    For each operation, it measures:
+
+    - the wall time, the CPU time of its thread and the time spent waiting for the API \
+        responses (network). Network times of concurrent requests are summed up, so they can \
+        exceed the wall time;
+    - a CPU profile (cProfile), merged for all operations: JSON decoding, models, tags...
+    - the memory allocated (tracemalloc), with the lines allocating the most.
+
+    Operations nested in another one in the same thread are part of the outer one. With Python \
+    3.12+, only one thread is profiled by cProfile at once.
+
+    :param bool memory: trace the memory allocations. It slows the operations down.
+    :param int top: count of functions and allocation lines in reports
+
+    :Example:
+
+    .. code-block:: python
+
+        with isogeo.profile() as profiler:
+            search = isogeo.search(whole_results=1, include="all", tags_as_dicts=1)
+
+        print(profiler.summary())
+        profiler.dump_stats("harvest.pstats")  # snakeviz, gprof2dot...
+        profiler.dump_collapsed("harvest.collapsed")  # flamegraph.pl, speedscope...
+    """
+
+    def __init__(self, memory: bool = True, top: int = 15):
+        """Instanciate the profiler."""
+        self.memory = memory
+        self.top = top
+        self.operations = []
+
+        self._stats = None
+        self._lock = threading.Lock()
+        self._token = None
+        self._tracemalloc_started = False
+
+    def __repr__(self) -> str:
+        return "<IsogeoProfiler: {} operations>".format(len(self.operations))
+
+    def __enter__(self):
+        self.start()
+        self._token = _profiler.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _profiler.reset(self._token)
+        self._token = None
+        self.stop()
+        return False
+
+    def start(self):
+        """Start tracing the memory allocations, if enabled and not already done."""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracemalloc_started = True
+        return self
+
+    def stop(self):
+        """Stop tracing the memory allocations if the profiler started it."""
+        if self._tracemalloc_started:
+            tracemalloc.stop()
+            self._tracemalloc_started = False
+
+    def add(self, operation: _ProfiledOperation, profile: cProfile.Profile = None):
+        """Add the measures of an operation.
+
+        :param _ProfiledOperation operation: operation measures
+        :param cProfile.Profile profile: CPU profile of the operation
+        """
+        with self._lock:
+            self.operations.append(operation.to_dict())
+            if profile is None:
+                return
+            try:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+            except TypeError:
+                # nothing has been profiled
+                pass
+
+    # -- REPORTING ------------------------------------------------------------
+    @property
+    def by_operation(self) -> dict:
+        """Measures summed up by operation name: calls, wall, cpu, network, requests, \
+        memory_peak (maximum).
+
+        :rtype: dict
+        """
+        totals = {}
+        with self._lock:
+            for operation in self.operations:
+                total = totals.setdefault(
+                    operation.get("name"),
+                    {"calls": 0, "wall": 0.0, "cpu": 0.0, "network": 0.0, "requests": 0},
+                )
+                total["calls"] += 1
+                for key in ("wall", "cpu", "network", "requests"):
+                    total[key] += operation.get(key)
+                if operation.get("memory_peak") is not None:
+                    total["memory_peak"] = max(
+                        total.get("memory_peak", 0), operation.get("memory_peak")
+                    )
+        return totals
+
+    def stats(self, stream=None) -> pstats.Stats:
+        """CPU profile of all the operations, or None if nothing has been profiled.
+
+        :param stream: stream where the stats are printed
+
+        :rtype: pstats.Stats
+        """
+        with self._lock:
+            if self._stats is None:
+                return None
+            stats = pstats.Stats(stream=stream)
+            stats.add(self._stats)
+        return stats
+
+    def summary(self) -> str:
+        """Text report: measures by operation, functions with the most cumulative time and \
+        lines allocating the most memory in the most consuming operation.
+
+        :rtype: str
+        """
+        lines = [
+            repr(self),
+            "{:<40} {:>6} {:>9} {:>9} {:>9} {:>8} {:>11}".format(
+                "operation", "calls", "wall", "cpu", "network", "requests", "memory peak"
+            ),
+        ]
+        for name, total in sorted(self.by_operation.items(), key=lambda i: -i[1].get("wall")):
+            memory_peak = total.get("memory_peak")
+            lines.append(
+                "{:<40} {:>6} {:>8.3f}s {:>8.3f}s {:>8.3f}s {:>8} {:>11}".format(
+                    name,
+                    total.get("calls"),
+                    total.get("wall"),
+                    total.get("cpu"),
+                    total.get("network"),
+                    total.get("requests"),
+                    "-" if memory_peak is None else "{:.1f} KiB".format(memory_peak / 1024),
+                )
+            )
+
+        buffer = io.StringIO()
+        stats = self.stats(stream=buffer)
+        if stats is not None:
+            stats.sort_stats("cumulative").print_stats(self.top)
+            lines.extend(("", buffer.getvalue().strip()))
+
+        with self._lock:
+            traced = [op for op in self.operations if op.get("memory_peak") is not None]
+        if traced:
+            largest = max(traced, key=lambda op: op.get("memory_peak"))
+            lines.extend(
+                (
+                    "",
+                    "Memory allocated by {} (peak: {:.1f} KiB):".format(
+                        largest.get("name"), largest.get("memory_peak") / 1024
+                    ),
+                )
+            )
+            lines.extend("  {}".format(line) for line in largest.get("memory_top"))
+        return "\n".join(lines)
+
+    def collapsed_stacks(self) -> list:
+        """CPU profile as collapsed stacks (`frame;frame;frame microseconds`), the input of \
+        flame graph tools (flamegraph.pl, speedscope, inferno...). cProfile only records \
+        callers and callees, so the time of functions called from several places is shared \
+        between their call paths in proportion to the calls.
+
+        :rtype: list
+        """
+        stats = self.stats()
+        if stats is None:
+            return []
+        callees = {}
+        for func, (_, _, _, _, callers) in stats.stats.items():
+            for caller, edge in callers.items():
+                callees.setdefault(caller, []).append((func, edge[3]))
+        min_time = 1e-6
+        stacks = {}
+
+        def _walk(func: tuple, path: tuple, time_share: float):
+            _, _, own_time, total_time, _ = stats.stats.get(func)
+            ratio = time_share / total_time if total_time else 0
+            path = path + (_frame_label(func),)
+            own = own_time * ratio
+            if own >= min_time:
+                key = ";".join(path)
+                stacks[key] = stacks.get(key, 0) + own
+            if len(path) > 100:
+                return
+            for callee, edge_time in callees.get(func, ()):
+                share = edge_time * ratio
+                if share >= min_time and _frame_label(callee) not in path:
+                    _walk(callee, path, share)
+
+        # roots: time not spent under a profiled caller (called by the functions running when
+        # the profile started)
+        for func, (_, _, _, total_time, callers) in stats.stats.items():
+            under_callers = sum(
+                edge[3] for caller, edge in callers.items() if caller in stats.stats
+            )
+            if total_time - under_callers >= min_time:
+                _walk(func, (), total_time - under_callers)
+        return [
+            "{} {}".format(stack, round(seconds * 1e6))
+            for stack, seconds in sorted(stacks.items())
+            if round(seconds * 1e6)
+        ]
+
+    def dump_stats(self, path: str):
+        """Write the CPU profile in the pstats format (snakeviz, gprof2dot, pstats...).
+
+        :param str path: output file path
+        """
+        stats = self.stats()
+        if stats is None:
+            logger.warning("Nothing has been profiled.")
+            return
+        stats.dump_stats(str(path))
+
+    def dump_collapsed(self, path: str):
+        """Write the CPU profile as collapsed stacks. See :py:meth:`collapsed_stacks`.
+
+        :param str path: output file path
+        """
+        Path(path).write_text("\n".join(self.collapsed_stacks()) + "\n", encoding="utf-8")
+
+    def dump(self, folder: str) -> tuple:
+        """Write all the reports into a folder: summary (`isogeo_profile.txt`), CPU profile \
+        (`isogeo_profile.pstats`) and collapsed stacks (`isogeo_profile.collapsed`).
+
+        :param str folder: output folder, created if needed
+
+        :returns: paths of the reports
+        :rtype: tuple
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        paths = tuple(
+            folder / "isogeo_profile{}".format(ext) for ext in (".txt", ".pstats", ".collapsed")
+        )
+        paths[0].write_text(self.summary() + "\n", encoding="utf-8")
+        self.dump_stats(paths[1])
+        self.dump_collapsed(paths[2])
+        logger.info("SDK profiling reports written into: %s", folder)
+        return paths
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    import json
+
+    with IsogeoProfiler() as profiler:
+        with profile_operation("json_roundtrip"):
+            json.loads(json.dumps([{"_id": i, "tags": {"a": "b"}} for i in range(10000)]))
+    print(profiler.summary())
@@ -0,0 +1,142 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Disk-backed storage for big search results."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import logging
+import tempfile
+import threading
+from array import array
+from collections.abc import Sequence
+from typing import Iterable
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoDiskResults(Sequence):
+    """Read-only sequence of records (dicts) stored in a temporary JSON Lines file. Only the
+    offsets of the lines are kept in memory, records being loaded lazily when accessed.
+
+    It's used by :py:meth:`~isogeo_pysdk.api.routes_search.ApiSearch.search` to spill the results
+    of huge searches to disk (see `max_memory_results` option). The temporary file is deleted
+    when the object is closed or garbage collected.
+
+    :param str directory: folder where to create the temporary file. Defaults to the system one.
+
+    :Example:
+
+    .. code-block:: python
+
+        search = isogeo.search(include="all", whole_results=1, max_memory_results=5000)
+        print(len(search.results))
+        for md in search.results:  # metadata are loaded one by one
+            print(md.get("title"))
+        first_md = search.results[0]
+        search.results.close()  # delete the temporary file
+    """
+
+    def __init__(self, directory: str = None):
+        """Instanciate the store and create the temporary file."""
+        self._file = tempfile.TemporaryFile(
+            mode="w+b", prefix="isogeo_results_", suffix=".jsonl", dir=directory
+        )
+        self._lock = threading.Lock()
+        self._offsets = array("q")  # start position of each record in the file
+        self._end = 0  # position of the end of the file
+        logger.debug("Search results are spilled to a temporary file.")
+
+        super(IsogeoDiskResults, self).__init__()
+
+    # -- SEQUENCE PROTOCOL ----------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("results index out of range")
+        with self._lock:
+            self._file.seek(self._offsets[index])
+            line = self._file.readline()
+        return json.loads(line)
+
+    def __iter__(self):
+        # reading by blocks of lines is much faster than seeking each record
+        count = len(self)
+        position = 0
+        index = 0
+        while index < count:
+            with self._lock:
+                self._file.seek(position)
+                lines = self._file.readlines(1048576)
+                position = self._file.tell()
+            for line in lines:
+                if index >= count:
+                    break
+                index += 1
+                yield json.loads(line)
+
+    def __repr__(self) -> str:
+        return "<IsogeoDiskResults: {} records>".format(len(self))
+
+    def __del__(self):
+        self.close()
+
+    # -- METHODS --------------------------------------------------------------
+    @property
+    def closed(self) -> bool:
+        """True if the temporary file has been deleted."""
+        return self._file.closed
+
+    def extend(self, records: Iterable[dict]):
+        """Append records at the end of the store.
+
+        :param Iterable records: records to append, typically a search results page
+        """
+        with self._lock:
+            self._file.seek(self._end)
+            for record in records:
+                self._offsets.append(self._end)
+                line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+                self._file.write(line)
+                self._end += len(line)
+
+    def append(self, record: dict):
+        """Append one record at the end of the store.
+
+        :param dict record: record to append
+        """
+        self.extend((record,))
+
+    def close(self):
+        """Delete the temporary file. The store can't be read anymore."""
+        file = getattr(self, "_file", None)
+        if file is not None and not file.closed:
+            file.close()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    store = IsogeoDiskResults()
+    store.extend([{"_id": "a"}, {"_id": "b"}])
+    print(store, list(store))
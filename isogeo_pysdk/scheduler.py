@@ -0,0 +1,139 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Long-lived executor shared by the operations of a client which send requests concurrently."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import contextvars
+import logging
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoScheduler(Executor):
+    """Executor shared by all the fan-out operations of an :class:`~isogeo_pysdk.isogeo.Isogeo` \
+    client (paginated searches, keywords...). Its workers are started on first use and live until \
+    :py:meth:`shutdown`, so the total of concurrent requests is capped whatever the count of \
+    operations running at the same time.
+
+    A task submitted from one of its own workers (a fan-out inside a fan-out) is executed \
+    immediately in the calling thread, to avoid workers waiting for tasks which can't start.
+
+    Tasks run in a copy of the submitter context, so context variables (deadlines...) are \
+    propagated to the workers.
+
+    :param int max_workers: maximum count of tasks executed at the same time. It should not \
+        exceed the size of the connections pool.
+    :param str thread_name_prefix: prefix of the workers threads names
+
+    :Example:
+
+    .. code-block:: python
+
+        scheduler = IsogeoScheduler(max_workers=10)
+        futures = [scheduler.submit(isogeo.metadata.get, md_id) for md_id in li_md_ids]
+        li_md = [future.result() for future in futures]
+        scheduler.shutdown()
+    """
+
+    def __init__(self, max_workers: int = 10, thread_name_prefix: str = "IsogeoWorker"):
+        """Instanciate the scheduler. Threads are created later, when tasks are submitted."""
+        if max_workers < 1:
+            raise ValueError(
+                "'max_workers' must be a positive integer, not {}".format(max_workers)
+            )
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shutdown = False
+
+    def __repr__(self) -> str:
+        return "<IsogeoScheduler: max_workers={}, {}>".format(
+            self.max_workers,
+            "shut down"
+            if self._shutdown
+            else "started"
+            if self._executor
+            else "idle",
+        )
+
+    def _mark_worker(self):
+        """Initializer of the workers threads."""
+        self._local.is_worker = True
+
+    @property
+    def in_worker(self) -> bool:
+        """True if the current thread is one of the scheduler workers."""
+        return getattr(self._local, "is_worker", False)
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedule a callable to be executed.
+
+        :param callable fn: function to execute
+        :param args: positional arguments passed to the function
+        :param kwargs: keyword arguments passed to the function
+
+        :rtype: concurrent.futures.Future
+        """
+        if self.in_worker:
+            future = Future()
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+            return future
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            if self._executor is None:
+                logger.debug("Starting scheduler with %s workers.", self.max_workers)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix,
+                    initializer=self._mark_worker,
+                )
+            return self._executor.submit(
+                contextvars.copy_context().run, fn, *args, **kwargs
+            )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Stop the workers. Pending tasks are executed unless `cancel_futures` is True.
+
+        :param bool wait: wait for the running tasks to end
+        :param bool cancel_futures: cancel the tasks which are not started yet
+        """
+        with self._lock:
+            self._shutdown = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            logger.debug("Shutting down scheduler.")
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    scheduler = IsogeoScheduler(max_workers=2)
+    print([f.result() for f in [scheduler.submit(pow, 2, i) for i in range(5)]])
+    scheduler.shutdown()
@@ -0,0 +1,118 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Deduplication of identical calls running at the same time (single-flight)."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Hashable
+
+# modules
+from isogeo_pysdk.exceptions import DeadlineExceededError
+from isogeo_pysdk.latency import remaining_time
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoSingleFlight(object):
+    """Run only one call at a time for a given key: callers arriving while a call with the \
+    same key is in flight wait for it and get its result (or its exception) instead of \
+    running their own.
+
+    It's used by :class:`~isogeo_pysdk.isogeo.Isogeo` (`coalesce_requests` option) to coalesce \
+    identical GET requests sent concurrently (same URL, parameters and authentication), for example by the threads \
+    of a web application or by coroutines using the `*_async` methods.
+
+    :Example:
+
+    .. code-block:: python
+
+        single_flight = IsogeoSingleFlight()
+        result, shared = single_flight.do("shares", isogeo.share.listing)
+    """
+
+    def __init__(self):
+        """Instanciate the in-flight calls registry."""
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.shared = 0  # count of calls which reused the result of another
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __repr__(self) -> str:
+        return "<IsogeoSingleFlight: {} in flight, {} shared>".format(
+            len(self), self.shared
+        )
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> tuple:
+        """Call the function unless a call with the same key is in flight.
+
+        :param Hashable key: key identifying identical calls
+        :param Callable fn: function to call
+        :param args: positional arguments passed to the function
+        :param kwargs: keyword arguments passed to the function
+
+        :returns: the result and a boolean True if it was shared with another caller
+        :rtype: tuple
+
+        :raises DeadlineExceededError: if the deadline of the current context (see \
+            :func:`~isogeo_pysdk.latency.deadline`) is passed while waiting for the call in flight
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            # the key may hold credentials (token of the request): only its hash is logged
+            logger.debug("Waiting for the identical call in flight (key hash: %x).", hash(key))
+            remaining = remaining_time()
+            try:
+                return future.result(None if remaining is None else max(0, remaining)), True
+            except FutureTimeoutError:
+                if future.done():
+                    # raised by the call itself
+                    raise
+                raise DeadlineExceededError(
+                    "Deadline exceeded while waiting for the identical call in flight."
+                ) from None
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    single_flight = IsogeoSingleFlight()
+    print(single_flight.do("key", sum, (1, 2)), single_flight)
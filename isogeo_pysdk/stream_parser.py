@@ -0,0 +1,263 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Incremental JSON parser used to stream big API responses (search pages)."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import codecs
+import json
+import logging
+import re
+from typing import Callable, Union
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+_regex_whitespaces = re.compile(r"[ \t\n\r]*")
+
+# parser states
+_STATE_START = 0  # expecting the opening brace of the root object
+_STATE_KEY = 1  # expecting a member key or the closing brace
+_STATE_COLON = 2  # expecting the colon between key and value
+_STATE_VALUE = 3  # expecting a member value
+_STATE_ITEM = 4  # inside the streamed array, expecting an item or the closing bracket
+_STATE_ITEM_SEP = 5  # inside the streamed array, expecting a comma or the closing bracket
+_STATE_MEMBER_SEP = 6  # expecting a comma or the closing brace
+_STATE_END = 7  # root object closed
+
+# compact the internal buffer once this count of characters has been consumed
+_BUFFER_COMPACT_THRESHOLD = 65536
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class IsogeoStreamParser(object):
+    """Push parser for a JSON object whose one member is a (potentially huge) array, like the
+    responses of the search routes (`resources/search`, `keywords/search`...).
+
+    Items of the streamed array are returned one by one as soon as they are complete,
+    the other members are passed to the `on_member` callback. Only the pending part of the
+    response is kept in memory.
+
+    :param str array_key: key of the array member to stream. Defaults to 'results'.
+    :param callable on_member: function called with (key, value) for each other member of the root object.
+    :param callable item_hook: function applied to each item before returning it (projection...).
+
+    :Example:
+
+    .. code-block:: python
+
+        parser = IsogeoStreamParser(on_member=lambda k, v: print(k, v))
+        for chunk in response.iter_content(chunk_size=65536):
+            for md in parser.feed(chunk):
+                print(md.get("_id"))
+        parser.close()
+    """
+
+    def __init__(
+        self,
+        array_key: str = "results",
+        on_member: Callable = None,
+        item_hook: Callable = None,
+    ):
+        """Instanciate the parser."""
+        self.array_key = array_key
+        self.on_member = on_member
+        self.item_hook = item_hook
+
+        # internal state
+        self._buffer = ""
+        self._pos = 0
+        self._retry_at = 0  # buffer length required before trying again to decode
+        self._state = _STATE_START
+        self._current_key = None
+        self._array_started = False
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._finished = False
+
+        super(IsogeoStreamParser, self).__init__()
+
+    # -- PROPERTIES -----------------------------------------------------------
+    @property
+    def array_started(self) -> bool:
+        """True once the streamed array has been opened (or already closed)."""
+        return self._array_started
+
+    @property
+    def done(self) -> bool:
+        """True once the root object has been entirely parsed."""
+        return self._state == _STATE_END
+
+    # -- METHODS --------------------------------------------------------------
+    def feed(self, data: Union[bytes, str]) -> list:
+        """Feed the parser with a new chunk of the response.
+
+        :param bytes data: chunk of the response body (bytes are decoded as UTF-8)
+
+        :returns: list of items of the streamed array completed by this chunk
+        :rtype: list
+        """
+        if isinstance(data, bytes):
+            data = self._text_decoder.decode(data)
+        if data:
+            self._buffer += data
+        return self._parse()
+
+    def close(self) -> list:
+        """Signal the end of the response and return the last items.
+
+        :raises ValueError: if the response was truncated or is not a JSON object
+        :rtype: list
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        self._finished = True
+        self._retry_at = 0
+        items = self._parse()
+        if self._state != _STATE_END:
+            raise ValueError(
+                "Streamed JSON is incomplete (parser stopped at character {}).".format(
+                    self._pos
+                )
+            )
+        return items
+
+    def _skip_whitespaces(self):
+        self._pos = _regex_whitespaces.match(self._buffer, self._pos).end()
+
+    def _decode_value(self):
+        """Try to decode the JSON value starting at the current position.
+
+        :returns: (True, value) if the value is complete or (False, None) if more data is needed.
+        """
+        buffer_length = len(self._buffer)
+        if buffer_length < self._retry_at:
+            return False, None
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._finished:
+                raise
+            # wait until the pending segment has doubled to keep the parsing linear
+            self._retry_at = buffer_length + max(buffer_length - self._pos, 1)
+            return False, None
+        # a number at the very end of the buffer may be truncated
+        if end == buffer_length and not self._finished and self._buffer[-1].isdigit():
+            self._retry_at = buffer_length + 1
+            return False, None
+
+        self._retry_at = 0
+        self._pos = end
+        return True, value
+
+    def _expect(self, chars: str):
+        """Return the next significant character if it's one of expected ones, None if buffer
+        is exhausted, or raise a ValueError."""
+        self._skip_whitespaces()
+        if self._pos >= len(self._buffer):
+            return None
+        char = self._buffer[self._pos]
+        if char not in chars:
+            raise ValueError(
+                "Unexpected character '{}' at position {} (expected one of: {}).".format(
+                    char, self._pos, chars
+                )
+            )
+        return char
+
+    def _parse(self) -> list:
+        """Consume the buffer as far as possible."""
+        items = []
+        while self._state != _STATE_END:
+            if self._state == _STATE_START:
+                if self._expect("{") is None:
+                    break
+                self._pos += 1
+                self._state = _STATE_KEY
+            elif self._state == _STATE_KEY:
+                char = self._expect('"}')
+                if char is None:
+                    break
+                if char == "}":
+                    self._pos += 1
+                    self._state = _STATE_END
+                    continue
+                complete, key = self._decode_value()
+                if not complete:
+                    break
+                self._current_key = key
+                self._state = _STATE_COLON
+            elif self._state == _STATE_COLON:
+                if self._expect(":") is None:
+                    break
+                self._pos += 1
+                self._state = _STATE_VALUE
+            elif self._state == _STATE_VALUE:
+                self._skip_whitespaces()
+                if self._pos >= len(self._buffer):
+                    break
+                if self._current_key == self.array_key and self._buffer[self._pos] == "[":
+                    self._pos += 1
+                    self._array_started = True
+                    self._state = _STATE_ITEM
+                    continue
+                complete, value = self._decode_value()
+                if not complete:
+                    break
+                if self.on_member is not None:
+                    self.on_member(self._current_key, value)
+                self._state = _STATE_MEMBER_SEP
+            elif self._state == _STATE_ITEM:
+                self._skip_whitespaces()
+                if self._pos >= len(self._buffer):
+                    break
+                if self._buffer[self._pos] == "]":
+                    self._pos += 1
+                    self._state = _STATE_MEMBER_SEP
+                    continue
+                complete, item = self._decode_value()
+                if not complete:
+                    break
+                if self.item_hook is not None:
+                    item = self.item_hook(item)
+                items.append(item)
+                self._state = _STATE_ITEM_SEP
+            elif self._state == _STATE_ITEM_SEP:
+                char = self._expect(",]")
+                if char is None:
+                    break
+                self._pos += 1
+                self._state = _STATE_ITEM if char == "," else _STATE_MEMBER_SEP
+            elif self._state == _STATE_MEMBER_SEP:
+                char = self._expect(",}")
+                if char is None:
+                    break
+                self._pos += 1
+                self._state = _STATE_KEY if char == "," else _STATE_END
+
+        # drop the consumed part of the buffer
+        if self._pos > _BUFFER_COMPACT_THRESHOLD or self._state == _STATE_END:
+            self._buffer = self._buffer[self._pos :]
+            if self._retry_at:
+                self._retry_at -= self._pos
+            self._pos = 0
+
+        return items
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    parser = IsogeoStreamParser()
+    print(parser.feed(b'{"total": 1, "results": [{"_id": "a"}]}'), parser.close())
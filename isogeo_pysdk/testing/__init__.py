@@ -0,0 +1,14 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Tools to test and benchmark code using the SDK without Isogeo platform."""
+
+# submodules
+from .fake_api import (  # noqa: F401
+    FAKE_CLIENT_ID,
+    FAKE_CLIENT_SECRET,
+    FAKE_WORKGROUP_ID,
+    IsogeoFakeApi,
+    generate_metadata,
+    serve,
+)
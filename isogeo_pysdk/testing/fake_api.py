@@ -0,0 +1,638 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Local stand-in of Isogeo API, to test and benchmark code using the SDK without platform \
+nor credentials.
+
+It's a WSGI application implementing the main routes (token, search, metadata, bulk, \
+listings of catalogs, contacts, keywords and shares), seeded with fixtures or synthetic \
+metadata, with configurable latency, errors and throttling.
+
+Usage from the command line:
+
+.. code-block:: shell
+
+    python -m isogeo_pysdk.testing.fake_api --port 8000 --total 10000 --latency 0.05
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import gzip
+import json
+import logging
+import os
+import random
+import re
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from time import monotonic, sleep
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+# submodules
+from isogeo_pysdk.enums import MetadataSubresources
+from isogeo_pysdk.utils import IsogeoUtils
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# credentials accepted by the fake API: any well-formed ones work, these are ready to use
+FAKE_CLIENT_ID = "python-sdk-fake-api-{}".format("0" * 32)
+FAKE_CLIENT_SECRET = "s" * 64
+
+FAKE_WORKGROUP_ID = "32f7e95ec4e94ca3bc1afda960003882"
+FAKE_THESAURUS_ID = "1616597fbc4348c8b11ef9d59cf594c8"
+
+# metadata types and their tags
+_TYPES = {
+    "vectorDataset": "type:vector-dataset",
+    "rasterDataset": "type:raster-dataset",
+    "noGeoDataset": "type:no-geo-dataset",
+    "service": "type:service",
+    "resource": "type:resource",
+}
+_FORMATS = ("shp", "geojson", "postgis", "tiff", "ecw", "xlsx", "csv", "wms")
+
+# attributes returned only if included
+_SUBRESOURCES = frozenset(item.value for item in MetadataSubresources)
+
+_HTTP_REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def generate_metadata(count: int, seed: int = 1, workgroup_id: str = FAKE_WORKGROUP_ID) -> list:
+    """Generate synthetic metadata, with keywords, catalogs and contacts shared between them.
+
+    The same count and seed always give the same metadata.
+
+    :param int count: count of metadata to generate
+    :param int seed: random seed
+    :param str workgroup_id: UUID of the owner workgroup
+
+    :rtype: list
+    """
+    rng = random.Random(seed)
+    owner = {"_id": workgroup_id, "_tag": "owner:{}".format(workgroup_id), "name": "Fake workgroup"}
+    catalogs = [
+        {"_id": _uuid(rng), "code": "catalog-{}".format(i), "name": "Catalog {}".format(i)}
+        for i in range(5)
+    ]
+    contacts = [
+        {
+            "_id": _uuid(rng),
+            "name": "Contact {}".format(i),
+            "email": "contact-{}@example.com".format(i),
+            "type": "custom",
+        }
+        for i in range(10)
+    ]
+    keywords = [
+        {"_id": _uuid(rng), "code": "keyword-{}".format(i), "text": "Keyword {}".format(i)}
+        for i in range(20)
+    ]
+    for catalog in catalogs:
+        catalog["_tag"] = "catalog:{}".format(catalog["_id"])
+    for contact in contacts:
+        contact["_tag"] = "contact:group:{}".format(contact["_id"])
+    for keyword in keywords:
+        keyword["_tag"] = "keyword:isogeo:{}".format(keyword["code"])
+
+    start = datetime(2018, 1, 1, tzinfo=timezone.utc)
+    metadatas = []
+    for i in range(count):
+        created = start + timedelta(minutes=rng.randrange(0, 60 * 24 * 365 * 5))
+        modified = created + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        md_type = rng.choice(tuple(_TYPES))
+        md_format = rng.choice(_FORMATS)
+        md_keywords = rng.sample(keywords, rng.randint(0, 4))
+        md_catalogs = rng.sample(catalogs, rng.randint(0, 2))
+        md_contacts = rng.sample(contacts, rng.randint(0, 2))
+        tags = {
+            _TYPES.get(md_type): md_type,
+            "format:{}".format(md_format): md_format,
+            owner.get("_tag"): owner.get("name"),
+        }
+        tags.update({kw.get("_tag"): kw.get("text") for kw in md_keywords})
+        tags.update({cat.get("_tag"): cat.get("name") for cat in md_catalogs})
+        tags.update({ct.get("_tag"): ct.get("name") for ct in md_contacts})
+        metadatas.append(
+            {
+                "_id": _uuid(rng),
+                "_created": created.isoformat(),
+                "_creator": dict(owner),
+                "_modified": modified.isoformat(),
+                "abstract": "Synthetic metadata number {} for tests.".format(i),
+                "catalogs": [dict(cat) for cat in md_catalogs],
+                "contacts": [{"contact": dict(ct), "role": "pointOfContact"} for ct in md_contacts],
+                "format": md_format,
+                "keywords": [dict(kw) for kw in md_keywords],
+                "name": "dataset_{}".format(i),
+                "tags": tags,
+                "title": "Synthetic {} {}".format(md_type, i),
+                "type": md_type,
+            }
+        )
+    return metadatas
+
+
+def _uuid(rng: random.Random) -> str:
+    """Returns a random UUID (hex) from a seeded generator."""
+    return uuid.UUID(int=rng.getrandbits(128), version=4).hex
+
+
+def serve(app, host: str = "127.0.0.1", port: int = 0):
+    """Serve a WSGI application in a background thread, one thread per request.
+
+    :param app: WSGI application
+    :param str host: host to listen
+    :param int port: port to listen. A free port is picked if 0.
+
+    :returns: the server (stop it with `shutdown()` then `server_close()`) and its base URL
+    :rtype: tuple
+    """
+    server = make_server(
+        host, port, app, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler
+    )
+    thread = threading.Thread(
+        target=server.serve_forever, name="IsogeoFakeApi", daemon=True
+    )
+    thread.start()
+    return server, "http://{}:{}".format(host, server.server_port)
+
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        logger.debug("Fake API: " + format, *args)
+
+
+class IsogeoFakeApi(object):
+    """WSGI application mimicking Isogeo API routes used by the SDK:
+
+    - `POST /oauth/token`: any client credentials get a token;
+    - `GET /about`;
+    - `GET /resources/search` and `GET /groups/{id}/resources/search`, with `_limit`, \
+        `_offset`, `_include`, `_id` (specific metadata), `ob`/`od` (ordering) and `q` \
+        (tags filters like `type:dataset` or `keyword:isogeo:xxx`, and full-text words);
+    - `GET /resources/{id}` with `_include`;
+    - `POST /resources/`: bulk requests (add, delete, update), gzip bodies accepted;
+    - `GET /groups/{id}/catalogs`, `GET /groups/{id}/contacts`, \
+        `GET /groups/{id}/keywords/search`, `GET /thesauri/{id}/keywords/search`, \
+        `GET /shares`.
+
+    Other routes answer 404. Requests without Bearer token answer 401.
+
+    :param list records: metadata to serve, as dicts. Synthetic metadata are generated if None.
+    :param int total: count of synthetic metadata to generate
+    :param int seed: random seed of the synthetic metadata, latencies and errors
+    :param latency: delay before each response in seconds, or (min, max) delays
+    :param float error_rate: share of requests failing with a 503 error
+    :param float max_rps: maximum requests per second. Above, requests answer 429 with \
+        a `Retry-After` header.
+
+    :Example:
+
+    .. code-block:: python
+
+        from isogeo_pysdk import Isogeo
+        from isogeo_pysdk.testing import IsogeoFakeApi, FAKE_CLIENT_ID, FAKE_CLIENT_SECRET
+
+        with IsogeoFakeApi(total=1000, latency=(0.01, 0.05)).serve() as (fake_api, url):
+            isogeo = Isogeo(
+                client_id=FAKE_CLIENT_ID,
+                client_secret=FAKE_CLIENT_SECRET,
+                auto_refresh_url="{}/oauth/token".format(url),
+                platform="custom",
+                isogeo_urls={"api_url": url},
+            )
+            isogeo.connect()
+            search = isogeo.search(query="type:dataset", whole_results=1)
+            print(fake_api.hits)
+    """
+
+    def __init__(
+        self,
+        records: list = None,
+        total: int = 100,
+        seed: int = 1,
+        latency=0.0,
+        error_rate: float = 0.0,
+        max_rps: float = None,
+    ):
+        """Instanciate the fake API."""
+        if records is None:
+            records = generate_metadata(total, seed=seed)
+        self.records = {md.get("_id"): md for md in records}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.max_rps = max_rps
+
+        self.hits = {}  # count of requests by method and route template
+        self._searches = {}  # filtered and sorted results, by query. Cleared on writes.
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._bucket = max_rps or 0.0
+        self._bucket_time = monotonic()
+
+        self.routes = (
+            ("POST", re.compile(r"^oauth/token$"), self.token),
+            ("GET", re.compile(r"^about$"), self.about),
+            ("GET", re.compile(r"^(?:groups/(?P<group_id>\w+)/)?resources/search$"), self.search),
+            ("GET", re.compile(r"^resources/(?P<md_id>\w+)$"), self.metadata),
+            ("POST", re.compile(r"^resources$"), self.bulk),
+            ("GET", re.compile(r"^groups/(?P<group_id>\w+)/catalogs$"), self.catalogs),
+            ("GET", re.compile(r"^groups/(?P<group_id>\w+)/contacts$"), self.contacts),
+            ("GET", re.compile(r"^groups/(?P<group_id>\w+)/keywords/search$"), self.keywords),
+            ("GET", re.compile(r"^thesauri/(?P<thesaurus_id>\w+)/keywords/search$"), self.keywords),
+            ("GET", re.compile(r"^(?:groups/(?P<group_id>\w+)/)?shares$"), self.shares),
+        )
+
+    @classmethod
+    def from_fixtures(cls, *paths, **kwargs):
+        """Instanciate the fake API with metadata read from JSON files: a metadata, a list of \
+        metadata or a search response.
+
+        :param paths: paths of the JSON files
+        :param kwargs: other parameters of the fake API
+
+        :rtype: IsogeoFakeApi
+        """
+        records = []
+        for path in paths:
+            with Path(path).open("r", encoding="utf-8") as in_json:
+                content = json.load(in_json)
+            if isinstance(content, dict) and "results" in content:
+                content = content.get("results")
+            records.extend(content if isinstance(content, list) else [content])
+        return cls(records=records, **kwargs)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0):
+        """Serve the fake API in a background thread. Usable as context manager yielding the \
+        fake API and its URL.
+
+        The token is requested over plain HTTP, so oauthlib check is disabled while serving \
+        (`OAUTHLIB_INSECURE_TRANSPORT` environment variable).
+
+        :param str host: host to listen
+        :param int port: port to listen. A free port is picked if 0.
+        """
+        return _FakeApiServer(self, host, port)
+
+    # -- WSGI -----------------------------------------------------------------
+    def __call__(self, environ, start_response):
+        method = environ.get("REQUEST_METHOD", "GET").upper()
+        path = environ.get("PATH_INFO", "/").strip("/")
+        params = {k: v[-1] for k, v in parse_qs(environ.get("QUERY_STRING", "")).items()}
+
+        status, body, headers = self._dispatch(method, path, params, environ)
+        headers = list(headers or [])
+        payload = b"" if body is None or method == "HEAD" else json.dumps(body).encode("utf-8")
+        headers.append(("Content-Type", "application/json; charset=utf-8"))
+        headers.append(("Content-Length", str(len(payload))))
+        start_response("{} {}".format(status, _HTTP_REASONS.get(status, "")), headers)
+        return [payload]
+
+    def _dispatch(self, method: str, path: str, params: dict, environ: dict) -> tuple:
+        """Route a request. Returns status, body and headers."""
+        self._wait()
+        lookup = "GET" if method == "HEAD" else method
+        for route_method, regex, handler in self.routes:
+            match = regex.match(path)
+            if match is None or route_method != lookup:
+                continue
+            with self._lock:
+                key = "{} {}".format(method, IsogeoUtils.route_template("/" + path))
+                self.hits[key] = self.hits.get(key, 0) + 1
+            if handler not in (self.token, self.about):
+                if not environ.get("HTTP_AUTHORIZATION", "").startswith("Bearer "):
+                    return 401, {"error": "Missing bearer token."}, None
+                failure = self._failure()
+                if failure is not None:
+                    return failure
+            return handler(params=params, environ=environ, **match.groupdict())
+        return 404, {"error": "Route not found: {} /{}".format(method, path)}, None
+
+    def _wait(self):
+        """Simulate the API latency."""
+        if isinstance(self.latency, (list, tuple)):
+            with self._lock:
+                delay = self._rng.uniform(*self.latency)
+        else:
+            delay = self.latency
+        if delay:
+            sleep(delay)
+
+    def _failure(self) -> tuple:
+        """Throttling and errors injection. Returns a response or None."""
+        with self._lock:
+            if self.max_rps:
+                now = monotonic()
+                self._bucket = min(
+                    self.max_rps, self._bucket + (now - self._bucket_time) * self.max_rps
+                )
+                self._bucket_time = now
+                if self._bucket < 1:
+                    return 429, {"error": "Too many requests."}, [("Retry-After", "1")]
+                self._bucket -= 1
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return 503, {"error": "Injected failure."}, None
+        return None
+
+    @staticmethod
+    def _read_body(environ: dict):
+        """Read the JSON body of a request, decompressing it if needed."""
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        data = environ["wsgi.input"].read(length) if length else b""
+        if environ.get("HTTP_CONTENT_ENCODING", "").lower() == "gzip":
+            data = gzip.decompress(data)
+        return json.loads(data.decode("utf-8")) if data else None
+
+    # -- ROUTES ---------------------------------------------------------------
+    def token(self, params: dict, environ: dict):
+        return (
+            200,
+            {
+                "access_token": "fake-{}".format(uuid.uuid4().hex),
+                "expires_in": 3600,
+                "token_type": "Bearer",
+            },
+            None,
+        )
+
+    def about(self, params: dict, environ: dict):
+        return 200, {"name": "Isogeo fake API", "version": "fake"}, None
+
+    def search(self, params: dict, environ: dict, group_id: str = None):
+        query = params.get("q") or ""
+        key = (group_id, params.get("_id"), query, params.get("ob"), params.get("od"))
+        with self._lock:
+            cached = self._searches.get(key)
+        if cached is None:
+            cached = self._filter(group_id, params.get("_id"), query)
+            cached = (self._order(cached, params.get("ob"), params.get("od")), {})
+            for md in cached[0]:
+                cached[1].update(md.get("tags") or {})
+            with self._lock:
+                self._searches[key] = cached
+        results, tags = cached
+
+        offset = int(params.get("_offset") or 0)
+        limit = int(params.get("_limit") or 20)
+        includes = self._includes(params)
+        return (
+            200,
+            {
+                "envelope": None,
+                "limit": limit,
+                "offset": offset,
+                "query": {"_tags": [t for t in query.split() if ":" in t], "_terms": []},
+                "results": [self._project(md, includes) for md in results[offset : offset + limit]],
+                "tags": tags,
+                "total": len(results),
+            },
+            None,
+        )
+
+    def _filter(self, group_id: str, specific: str, query: str) -> list:
+        """Returns the metadata matching the search parameters."""
+        results = list(self.records.values())
+        if group_id:
+            results = [md for md in results if md.get("_creator", {}).get("_id") == group_id]
+        if specific:
+            specific = set(specific.split(","))
+            results = [md for md in results if md.get("_id") in specific]
+        for token in query.split():
+            results = [md for md in results if self._match(md, token)]
+        return results
+
+    def metadata(self, params: dict, environ: dict, md_id: str):
+        md = self.records.get(md_id)
+        if md is None:
+            return 404, {"error": "Metadata not found: {}".format(md_id)}, None
+        return 200, self._project(md, self._includes(params)), None
+
+    def bulk(self, params: dict, environ: dict):
+        requests = self._read_body(environ)
+        if not isinstance(requests, list):
+            return 400, {"error": "A list of bulk requests is expected."}, None
+        reports = []
+        for request in requests:
+            ignored = {}
+            for md_id in request.get("query", {}).get("ids", []):
+                md = self.records.get(md_id)
+                if md is None:
+                    ignored[md_id] = "notFound"
+                    continue
+                targets = request.get("target") or []
+                for target in [targets] if isinstance(targets, str) else targets:
+                    self._apply_bulk(md, request.get("action"), target, request.get("model"))
+            reports.append({"ignored": ignored, "request": request})
+        with self._lock:
+            self._searches.clear()
+        return 200, reports, None
+
+    def catalogs(self, params: dict, environ: dict, group_id: str):
+        return 200, self._collect("catalogs"), None
+
+    def contacts(self, params: dict, environ: dict, group_id: str):
+        return 200, [ct.get("contact") for ct in self._collect("contacts", key="contact")], None
+
+    def keywords(
+        self, params: dict, environ: dict, group_id: str = None, thesaurus_id: str = None
+    ):
+        keywords = self._collect("keywords")
+        query = (params.get("q") or "").lower()
+        if query:
+            keywords = [kw for kw in keywords if query in kw.get("text", "").lower()]
+        offset = int(params.get("_offset") or 0)
+        limit = int(params.get("_limit") or 20)
+        return (
+            200,
+            {
+                "limit": limit,
+                "offset": offset,
+                "results": keywords[offset : offset + limit],
+                "total": len(keywords),
+            },
+            None,
+        )
+
+    def shares(self, params: dict, environ: dict, group_id: str = None):
+        application = {
+            "_id": "0" * 32,
+            "canHaveManyGroups": True,
+            "kind": "group",
+            "name": "Fake application",
+            "type": "group",
+        }
+        share = {
+            "_id": "1" * 32,
+            "_creator": {"_id": FAKE_WORKGROUP_ID},
+            "applications": [application],
+            "catalogs": self._collect("catalogs"),
+            "name": "Fake share",
+            "type": "application",
+        }
+        return 200, [share], None
+
+    # -- HELPERS --------------------------------------------------------------
+    @staticmethod
+    def _includes(params: dict) -> frozenset:
+        include = params.get("_include") or ""
+        if include == "all":
+            return _SUBRESOURCES
+        return frozenset(i for i in include.split(",") if i)
+
+    @staticmethod
+    def _project(md: dict, includes: frozenset) -> dict:
+        """Returns the metadata attributes, subresources only if included."""
+        return {k: v for k, v in md.items() if k not in _SUBRESOURCES or k in includes}
+
+    @staticmethod
+    def _match(md: dict, token: str) -> bool:
+        """Check if a metadata matches a query token: tag filter or full-text word."""
+        if ":" not in token:
+            text = "{} {}".format(md.get("title", ""), md.get("abstract", "")).lower()
+            return token.lower() in text
+        tags = md.get("tags") or {}
+        if token == "type:dataset":
+            return "type:vector-dataset" in tags or "type:raster-dataset" in tags
+        return token in tags or any(tag.startswith(token + ":") for tag in tags)
+
+    @staticmethod
+    def _order(results: list, order_by: str = None, order_dir: str = None) -> list:
+        """Sort search results. Ties are sorted by _id to keep pages stable."""
+        if order_by in (None, "", "relevance"):
+            return results
+        field = {"created": "_created", "modified": "_modified"}.get(order_by, order_by)
+        return sorted(
+            results,
+            key=lambda md: (str(md.get(field) or ""), md.get("_id")),
+            reverse=(order_dir or "desc").lower() == "desc",
+        )
+
+    def _collect(self, subresource: str, key: str = None) -> list:
+        """Returns the distinct items of a subresource in all metadata."""
+        items = {}
+        for md in self.records.values():
+            for item in md.get(subresource) or []:
+                item_id = (item.get(key) if key else item).get("_id")
+                items.setdefault(item_id, item)
+        return list(items.values())
+
+    @staticmethod
+    def _apply_bulk(md: dict, action: str, target: str, model: list):
+        """Apply a bulk action to a metadata."""
+        model = model or []
+        if target in ("title", "abstract", "name") and action == "update":
+            md[target] = model[0] if isinstance(model, list) else model
+            return
+        items = md.setdefault(target, [])
+        ids = {item.get("_id") for item in model if isinstance(item, dict)}
+        if action == "add":
+            present = {item.get("_id") for item in items}
+            items.extend(item for item in model if item.get("_id") not in present)
+        elif action == "delete":
+            md[target] = [item for item in items if item.get("_id") not in ids]
+        elif action == "update":
+            md[target] = list(model)
+        md["_modified"] = datetime.now(timezone.utc).isoformat()
+
+
+class _FakeApiServer(object):
+    """Context manager serving a fake API in a background thread."""
+
+    def __init__(self, app: IsogeoFakeApi, host: str, port: int):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.server = None
+        self._insecure_transport = None
+
+    def __enter__(self):
+        self._insecure_transport = os.environ.get("OAUTHLIB_INSECURE_TRANSPORT")
+        os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"
+        self.server, url = serve(self.app, self.host, self.port)
+        logger.info("Fake Isogeo API listening on %s", url)
+        return self.app, url
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._insecure_transport is None:
+            os.environ.pop("OAUTHLIB_INSECURE_TRANSPORT", None)
+        else:
+            os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = self._insecure_transport
+        return False
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution: serve the fake API."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local fake Isogeo API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--total", type=int, default=1000, help="synthetic metadata count")
+    parser.add_argument("--fixtures", nargs="*", help="JSON files of metadata to serve")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-rps", type=float, default=None)
+    args = parser.parse_args()
+
+    options = {
+        "seed": args.seed,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "max_rps": args.max_rps,
+    }
+    if args.fixtures:
+        fake_api = IsogeoFakeApi.from_fixtures(*args.fixtures, **options)
+    else:
+        fake_api = IsogeoFakeApi(total=args.total, **options)
+
+    logging.basicConfig(level=logging.INFO)
+    print(
+        "Fake Isogeo API on http://{}:{} - client id: {} - secret: {}".format(
+            args.host, args.port, FAKE_CLIENT_ID, FAKE_CLIENT_SECRET
+        )
+    )
+    make_server(
+        args.host, args.port, fake_api, server_class=_ThreadingWSGIServer
+    ).serve_forever()
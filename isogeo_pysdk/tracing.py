@@ -0,0 +1,89 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Optional tracing of the SDK operations, compatible with OpenTelemetry tracers."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+from contextlib import contextmanager
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# tracer used to create the spans. None disables tracing.
+_tracer = None
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def set_tracer(tracer=None):
+    """Set the tracer used to create spans for the SDK operations:
+
+    - a span per API route method (e.g. `ApiMetadata.get`, `ApiSearch.search`);
+    - a child span per HTTP request (e.g. `GET resources/{id}`), including retries and \
+        hedged requests.
+
+    Spans are propagated through the active context (context variables), which is copied to \
+    the scheduler workers and to the `*_async` methods threads: pages of a `whole_results` \
+    search are children of the search span.
+
+    Tracing is disabled (no-op) until a tracer is set.
+
+    :param tracer: an OpenTelemetry tracer or any object with a `start_as_current_span(name, \
+        attributes)` context manager method. None disables tracing.
+
+    :Example:
+
+    .. code-block:: python
+
+        from opentelemetry import trace
+
+        isogeo_pysdk.set_tracer(trace.get_tracer("isogeo_pysdk"))
+        search = isogeo.search(whole_results=1)
+    """
+    global _tracer
+    if tracer is not None and not callable(getattr(tracer, "start_as_current_span", None)):
+        raise TypeError(
+            "Tracer must have a 'start_as_current_span' method, as OpenTelemetry tracers."
+        )
+    _tracer = tracer
+    logger.debug("Tracing %s.", "enabled" if tracer is not None else "disabled")
+
+
+def get_tracer():
+    """Returns the tracer set with :func:`set_tracer`, or None if tracing is disabled."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, attributes: dict = None):
+    """Context manager starting a span as child of the current one. Yields the span, or None \
+    if tracing is disabled.
+
+    :param str name: span name
+    :param dict attributes: span attributes
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    with tracer.start_as_current_span(name, attributes=attributes or {}) as current:
+        yield current
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    with span("noop") as current:
+        print(current)
@@ -0,0 +1,480 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Alternative transport adapters which can be mounted on the :class:`~isogeo_pysdk.isogeo.Isogeo` \
+session, in place of the default requests/urllib3 HTTP/1.1 pool: HTTP/2, record and replay of \
+the API responses."""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import gzip
+import json
+import logging
+import threading
+from base64 import b64decode, b64encode
+from io import BytesIO
+from time import monotonic, sleep
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# 3rd party library
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# submodules
+from isogeo_pysdk.exceptions import ResponseNotRecordedError
+
+# ##############################################################################
+# ########## Globals ###############
+# ##################################
+
+logger = logging.getLogger(__name__)
+
+# connection-specific headers, forbidden in HTTP/2
+_HOP_BY_HOP_HEADERS = (
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "transfer-encoding",
+    "upgrade",
+)
+
+# response headers not archived: contents are archived decoded
+_ARCHIVE_SKIPPED_HEADERS = _HOP_BY_HOP_HEADERS + ("content-encoding", "content-length")
+# token values are never archived
+_ARCHIVE_REDACTED_KEYS = ("access_token", "refresh_token")
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+def _archive_key(method: str, url: str, ignore_params: tuple = ()) -> str:
+    """Key matching a request with the archived responses: method, path and sorted query \
+    parameters. Scheme and host are ignored so an archive can be replayed on another platform.
+
+    :param str method: HTTP method
+    :param str url: requested URL
+    :param tuple ignore_params: query parameters not taken into account
+    """
+    parts = urlsplit(url)
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in ignore_params
+    )
+    key = "{} {}".format(method.upper(), parts.path.strip("/"))
+    return "{}?{}".format(key, urlencode(params)) if params else key
+
+
+def _archive_content(url: str, content: bytes) -> dict:
+    """Archived form of a response content: text if possible, base64 otherwise. Tokens \
+    returned by the authentication route are redacted.
+
+    :param str url: requested URL
+    :param bytes content: response content
+    """
+    content = content or b""
+    if urlsplit(url).path.rstrip("/").endswith("oauth/token"):
+        try:
+            token = json.loads(content)
+            token.update({k: "redacted" for k in _ARCHIVE_REDACTED_KEYS if k in token})
+            content = json.dumps(token).encode("utf-8")
+        except ValueError:
+            pass
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": b64encode(content).decode("ascii")}
+
+
+# ##############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class _HttpxRaw(object):
+    """File-like wrapper of a streamed httpx response, used as `raw` attribute of the requests \
+    responses. Content is already decoded by httpx."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = None
+        self._buffer = b""
+
+    def stream(self, chunk_size: int = 65536, decode_content: bool = True):
+        if self._buffer:
+            yield self._buffer
+            self._buffer = b""
+        yield from self._iter_chunks(chunk_size)
+
+    def _iter_chunks(self, chunk_size: int = 65536):
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes(chunk_size)
+        return self._chunks
+
+    def read(self, amt: int = None, decode_content: bool = True) -> bytes:
+        chunks = self._iter_chunks()
+        while amt is None or len(self._buffer) < amt:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if amt is None:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def tell(self) -> int:
+        """Count of bytes received over the network, before decoding."""
+        return self._response.num_bytes_downloaded
+
+    def close(self):
+        self._response.close()
+
+    def release_conn(self):
+        self.close()
+
+
+class IsogeoHttp2Adapter(BaseAdapter):
+    """Transport adapter sending requests with `httpx <https://www.python-httpx.org/>`_ over \
+    HTTP/2: concurrent requests (paginated searches, subresources...) are multiplexed over a \
+    few connections instead of opening one TCP+TLS connection each.
+
+    Requires httpx with HTTP/2 support: ``pip install httpx[http2]``. It's enabled with the \
+    `http2` option of :class:`~isogeo_pysdk.isogeo.Isogeo`.
+
+    :param int max_connections: maximum count of connections
+    :param dict proxies: proxies settings by scheme, as in requests
+    :param bool verify: check the SSL certificates
+    :param bool http2: use HTTP/2 when the server supports it
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(
+            client_id=environ.get("ISOGEO_API_DEV_ID"),
+            client_secret=environ.get("ISOGEO_API_DEV_SECRET"),
+            http2=True,
+        )
+        isogeo.connect()
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        proxies: dict = None,
+        verify: bool = True,
+        http2: bool = True,
+    ):
+        """Instanciate the adapter and its httpx client."""
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 transport requires httpx with HTTP/2 support: pip install httpx[http2]"
+            )
+        super(IsogeoHttp2Adapter, self).__init__()
+
+        limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        )
+        proxies = proxies or {}
+        mounts = {
+            "{}://".format(scheme): httpx.HTTPTransport(
+                http2=http2, verify=verify, limits=limits, proxy=proxies.get(scheme)
+            )
+            for scheme in ("http", "https")
+            if proxies.get(scheme)
+        }
+        self.client = httpx.Client(
+            http2=http2, verify=verify, limits=limits, mounts=mounts or None
+        )
+
+    @staticmethod
+    def _timeout(timeout):
+        """Convert a requests timeout into an httpx one."""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+        return httpx.Timeout(timeout)
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ) -> Response:
+        """Send a prepared request. Same signature as :meth:`requests.adapters.HTTPAdapter.send`.
+
+        :param requests.PreparedRequest request: request to send
+        :param bool stream: don't read the response content immediately
+        :param timeout: timeout, as a number or a (connect, read) tuple
+        """
+        headers = [
+            (k, v)
+            for k, v in request.headers.items()
+            if k.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        try:
+            httpx_request = self.client.build_request(
+                method=request.method,
+                url=request.url,
+                headers=headers,
+                content=request.body,
+                timeout=self._timeout(timeout),
+            )
+            httpx_response = self.client.send(httpx_request, stream=True)
+        except httpx.ConnectTimeout as exc:
+            raise ConnectTimeout(exc, request=request)
+        except httpx.TimeoutException as exc:
+            raise ReadTimeout(exc, request=request)
+        except httpx.TransportError as exc:
+            raise ConnectionError(exc, request=request)
+
+        return self.build_response(request, httpx_response, stream=stream)
+
+    def build_response(self, request, httpx_response, stream: bool = False) -> Response:
+        """Build a requests response from an httpx one.
+
+        :param requests.PreparedRequest request: request sent
+        :param httpx.Response httpx_response: response received
+        :param bool stream: don't read the response content immediately
+        """
+        response = Response()
+        response.status_code = httpx_response.status_code
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = httpx_response.reason_phrase
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = _HttpxRaw(httpx_response)
+        if not stream:
+            try:
+                response._content = httpx_response.read()
+            except httpx.TransportError as exc:
+                raise ConnectionError(exc, request=request)
+            finally:
+                httpx_response.close()
+            response._content_consumed = True
+        return response
+
+    def close(self):
+        """Close the connections."""
+        self.client.close()
+
+
+class IsogeoRecordAdapter(BaseAdapter):
+    """Transport adapter recording the responses received through another adapter into a \
+    compressed JSON Lines archive, to be replayed later with :class:`IsogeoReplayAdapter`.
+
+    Each line holds the method and URL of a request and the status, headers, decoded content \
+    and latency of its response. Neither the request headers and bodies nor the tokens are \
+    archived. Streamed responses are read entirely to be archived.
+
+    It's enabled with the `record` option of :class:`~isogeo_pysdk.isogeo.Isogeo`. The archive \
+    is complete once the adapter is closed (:meth:`~isogeo_pysdk.isogeo.Isogeo.close`).
+
+    :param str path: path of the archive to write (`.jsonl.gz`). Overwritten if it exists.
+    :param requests.adapters.BaseAdapter adapter: adapter sending the requests. Defaults to \
+        a :class:`requests.adapters.HTTPAdapter`.
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(
+            client_id=environ.get("ISOGEO_API_DEV_ID"),
+            client_secret=environ.get("ISOGEO_API_DEV_SECRET"),
+            record="harvest.jsonl.gz",
+        )
+        isogeo.connect()
+        isogeo.search(whole_results=1, include="all")
+        isogeo.close()
+    """
+
+    def __init__(self, path: str, adapter: BaseAdapter = None):
+        """Instanciate the adapter and open the archive."""
+        super(IsogeoRecordAdapter, self).__init__()
+        self.adapter = adapter or HTTPAdapter()
+        self.path = path
+        self.count = 0
+        self._archive = gzip.open(path, "wt", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = monotonic()
+
+    def send(self, request, **kwargs) -> Response:
+        """Send a request through the wrapped adapter and archive the response. Same \
+        signature as :meth:`requests.adapters.HTTPAdapter.send`.
+
+        :param requests.PreparedRequest request: request to send
+        """
+        start = monotonic()
+        response = self.adapter.send(request, **kwargs)
+        content = response.content
+        entry = {
+            "method": request.method,
+            "url": request.url,
+            "time": round(start - self._start, 6),
+            "elapsed": round(monotonic() - start, 6),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in _ARCHIVE_SKIPPED_HEADERS
+            },
+        }
+        entry.update(_archive_content(request.url, content))
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            if not self._archive.closed:
+                self._archive.write(line + "\n")
+                self.count += 1
+        return response
+
+    def close(self):
+        """Close the archive and the wrapped adapter."""
+        with self._lock:
+            if not self._archive.closed:
+                self._archive.close()
+                logger.info("%s responses recorded into %s", self.count, self.path)
+        self.adapter.close()
+
+
+class IsogeoReplayAdapter(BaseAdapter):
+    """Transport adapter answering the requests with the responses archived by \
+    :class:`IsogeoRecordAdapter`, without network: operations can be profiled offline and \
+    repeated with the same inputs.
+
+    Requests are matched on their method, path and query parameters (in any order), not on \
+    their body. Identical requests get the archived responses in the recorded order, the last \
+    one being repeated once they are all consumed.
+
+    It's enabled with the `replay` option of :class:`~isogeo_pysdk.isogeo.Isogeo`.
+
+    :param str path: path of the archive to read
+    :param float latency: factor applied to the recorded latencies: 1 (default) replays the \
+        original timing, including timeouts, 0 answers immediately to measure the SDK CPU cost.
+    :param tuple ignore_params: query parameters not taken into account to match requests
+
+    :raises ResponseNotRecordedError: when a request has no archived response
+
+    :Example:
+
+    .. code-block:: python
+
+        isogeo = Isogeo(
+            client_id=environ.get("ISOGEO_API_DEV_ID"),
+            client_secret=environ.get("ISOGEO_API_DEV_SECRET"),
+            replay="harvest.jsonl.gz",
+            replay_latency=0,
+        )
+        isogeo.connect()
+        isogeo.search(whole_results=1, include="all")
+    """
+
+    def __init__(self, path: str, latency: float = 1.0, ignore_params: tuple = ()):
+        """Instanciate the adapter and load the archive."""
+        super(IsogeoReplayAdapter, self).__init__()
+        self.path = path
+        self.latency = latency
+        self.ignore_params = tuple(ignore_params)
+        self._responses = {}
+        self._cursors = {}
+        self._lock = threading.Lock()
+
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = _archive_key(entry.get("method"), entry.get("url"), self.ignore_params)
+                self._responses.setdefault(key, []).append(entry)
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ) -> Response:
+        """Answer a request with its archived response. Same signature as \
+        :meth:`requests.adapters.HTTPAdapter.send`.
+
+        :param requests.PreparedRequest request: request to answer
+        :param bool stream: don't read the response content immediately
+        :param timeout: timeout, as a number or a (connect, read) tuple
+
+        :raises ResponseNotRecordedError: if the request has no archived response
+        :raises requests.exceptions.ReadTimeout: if the replayed latency exceeds the timeout
+        """
+        key = _archive_key(request.method, request.url, self.ignore_params)
+        with self._lock:
+            entries = self._responses.get(key)
+            if not entries:
+                raise ResponseNotRecordedError(
+                    "No response recorded in {} for: {}".format(self.path, key)
+                )
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+        entry = entries[min(index, len(entries) - 1)]
+
+        delay = entry.get("elapsed", 0) * self.latency
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read_timeout is not None and delay > read_timeout:
+            sleep(read_timeout)
+            raise ReadTimeout(
+                "Replayed latency ({:.1f}s) exceeds the timeout.".format(delay), request=request
+            )
+        if delay > 0:
+            sleep(delay)
+
+        return self.build_response(request, entry, stream=stream)
+
+    def build_response(self, request, entry: dict, stream: bool = False) -> Response:
+        """Build a requests response from an archived one.
+
+        :param requests.PreparedRequest request: request answered
+        :param dict entry: archived response
+        :param bool stream: don't read the response content immediately
+        """
+        if "base64" in entry:
+            content = b64decode(entry.get("base64"))
+        else:
+            content = entry.get("text", "").encode("utf-8")
+
+        response = Response()
+        response.status_code = entry.get("status")
+        response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        response.headers["Content-Length"] = str(len(content))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = entry.get("reason")
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.raw = BytesIO(content)
+        if not stream:
+            response._content = content
+            response._content_consumed = True
+        return response
+
+    def close(self):
+        """Nothing to close: responses are loaded in memory."""
+        pass
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    """Standalone execution."""
+    import requests
+
+    session = requests.Session()
+    session.mount("https://", IsogeoHttp2Adapter())
+    print(session.get("https://www.python.org").status_code)
@@ -18,8 +18,8 @@ import quopri
 import re
 import uuid
 from configparser import ConfigParser
-from datetime import datetime
-from functools import _lru_cache_wrapper
+from datetime import datetime, timedelta
+from functools import _lru_cache_wrapper, lru_cache
 from pathlib import Path
 from sys import platform as opersys
 from urllib.parse import urlparse
@@ -27,6 +27,12 @@ from urllib.parse import urlparse
 # 3rd party
 import requests
 
+# 3rd party - optional
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # modules
 from isogeo_pysdk.checker import IsogeoChecker
 from isogeo_pysdk.models import Metadata
@@ -40,6 +46,8 @@ logger = logging.getLogger(__name__)
 
 # timestamps format helpers
 _regex_milliseconds = re.compile(r"\.(.*)\+")
+_regex_fraction = re.compile(r"\.(\d+)")
+_utc_offset = timedelta(0)
 
 """
     For timestamps about metadata (_created, _modified):
@@ -65,6 +73,173 @@ _dtm_time = "%Y-%m-%dT%H:%M:%S"  # 2018-06-04T00:00:00+00:00
 """
 _dtm_simple = "%Y-%m-%d"  # 2018-06-04
 
+"""
+    Search tags prefixes and matching facets used to convert tags into dicts.
+"""
+_TAGS_FACETS = {
+    "action": "actions",
+    "catalog": "catalogs",
+    "contact": "contacts",
+    "coordinate-system": "srs",
+    "data-source": "data-sources",
+    "format": "formats",
+    "keyword:inspire-theme": "inspires",
+    "keyword:isogeo": "keywords",
+    "license": "licenses",
+    "owner": "owners",
+    "provider": "providers",
+    "share": "shares",
+    "type": "types",
+}
+
+# facets whose labels can be duplicated between workgroups
+_TAGS_FACETS_DUPLICABLE = ("catalogs", "contacts", "data-sources", "licenses")
+
+# identifiers in URLs paths: UUIDs (with or without hyphens) and numeric codes
+_regex_route_id = re.compile(
+    r"(?<=/)(?:[0-9a-fA-F]{32}|[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|\d+)(?=/|$)"
+)
+
+
+# ##############################################################################
+# ########## Functions #############
+# ##################################
+
+
+@lru_cache(maxsize=128)
+def _compile_projection(fields: tuple) -> dict:
+    """Convert a tuple of fields paths into a tree of nested dicts. A None leaf means that the
+    field is entirely kept.
+
+    :param tuple fields: fields paths. Example: ("_id", "links[].url")
+    """
+    tree = {}
+    for path in fields:
+        node = tree
+        parts = path.replace("[]", "").split(".")
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:
+                # parent is already entirely kept
+                break
+            node = node.setdefault(part, child)
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+@lru_cache(maxsize=65536)
+def _fast_datetime(in_date: str) -> datetime:
+    """Parse an API timestamp with `datetime.fromisoformat`, truncating or padding the fraction of
+    seconds to 6 digits. Results are memoized since the same timestamps occur a lot in a search.
+
+    :param str in_date: timestamp to parse
+
+    :returns: a naive datetime (UTC) or None if the format is not handled.
+    """
+    fraction = _regex_fraction.search(in_date)
+    if fraction and len(fraction.group(1)) != 6:
+        in_date = "{}.{:0<6.6}{}".format(
+            in_date[: fraction.start()], fraction.group(1), in_date[fraction.end() :]
+        )
+    try:
+        out_date = datetime.fromisoformat(in_date)
+    except ValueError:
+        return None
+    if out_date.tzinfo is not None:
+        # only UTC timestamps are expected from the API
+        if out_date.utcoffset() != _utc_offset:
+            return None
+        out_date = out_date.replace(tzinfo=None)
+    return out_date
+
+
+def _tag_facet(tag: str) -> str:
+    """Return the facet of a search tag (see _TAGS_FACETS) or None if it's not handled.
+
+    :param str tag: search tag. Example: "keyword:isogeo:2018"
+    """
+    prefix, _, remainder = tag.partition(":")
+    if prefix == "keyword":
+        prefix = "keyword:{}".format(remainder.partition(":")[0])
+    return _TAGS_FACETS.get(prefix)
+
+
+@lru_cache(maxsize=32)
+def _tags_to_dicts_cached(
+    tags_items: frozenset, query_tags: tuple, duplicated: str
+) -> tuple:
+    """Cached core of IsogeoUtils.tags_to_dict: dispatch tags and query tags into facets.
+
+    :param frozenset tags_items: search tags as (tag, label) items
+    :param tuple query_tags: tags of the search query
+    :param str duplicated: duplicated labels management. See IsogeoUtils.tags_to_dict.
+    """
+    tags = dict(tags_items)
+    if duplicated == "rename":
+        workgroups = {
+            k.split(":")[1]: v for k, v in tags.items() if k.startswith("owner")
+        }
+    else:
+        workgroups = {}
+
+    def _add(facets: dict, tag: str, label: str):
+        facet = _tag_facet(tag)
+        if facet is None:
+            logger.debug("A tag has been ignored during parsing: %s", tag)
+            return
+        target = facets[facet]
+        if facet == "providers":
+            # providers are particular because its value is always null.
+            target[tag.split(":")[1]] = tag
+        elif (
+            facet in _TAGS_FACETS_DUPLICABLE
+            and label in target
+            and duplicated != "ignore"
+        ):
+            if duplicated == "merge":
+                target[label] += "||" + tag
+            else:
+                # get workgroup uuid and match with workgroups owners
+                tag_parts = tag.split(":")
+                if IsogeoChecker.check_is_uuid(tag_parts[1]):
+                    tag_uuid = tag_parts[1]
+                else:
+                    tag_uuid = tag_parts[2]
+                repl = workgroups.get(tag_uuid, tag_uuid[:5])
+                target["{} ({})".format(label, repl)] = tag
+        else:
+            target[label] = tag
+
+    # -- SEARCH TAGS -------------
+    tags_as_dicts = {facet: {} for facet in sorted(_TAGS_FACETS.values())}
+    for tag, label in sorted(tags_items):
+        _add(tags_as_dicts, tag, label)
+
+    # -- QUERY TAGS -------------
+    query_as_dicts = {facet: {} for facet in sorted(_TAGS_FACETS.values())}
+    for tag in query_tags:
+        _add(query_as_dicts, tag, tags.get(tag))
+
+    return tags_as_dicts, query_as_dicts
+
+
+@lru_cache(maxsize=1024)
+def _route_template(path: str) -> str:
+    """Replace the identifiers of an URL path by {id}. Cached since routes are few."""
+    return _regex_route_id.sub("{id}", "/" + path.strip("/"))[1:]
+
+
+def _apply_projection(value, tree: dict):
+    """Recursively prune a value (dict or list of dicts) according to a projection tree."""
+    if tree is None:
+        return value
+    if isinstance(value, dict):
+        return {k: _apply_projection(value[k], sub) for k, sub in tree.items() if k in value}
+    if isinstance(value, list):
+        return [_apply_projection(i, tree) for i in value]
+    return value
+
 
 # ##############################################################################
 # ########## Classes ###############
@@ -135,6 +310,7 @@ class IsogeoUtils(object):
         },
     }
 
+    api_prot = "https"
     lang = "fr"
 
     def __init__(self, proxies: dict = dict()):
@@ -171,12 +347,15 @@ class IsogeoUtils(object):
             )
 
         # set values
+        self.api_prot = "https"
         if platform == "custom":
             self.api_url = dict_urls.get("api_url", "missing_url")
             if self.api_url.startswith("https://"):
                 self.api_url = self.api_url.replace("https://", "")
             elif self.api_url.startswith("http://"):
+                # plain HTTP is kept for custom platforms (local or test API)
                 self.api_url = self.api_url.replace("http://", "")
+                self.api_prot = "http"
             else:
                 pass
             self.app_url = dict_urls.get("app_url", self.APP_URLS.get("qa"))
@@ -233,7 +412,7 @@ class IsogeoUtils(object):
             logger.error(
                 "Selected locale ({}) is not installed: {}".format(lang.lower(), e)
             )
-        logger.debug("Locale set to: {}".format(locale.getlocale()))
+        logger.debug("Locale set to: %s", locale.getlocale())
 
         cls.lang = lang.lower()
 
@@ -257,18 +436,20 @@ class IsogeoUtils(object):
         for cached in cache_wrappers:
             if only_already_hit and cached.cache_info().hits > 0:
                 logger.debug(
-                    "Cache cleared for: {}.{} which was hit {} times".format(
-                        cached.__module__, cached.__name__, cached.cache_info().hits
-                    )
+                    "Cache cleared for: %s.%s which was hit %s times",
+                    cached.__module__,
+                    cached.__name__,
+                    cached.cache_info().hits,
                 )
                 cached.cache_clear()
             elif only_already_hit:
                 continue
             else:
                 logger.debug(
-                    "Cache cleared for: {}.{} which was hit {} times".format(
-                        cached.__module__, cached.__name__, cached.cache_info().hits
-                    )
+                    "Cache cleared for: %s.%s which was hit %s times",
+                    cached.__module__,
+                    cached.__name__,
+                    cached.cache_info().hits,
                 )
                 cached.cache_clear()
                 continue
@@ -325,7 +506,7 @@ class IsogeoUtils(object):
         # handle Isogeo specific UUID in XML exports
         if "isogeo:metadata" in in_uuid:
             in_uuid = "urn:uuid:{}".format(in_uuid.split(":")[-1])
-            logger.debug("Isogeo UUID URN spotted: {}".format(in_uuid))
+            logger.debug("Isogeo UUID URN spotted: %s", in_uuid)
         else:
             pass
         # operate
@@ -410,12 +591,32 @@ class IsogeoUtils(object):
         return version_req.json().get("version")
 
     # -- URLs builders -------------------------------------------------------
-    def get_request_base_url(self, route: str, prot: str = "https", lang: str = None) -> str:
+    @classmethod
+    def route_template(cls, url: str) -> str:
+        """Returns the route of an API URL with identifiers replaced by {id}, to group requests \
+        by route (latency, metrics...).
+
+        :param str url: URL to convert
+
+        :rtype: str
+
+        :Example:
+
+        .. code-block:: python
+
+            >>> utils.route_template("https://v1.api.isogeo.com/resources/1a2b3c4d5e6f7a8b9c0d1e2f3a4b5c6d/links/?_lang=fr")
+            'resources/{id}/links'
+        """
+        return _route_template(urlparse(url).path)
+
+    def get_request_base_url(self, route: str, prot: str = None, lang: str = None) -> str:
         """Build the request url for the specified route.
 
         :param str route: route to format
-        :param str prot: https [DEFAULT] or http
+        :param str prot: https or http. Defaults to the protocol of the API URL: https, \
+            unless a custom platform is set with an http:// URL.
         """
+        prot = prot or self.api_prot
         lang_code = lang if lang else self.lang
         return "{}://{}/{}/?_lang={}".format(
             prot, self.api_url, route, lang_code
@@ -586,10 +787,39 @@ class IsogeoUtils(object):
         # method ending
         return int(count_pages)
 
+    @classmethod
+    def project_fields(cls, record: dict, fields: tuple) -> dict:
+        """Keep only the requested fields of an API record (metadata, search result...). Nested
+        fields are expressed with dots, lists being traversed implicitly or explicitly with `[]`.
+
+        :param dict record: record to prune, typically one of the search results
+        :param tuple fields: paths of the fields to keep. If empty, the record is returned as it is.
+
+        :rtype: dict
+
+        :Example:
+
+        .. code-block:: python
+
+            IsogeoUtils.project_fields(
+                record=search.results[0],
+                fields=("_id", "title", "links[].url", "links[].type"),
+            )
+            >>> {"_id": "...", "title": "...", "links": [{"url": "...", "type": "url"}]}
+        """
+        if not fields:
+            return record
+        if isinstance(fields, str):
+            raise TypeError("'fields' expects a tuple of str, not a str.")
+        return _apply_projection(record, _compile_projection(tuple(fields)))
+
     def tags_to_dict(self, tags=dict, prev_query=dict, duplicated: str = "rename"):
         """Reverse search tags dictionary to values as keys. Useful to populate filters comboboxes
         for example.
 
+        Tags are dispatched into facets in a single pass and the result is cached for the same \
+        set of tags and query, so repeated searches with the same context are almost free.
+
         :param dict tags: tags dictionary from a search request
         :param dict prev_query: query parameters returned after a search request. Typically `search.get("query")`.
         :param str duplicated: what to do about duplicated tags label. Values:
@@ -599,249 +829,63 @@ class IsogeoUtils(object):
           * rename [default] - if duplicated tag labels are part of different workgroup,
             so the tag label is renamed with workgroup.
         """
-        # for rename option, get workgroups
-        if duplicated == "rename":
-            wgs = {k.split(":")[1]: v for k, v in tags.items() if k.startswith("owner")}
-            # wgs = list(filter(lambda x[1]: x[0].startswith("owner"), tags.items()))
-        elif duplicated == "ignore" or duplicated == "merge":
-            wgs = None
-        else:
+        if duplicated not in ("ignore", "merge", "rename"):
             raise ValueError(
                 "Duplicated value is not an accepted value."
                 " Please refer to __doc__ method."
             )
 
-        # inner function
-        def _duplicate_mng(
-            target_dict: dict, duplicate, mode: str = duplicated, workgroups: dict = wgs
-        ):
-            if mode == "merge":
-                target_dict[duplicate[0]] += "||" + duplicate[1]
-            elif mode == "rename":
-                # get workgroup uuid
-                if checker.check_is_uuid(k.split(":")[1]):
-                    k_uuid = k.split(":")[1]
-                else:
-                    k_uuid = k.split(":")[2]
-                # match with workgroups owners
-                if k_uuid in workgroups:
-                    repl = workgroups.get(k_uuid)
-                else:
-                    repl = k_uuid[:5]
-                target_dict["{} ({})".format(duplicate[0], repl)] = duplicate[1]
-            else:
-                pass
-            return
-
-        # -- SEARCH TAGS -------------
-        # output dicts structure
-        tags_as_dicts = {
-            "actions": {},
-            "catalogs": {},
-            "contacts": {},
-            "data-sources": {},
-            "formats": {},
-            "inspires": {},
-            "keywords": {},
-            "licenses": {},
-            "owners": {},
-            "providers": {},
-            "shares": {},
-            "srs": {},
-            "types": {},
-        }
-
-        # parsing tags and storing each one in a dict
-        for k, v in sorted(tags.items()):
-            if k.startswith("action"):
-                tags_as_dicts.get("actions")[v] = k
-                continue
-            elif k.startswith("catalog"):
-                if v in tags_as_dicts.get("catalogs") and duplicated != "ignore":
-                    _duplicate_mng(tags_as_dicts.get("catalogs"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated catalog name: {}. Last catalog is retained.".format(
-                            v
-                        )
-                    )
-                    tags_as_dicts.get("catalogs")[v] = k
-                continue
-            elif k.startswith("contact"):
-                if v in tags_as_dicts.get("contacts") and duplicated != "ignore":
-                    _duplicate_mng(tags_as_dicts.get("contacts"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated contact name: {}. Last contact is retained.".format(
-                            v
-                        )
-                    )
-                    tags_as_dicts.get("contacts")[v] = k
-                continue
-            elif k.startswith("coordinate-system"):
-                tags_as_dicts.get("srs")[v] = k
-                continue
-            elif k.startswith("data-source"):
-                if v in tags_as_dicts.get("data-sources") and duplicated != "ignore":
-                    _duplicate_mng(tags_as_dicts.get("data-sources"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated data-source name: {}. Last data-source is retained.".format(
-                            v
-                        )
-                    )
-                    tags_as_dicts.get("data-sources")[v] = k
-                continue
-            elif k.startswith("format"):
-                tags_as_dicts.get("formats")[v] = k
-                continue
-            elif k.startswith("keyword:in"):
-                tags_as_dicts.get("inspires")[v] = k
-                continue
-            elif k.startswith("keyword:is"):
-                tags_as_dicts.get("keywords")[v] = k
-                continue
-            elif k.startswith("license"):
-                if v in tags_as_dicts.get("licenses") and duplicated != "ignore":
-                    _duplicate_mng(tags_as_dicts.get("licenses"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated license name: {}. Last license is retained.".format(
-                            v
-                        )
-                    )
-                    tags_as_dicts.get("licenses")[v] = k
-                continue
-            elif k.startswith("owner"):
-                tags_as_dicts.get("owners")[v] = k
-                continue
-            elif k.startswith("provider"):
-                # providers are particular because its value is always null.
-                tags_as_dicts.get("providers")[k.split(":")[1]] = k
-                continue
-            elif k.startswith("share"):
-                tags_as_dicts.get("shares")[v] = k
-                continue
-            elif k.startswith("type"):
-                tags_as_dicts.get("types")[v] = k
-                continue
-            # ignored tags
-            else:
-                logger.debug("A tag has been ignored during parsing: {}".format(k))
-
-        # -- QUERY TAGS -------------
         # handle share case
         if prev_query.get("_shares"):
             prev_query.get("_tags").append(
                 "share:{}".format(prev_query.get("_shares")[0])
             )
-        else:
-            pass
-        # output dict structure
-        logger.debug(prev_query)
-        query_as_dicts = {
-            "_tags": {
-                "actions": {},
-                "catalogs": {},
-                "contacts": {},
-                "data-sources": {},
-                "formats": {},
-                "inspires": {},
-                "keywords": {},
-                "licenses": {},
-                "owners": {},
-                "providers": {},
-                "shares": {},
-                "srs": {},
-                "types": {},
+
+        shares = prev_query.get("_shares")
+        terms = prev_query.get("_terms")
+        tags_as_dicts, query_tags = _tags_to_dicts_cached(
+            tags_items=frozenset(tags.items()),
+            query_tags=tuple(prev_query.get("_tags")),
+            duplicated=duplicated,
+        )
+
+        # return copies to keep the cached output safe from modifications
+        return (
+            {facet: dict(values) for facet, values in tags_as_dicts.items()},
+            {
+                "_tags": {facet: dict(values) for facet, values in query_tags.items()},
+                "_shares": shares,
+                "_terms": terms,
             },
-            "_shares": prev_query.get("_shares"),
-            "_terms": prev_query.get("_terms"),
-        }
+        )
 
-        # parsing and matching tags
-        query_tags = query_as_dicts.get("_tags")
-        for t in prev_query.get("_tags"):
-            if t.startswith("action"):
-                query_tags.get("actions")[tags.get(t)] = t
-                continue
-            elif t.startswith("catalog"):
-                if v in query_tags.get("catalogs") and duplicated != "ignore":
-                    _duplicate_mng(query_tags.get("catalogs"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated catalog name: {}. Last catalog is retained.".format(
-                            v
-                        )
-                    )
-                    query_tags.get("catalogs")[tags.get(t)] = t
-                continue
-            elif t.startswith("contact"):
-                if v in query_tags.get("contacts") and duplicated != "ignore":
-                    _duplicate_mng(query_tags.get("contacts"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated contact name: {}. Last contact is retained.".format(
-                            v
-                        )
-                    )
-                    query_tags.get("contacts")[tags.get(t)] = t
-                continue
-            elif t.startswith("coordinate-system"):
-                query_tags.get("srs")[tags.get(t)] = t
-                continue
-            elif t.startswith("data-source"):
-                if v in query_tags.get("data-sources") and duplicated != "ignore":
-                    _duplicate_mng(query_tags.get("data-sources"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated data-source name: {}. Last data-source is retained.".format(
-                            v
-                        )
-                    )
-                    query_tags.get("data-sources")[tags.get(t)] = t
-                continue
-            elif t.startswith("format"):
-                query_tags.get("formats")[tags.get(t)] = t
-                continue
-            elif t.startswith("keyword:in"):
-                query_tags.get("inspires")[tags.get(t)] = t
-                continue
-            elif t.startswith("keyword:is"):
-                query_tags.get("keywords")[tags.get(t)] = t
-                continue
-            elif t.startswith("license"):
-                if v in query_tags.get("licenses") and duplicated != "ignore":
-                    _duplicate_mng(query_tags.get("licenses"), (v, k))
-                else:
-                    logger.debug(
-                        "Duplicated license name: {}. Last license is retained.".format(
-                            v
-                        )
-                    )
-                    query_tags.get("licenses")[tags.get(t)] = t
-                continue
-            elif t.startswith("owner"):
-                query_tags.get("owners")[tags.get(t)] = t
-                continue
-            elif t.startswith("provider"):
-                # providers are particular because its value is always null.
-                query_tags.get("providers")[k.split(":")[1]] = k
-                continue
-            elif t.startswith("share"):
-                query_tags.get("shares")[tags.get(t)] = t
-                continue
-            elif t.startswith("type"):
-                query_tags.get("types")[tags.get(t)] = t
-                continue
-            # ignored tags
-            else:
-                logger.debug(
-                    "A query tag has been ignored during parsing: {}".format(t)
-                )
+    @classmethod
+    def tags_counts(cls, results: list) -> dict:
+        """Count the tags of search results by facet (same facets as :py:meth:`tags_to_dict`). \
+        Results must have been retrieved with the `tags` subresource included.
+
+        :param list results: search results, typically `search.results`
 
-        # return the output
-        return tags_as_dicts, query_as_dicts
+        :returns: a dictionary of tags counts by facet. Example: {"formats": {"format:shp": 12}}
+        :rtype: dict
+
+        :Example:
+
+        .. code-block:: python
+
+            search = isogeo.search(include=("tags",), whole_results=1)
+            counts = IsogeoUtils.tags_counts(search.results)
+            print(counts.get("formats"))
+        """
+        counts = {facet: {} for facet in sorted(_TAGS_FACETS.values())}
+        for md in results:
+            for tag in md.get("tags") or ():
+                facet = _tag_facet(tag)
+                if facet is None:
+                    continue
+                facet_counts = counts[facet]
+                facet_counts[tag] = facet_counts.get(tag, 0) + 1
+        return counts
 
     # -- API AUTH ------------------------------------------------------------
     @classmethod
@@ -998,6 +1042,12 @@ class IsogeoUtils(object):
             >>> 2019-06-13 16:21:38.191761
 
         """
+        # fast path, memoized
+        if isinstance(in_date, str):
+            out_date = _fast_datetime(in_date)
+            if out_date is not None:
+                return out_date
+
         if len(in_date) == 10:
             out_date = datetime.strptime(in_date, _dtm_simple)  # basic dates
         elif len(in_date) == 19:
@@ -1034,6 +1084,48 @@ class IsogeoUtils(object):
 
         return out_date
 
+    @classmethod
+    def hlpr_datetimes_search(
+        cls,
+        search,
+        fields: tuple = ("_created", "_modified", "created", "modified"),
+        as_numpy: bool = True,
+    ) -> dict:
+        """Helper to convert the dates of all the results of a search at once. Useful to sort or
+        filter big result sets by date.
+
+        :param MetadataSearch search: search whose results to convert. A list of results is also accepted.
+        :param tuple fields: results attributes to convert
+        :param bool as_numpy: if NumPy is installed, return arrays of `datetime64[us]` (missing \
+            dates being `NaT`) instead of lists of datetimes (missing dates being None).
+
+        :returns: a dictionary with an array or a list of datetimes by field, in results order
+        :rtype: dict
+
+        :Example:
+
+        .. code-block:: python
+
+            search = isogeo.search(whole_results=1)
+            dates = IsogeoUtils.hlpr_datetimes_search(search)
+            # index of the last modified metadata
+            last_modified = search.results[dates.get("_modified").argmax()]
+        """
+        results = search if isinstance(search, list) else search.results
+
+        out_dates = {}
+        for field in fields:
+            values = [
+                cls.hlpr_datetimes(i) if i else None
+                for i in (md.get(field) for md in results)
+            ]
+            if as_numpy and np is not None:
+                out_dates[field] = np.array(values, dtype="datetime64[us]")
+            else:
+                out_dates[field] = values
+
+        return out_dates
+
 
 # #############################################################################
 # ##### Stand alone program ########
@@ -0,0 +1,66 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Benchmarks of the bulk requests, against the local fake API.
+
+Usage from the repo root folder:
+
+```python
+pytest tests/benchmarks/bench_bulk.py -o addopts="" -o python_files="bench_*.py"
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# 3rd party
+import pytest
+
+# module target
+from isogeo_pysdk import Keyword
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+KEYWORDS = tuple(
+    Keyword(_id="{:032x}".format(i), code="bench-{}".format(i), text="Bench {}".format(i))
+    for i in range(10)
+)
+
+# #############################################################################
+# ########## Benchmarks ############
+# ##################################
+
+
+@pytest.mark.parametrize("fake_api", [1000], indirect=True)
+def test_bulk_prepare(benchmark, fake_api, isogeo):
+    """Prepare the association of 10 keywords with 1 000 metadata."""
+    app, _ = fake_api
+    md_ids = tuple(app.records)
+
+    def prepare():
+        isogeo.metadata.bulk.BULK_DATA.clear()
+        return isogeo.metadata.bulk.prepare(md_ids, "add", "keywords", KEYWORDS)
+
+    prepared = benchmark(prepare)
+    isogeo.metadata.bulk.BULK_DATA.clear()
+    assert len(prepared.query.get("ids")) == len(md_ids)
+
+
+@pytest.mark.parametrize("fake_api", [1000], indirect=True)
+@pytest.mark.parametrize("compress", [False, True], ids=["json", "gzip"])
+def test_bulk_send(benchmark, fake_api, isogeo, compress):
+    """Send 10 prepared requests associating 10 keywords with 100 metadata."""
+    app, _ = fake_api
+    md_ids = tuple(app.records)[:100]
+
+    def prepare():
+        for _ in range(10):
+            isogeo.metadata.bulk.prepare(md_ids, "add", "keywords", KEYWORDS)
+
+    reports = benchmark.pedantic(
+        isogeo.metadata.bulk.send, kwargs={"compress": compress}, setup=prepare, rounds=20
+    )
+    assert len(reports) == 10
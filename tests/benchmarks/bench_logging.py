@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Benchmarks of the logging overhead at INFO level, when debug messages are not emitted: \
+their arguments must not be formatted.
+
+Usage from the repo root folder:
+
+```python
+pytest tests/benchmarks/bench_logging.py -o addopts="" -o python_files="bench_*.py"
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# 3rd party
+import pytest
+
+# module target
+from isogeo_pysdk import IsogeoChecker
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+checker = IsogeoChecker()
+logger = logging.getLogger("isogeo_pysdk.bench")
+
+INVALID_UUIDS = ["not-an-uuid-{}".format(i) for i in range(10000)]
+VALUES = {"offset": 100, "page_size": 20, "url": "https://v1.api.isogeo.com/resources/search"}
+
+# #############################################################################
+# ########## Fixtures ##############
+# ##################################
+
+
+@pytest.fixture(autouse=True)
+def info_level():
+    """SDK logs at INFO level during the benchmark."""
+    sdk_logger = logging.getLogger("isogeo_pysdk")
+    previous = sdk_logger.level
+    sdk_logger.setLevel(logging.INFO)
+    yield
+    sdk_logger.setLevel(previous)
+
+
+# #############################################################################
+# ########## Benchmarks ############
+# ##################################
+
+
+def test_check_is_uuid_invalid(benchmark):
+    """Check 10 000 invalid UUIDs, each one logged at debug level."""
+    results = benchmark(lambda: [checker.check_is_uuid(value) for value in INVALID_UUIDS])
+    assert not any(results)
+
+
+@pytest.mark.parametrize("style", ["lazy", "eager"])
+def test_debug_message(benchmark, style):
+    """Cost of a debug message not emitted: lazy %-style arguments vs eager formatting."""
+    if style == "lazy":
+
+        def log():
+            logger.debug(
+                "Search %s with offset=%s - page_size=%s",
+                VALUES["url"],
+                VALUES["offset"],
+                VALUES["page_size"],
+            )
+
+    else:
+
+        def log():
+            logger.debug(
+                "Search {} with offset={} - page_size={}".format(
+                    VALUES["url"], VALUES["offset"], VALUES["page_size"]
+                )
+            )
+
+    benchmark(log)
@@ -0,0 +1,100 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Benchmarks of the CPU bound helpers: models construction and export, tags conversion and \
+search parameters checks. No request is sent.
+
+Usage from the repo root folder:
+
+```python
+pytest tests/benchmarks/bench_models.py -o addopts="" -o python_files="bench_*.py"
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+from copy import deepcopy
+from pathlib import Path
+
+# 3rd party
+import pytest
+
+# module target
+from isogeo_pysdk import IsogeoChecker, IsogeoUtils, Metadata
+from isogeo_pysdk.testing import generate_metadata
+from isogeo_pysdk.utils import _tags_to_dicts_cached
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+checker = IsogeoChecker()
+utils = IsogeoUtils()
+
+# #############################################################################
+# ########## Fixtures ##############
+# ##################################
+
+
+@pytest.fixture(scope="module")
+def metadata_complete() -> dict:
+    """Metadata with all its subresources, as returned by the API."""
+    with (FIXTURES / "resource_complete_1.json").open(encoding="UTF-8") as in_json:
+        return json.load(in_json)
+
+
+@pytest.fixture(scope="module")
+def search_tags() -> dict:
+    """Tags of 1 000 metadata and the query of the search."""
+    tags = {}
+    for md in generate_metadata(1000):
+        tags.update(md.get("tags"))
+    return tags, {"_tags": ["type:dataset"], "_terms": []}
+
+
+# #############################################################################
+# ########## Benchmarks ############
+# ##################################
+
+
+def test_metadata_clean_attributes(benchmark, metadata_complete):
+    """Build a Metadata from an API response."""
+    md = benchmark(lambda: Metadata.clean_attributes(dict(metadata_complete)))
+    assert md._id == metadata_complete.get("_id")
+
+
+def test_metadata_to_dict(benchmark, metadata_complete):
+    """Export a complete Metadata."""
+    md = Metadata.clean_attributes(deepcopy(metadata_complete))
+    assert benchmark(md.to_dict).get("_id") == metadata_complete.get("_id")
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["cold", "cached"])
+def test_tags_to_dict(benchmark, search_tags, cached):
+    """Convert search tags into facets dictionaries."""
+    tags, query = search_tags
+    setup = None if cached else _tags_to_dicts_cached.cache_clear
+    tags_dicts, _ = benchmark.pedantic(
+        utils.tags_to_dict,
+        kwargs={"tags": tags, "prev_query": query},
+        setup=setup,
+        rounds=200,
+    )
+    assert "keywords" in tags_dicts
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["", "type:dataset format:shp keyword:isogeo:keyword-1 water", "owner:" + "0" * 32],
+    ids=["empty", "filters", "owner"],
+)
+def test_check_request_parameters(benchmark, query):
+    """Check the parameters of a search request."""
+    parameters = {"q": query, "box": "-4.97,42.3,8.23,51.09", "rel": "intersects"}
+    benchmark(checker.check_request_parameters, parameters)
@@ -0,0 +1,67 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Benchmarks of the search paths: pagination of whole results, streamed parsing and search \
+models, against the local fake API.
+
+Usage from the repo root folder:
+
+```python
+# whole suite, compared with the previous run
+tox -e bench
+# specific
+pytest tests/benchmarks/bench_search.py -o addopts="" -o python_files="bench_*.py" -k whole_results
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# 3rd party
+import pytest
+
+# module target
+from isogeo_pysdk import MetadataSearch
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+# rounds by catalog size: large catalogs are long to paginate
+ROUNDS = {1000: 5, 10000: 3, 100000: 1}
+
+# #############################################################################
+# ########## Benchmarks ############
+# ##################################
+
+
+@pytest.mark.parametrize("fake_api", sorted(ROUNDS), indirect=True)
+def test_search_whole_results(benchmark, fake_api, isogeo):
+    """Retrieve all the metadata of the catalog, page by page."""
+    app, _ = fake_api
+    search = benchmark.pedantic(
+        isogeo.search, kwargs={"whole_results": 1}, rounds=ROUNDS.get(len(app.records))
+    )
+    assert len(search.results) == len(app.records)
+
+
+@pytest.mark.parametrize("fake_api", [1000], indirect=True)
+@pytest.mark.parametrize("stream", [False, True], ids=["json", "stream"])
+def test_search_page(benchmark, fake_api, isogeo, stream):
+    """Retrieve and parse one page of 100 metadata with their subresources."""
+    search = benchmark(
+        isogeo.search, page_size=100, include="all", stream=stream, tags_as_dicts=not stream
+    )
+    assert len(list(search.results)) == 100
+
+
+@pytest.mark.parametrize("fake_api", [1000], indirect=True)
+def test_search_models(benchmark, fake_api, isogeo):
+    """Build a MetadataSearch from a response and export it."""
+    content = isogeo.search(page_size=100, include="all").to_dict()
+
+    def build_and_export():
+        return MetadataSearch(**content).to_dict()
+
+    assert benchmark(build_and_export) == content
@@ -0,0 +1,55 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Shared fixtures of the benchmark suite: a local fake API per size of catalog and an \
+authenticated client. Nothing is sent to an Isogeo platform.
+
+See the `bench` environment in tox.ini to run the suite and compare with the previous runs.
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import logging
+
+# 3rd party
+import pytest
+
+# module target
+from isogeo_pysdk import Isogeo
+from isogeo_pysdk.testing import FAKE_CLIENT_ID, FAKE_CLIENT_SECRET, IsogeoFakeApi
+
+# #############################################################################
+# ########## Fixtures ##############
+# ##################################
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_logs():
+    """Keep the SDK logs out of the measures."""
+    logging.getLogger("isogeo_pysdk").setLevel(logging.ERROR)
+
+
+@pytest.fixture(scope="module")
+def fake_api(request):
+    """Fake API serving as many metadata as the parameter (100 by default)."""
+    with IsogeoFakeApi(total=getattr(request, "param", 100)).serve() as (app, url):
+        yield app, url
+
+
+@pytest.fixture(scope="module")
+def isogeo(fake_api):
+    """Client authenticated on the fake API."""
+    _, url = fake_api
+    client = Isogeo(
+        client_id=FAKE_CLIENT_ID,
+        client_secret=FAKE_CLIENT_SECRET,
+        auto_refresh_url="{}/oauth/token".format(url),
+        platform="custom",
+        isogeo_urls={"api_url": url},
+    )
+    client.connect()
+    yield client
+    client.close()
@@ -0,0 +1,180 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_api_hooks
+# for specific
+python -m unittest tests.test_api_hooks.TestIsogeoHooks.test_stats
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import gzip
+import json
+import threading
+import unittest
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+# 3rd party
+import requests
+
+# module target
+from isogeo_pysdk import IsogeoHooks
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+BODY = json.dumps({"results": [{"_id": "{:032x}".format(i)} for i in range(500)]}).encode()
+
+
+def gzip_app(environ, start_response):
+    """Minimal WSGI application returning a JSON body, compressed if accepted."""
+    headers = [("Content-Type", "application/json")]
+    body = BODY
+    if "gzip" in environ.get("HTTP_ACCEPT_ENCODING", ""):
+        body = gzip.compress(BODY)
+        headers.append(("Content-Encoding", "gzip"))
+    headers.append(("Content-Length", str(len(body))))
+    start_response("200 OK", headers)
+    return [body]
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoHooks(unittest.TestCase):
+    """Test custom hooks."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.server = make_server("127.0.0.1", 0, gzip_app, handler_class=QuietHandler)
+        cls.url = "http://127.0.0.1:{}".format(cls.server.server_port)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after all tests."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.hooks = IsogeoHooks()
+        self.session = requests.Session()
+        self.session.hooks["response"].append(self.hooks.track_response)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.session.close()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_track_transfer(self):
+        """Compressed and decoded bytes are recorded by route."""
+        response = self.session.get(self.url + "/resources/search")
+        self.assertEqual(response.json(), json.loads(BODY))
+        response = self.session.get(
+            self.url + "/resources/search", headers={"Accept-Encoding": "identity"}
+        )
+        self.assertEqual(response.content, BODY)
+
+        transfers = self.hooks.transfers.get("resources/search")
+        self.assertEqual(transfers.get("responses"), 2)
+        self.assertEqual(transfers.get("decoded"), 2 * len(BODY))
+        self.assertEqual(
+            transfers.get("wire"), len(gzip.compress(BODY)) + len(BODY)
+        )
+        self.assertLess(transfers.get("ratio"), 1)
+
+        self.hooks.reset()
+        self.assertEqual(self.hooks.transfers, {})
+
+    def test_track_transfer_once(self):
+        """Responses read again from their content are recorded once."""
+        response = self.session.get(self.url + "/resources/search")
+        self.assertEqual(b"".join(response.iter_content(chunk_size=1024)), BODY)
+        transfers = self.hooks.transfers.get("resources/search")
+        self.assertEqual(transfers.get("responses"), 1)
+        self.assertEqual(transfers.get("decoded"), len(BODY))
+
+    def test_track_transfer_stream(self):
+        """Streamed responses are recorded once read."""
+        response = self.session.get(self.url + "/resources/search", stream=True)
+        self.assertEqual(self.hooks.transfers, {})
+        content = b"".join(response.iter_content(chunk_size=1024))
+        self.assertEqual(content, BODY)
+        transfers = self.hooks.transfers.get("resources/search")
+        self.assertEqual(transfers.get("decoded"), len(BODY))
+        self.assertEqual(transfers.get("wire"), len(gzip.compress(BODY)))
+
+    def test_stats(self):
+        """Requests are counted by route template."""
+        for i in range(3):
+            self.session.post(
+                self.url + "/resources/{:032x}/links".format(i), data=b"x" * 10
+            )
+        self.hooks.record_retry(self.url + "/resources/{:032x}/links".format(0))
+        self.hooks.record_wait(self.url + "/resources/{:032x}/links".format(0), 0.5)
+        self.hooks.record_token_refresh()
+
+        stats = self.hooks.stats
+        self.assertEqual(stats.get("token_refreshes"), 1)
+        route = stats.get("routes").get("resources/{id}/links")
+        self.assertEqual(route.get("requests"), 3)
+        self.assertEqual(route.get("statuses"), {200: 3})
+        self.assertEqual(route.get("errors"), 0)
+        self.assertEqual(route.get("bytes_sent"), 30)
+        self.assertEqual(route.get("retries"), 1)
+        self.assertEqual(route.get("wait"), {"count": 1, "sum": 0.5})
+        latency = route.get("latency")
+        self.assertEqual(latency.get("count"), 3)
+        self.assertEqual(latency.get("buckets").get(float("inf")), 3)
+        buckets = list(latency.get("buckets").values())
+        self.assertEqual(sorted(buckets), buckets)
+
+    def test_to_prometheus(self):
+        """Metrics are exported in Prometheus text format."""
+        self.session.get(self.url + "/resources/search")
+        self.hooks.record_token_refresh()
+        text = self.hooks.to_prometheus(prefix="sdk")
+        self.assertTrue(text.endswith("\n"))
+        self.assertIn("# TYPE sdk_request_duration_seconds histogram", text)
+        self.assertIn(
+            'sdk_request_duration_seconds_bucket{route="resources/search",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn('sdk_responses_total{route="resources/search",status="200"} 1', text)
+        self.assertIn(
+            'sdk_response_bytes_total{{route="resources/search",encoding="decoded"}} {}'.format(
+                len(BODY)
+            ),
+            text,
+        )
+        self.assertIn("sdk_token_refreshes_total 1", text)
+        for line in text.splitlines():
+            if not line.startswith("#"):
+                float(line.rsplit(" ", 1)[1])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
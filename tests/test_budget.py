@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_budget
+# for specific
+python -m unittest tests.test_budget.TestIsogeoRequestBudget.test_budget_exceeded
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# module target
+from isogeo_pysdk import IsogeoRequestBudget, IsogeoScheduler, RequestBudgetExceededError
+from isogeo_pysdk.budget import record_request
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+API_URL = "https://v1.api.isogeo.com/"
+MD_URL = API_URL + "resources/{:032x}"
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoRequestBudget(unittest.TestCase):
+    """Test request budgets."""
+
+    # -- TESTS ---------------------------------------------------------
+    def test_budget_counts(self):
+        """Requests are counted by route, in nested budgets and scheduler workers."""
+        scheduler = IsogeoScheduler(max_workers=2)
+        with IsogeoRequestBudget() as outer:
+            record_request("GET", API_URL + "shares/")
+            with IsogeoRequestBudget() as inner:
+                futures = [
+                    scheduler.submit(record_request, "get", MD_URL.format(i))
+                    for i in range(4)
+                ]
+                for future in futures:
+                    future.result()
+        scheduler.shutdown()
+        # outside any budget
+        record_request("GET", API_URL + "shares/")
+
+        self.assertEqual(outer.total, 5)
+        self.assertEqual(outer.counts, {"GET shares": 1, "GET resources/{id}": 4})
+        self.assertEqual(inner.counts, {"GET resources/{id}": 4})
+        self.assertIn("GET resources/{id}", inner.report())
+
+    def test_budget_exceeded(self):
+        """Requests beyond the budget are refused."""
+        with self.assertRaises(RequestBudgetExceededError):
+            with IsogeoRequestBudget(max_requests=2) as budget:
+                for i in range(3):
+                    record_request("GET", MD_URL.format(i))
+        self.assertEqual(budget.total, 2)
+
+        with IsogeoRequestBudget(per_route={"GET resources/{id}": 1}) as budget:
+            record_request("GET", MD_URL.format(0))
+            record_request("PUT", MD_URL.format(0))
+            with self.assertRaises(RequestBudgetExceededError):
+                record_request("GET", MD_URL.format(1))
+
+        with IsogeoRequestBudget(per_route={"resources/{id}": 1}) as budget:
+            record_request("GET", MD_URL.format(0))
+            with self.assertRaises(RequestBudgetExceededError):
+                record_request("PUT", MD_URL.format(0))
+
+    def test_budget_findings(self):
+        """Repeated requests and N+1 patterns are reported."""
+        with self.assertLogs("isogeo_pysdk.budget", level="WARNING") as logs:
+            with IsogeoRequestBudget(repeat_threshold=3, n_plus_one_threshold=5) as budget:
+                for i in range(5):
+                    record_request("GET", API_URL + "groups/{:032x}/contacts".format(0))
+                    record_request("GET", MD_URL.format(i), params={"_include": "tags"})
+        findings = budget.findings
+        self.assertEqual(len(findings), 2)
+        self.assertTrue(findings[0].startswith("5 identical requests GET"))
+        self.assertIn("isogeo.contact.listing(caching=1)", findings[0])
+        self.assertIn("N+1 pattern: GET resources/{id}", findings[1])
+        self.assertIn("specific_md", findings[1])
+        self.assertEqual(len(logs.output), 2)
+
+        # alternatives depend on the route
+        with IsogeoRequestBudget(repeat_threshold=2) as budget:
+            for _ in range(2):
+                record_request("GET", API_URL + "resources/search", params={"q": "water"})
+                record_request("GET", MD_URL.format(0))
+                record_request("GET", API_URL + "thesauri")
+        findings = budget.findings
+        self.assertIn("search_cache_size", findings[0])
+        self.assertIn("specific_md", findings[1])
+        self.assertTrue(findings[2].endswith("reuse the first response."))
+        self.assertFalse(any("caching" in finding for finding in findings))
+
+        # different parameters are not identical requests
+        with IsogeoRequestBudget(repeat_threshold=2) as budget:
+            record_request("GET", API_URL + "resources/search", params={"_offset": 0})
+            record_request("GET", API_URL + "resources/search", params={"_offset": 100})
+        self.assertEqual(budget.findings, [])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
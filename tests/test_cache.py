@@ -0,0 +1,89 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_cache
+# for specific
+python -m unittest tests.test_cache.TestIsogeoCache.test_cache_lru
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from time import sleep
+
+# module target
+from isogeo_pysdk import ApiSearch, IsogeoCache
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoCache(unittest.TestCase):
+    """Test responses cache."""
+
+    # -- TESTS ---------------------------------------------------------
+    def test_cache_lru(self):
+        """The least recently used entry is dropped when the cache is full."""
+        cache = IsogeoCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.hits, 3)
+        self.assertEqual(cache.misses, 1)
+
+    def test_cache_ttl(self):
+        """Entries expire."""
+        cache = IsogeoCache(maxsize=2, ttl=0.05)
+        cache.set("a", 1)
+        sleep(0.1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ValueError):
+            IsogeoCache(maxsize=0)
+
+    def test_cache_generation(self):
+        """Values computed before an invalidation are not stored."""
+        cache = IsogeoCache()
+        generation = cache.generation
+        cache.clear()
+        cache.set("a", 1, generation=generation)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", 1, generation=cache.generation)
+        self.assertEqual(cache.get("a"), 1)
+
+    def test_search_cache_key(self):
+        """Search key ignores the order of query filters."""
+        payload = {"q": "type:dataset format:shp", "_limit": 20, "box": None}
+        key = ApiSearch._search_cache_key(payload, lang="fr")
+        self.assertEqual(
+            key,
+            ApiSearch._search_cache_key(
+                dict(payload, q="format:shp  type:dataset"), lang="fr"
+            ),
+        )
+        self.assertNotEqual(key, ApiSearch._search_cache_key(payload, lang="en"))
+        self.assertNotEqual(
+            key, ApiSearch._search_cache_key(dict(payload, _limit=10), lang="fr")
+        )
+        hash(key)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_checker_uuid
+# for specific
+python -m unittest tests.test_checker_uuid.TestIsogeoCheckerUuid.test_checker_many_uuids
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# Isogeo
+from isogeo_pysdk import IsogeoChecker
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+checker = IsogeoChecker()
+
+# #############################################################################
+# ######## Classes #################
+# ##################################
+
+
+class TestIsogeoCheckerUuid(unittest.TestCase):
+    """Test UUIDs checks: no credentials required."""
+
+    # -- TESTS ---------------------------------------------------------
+    def test_checker_many_uuids(self):
+        """Test batch UUIDs partition."""
+        valid, invalid = checker.check_many_uuids(
+            (
+                "0269803d50c446b09f5060ef7fe3e22b",
+                "0269803d50c446b09f5060ef7fe3e22",
+                "urn:isogeo:metadata:uuid:0269803d-50c4-46b0-9f50-60ef7fe3e22b",
+                2018,
+            )
+        )
+        self.assertEqual(
+            valid,
+            [
+                "0269803d50c446b09f5060ef7fe3e22b",
+                "urn:isogeo:metadata:uuid:0269803d-50c4-46b0-9f50-60ef7fe3e22b",
+            ],
+        )
+        self.assertEqual(invalid, ["0269803d50c446b09f5060ef7fe3e22", 2018])
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
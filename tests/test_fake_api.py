@@ -0,0 +1,253 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_fake_api
+# for specific
+python -m unittest tests.test_fake_api.TestFakeApi.test_search_whole_results
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import unittest
+from time import monotonic, sleep
+from unittest import mock
+
+# 3rd party
+from requests import Response
+from requests.exceptions import ChunkedEncodingError
+
+# module target
+from isogeo_pysdk import DeadlineExceededError, Isogeo, Keyword, MetadataSearch
+from isogeo_pysdk.testing import (
+    FAKE_CLIENT_ID,
+    FAKE_CLIENT_SECRET,
+    FAKE_WORKGROUP_ID,
+    IsogeoFakeApi,
+    generate_metadata,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestFakeApi(unittest.TestCase):
+    """Test the SDK against the local fake API, without platform nor credentials."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.fake_server = IsogeoFakeApi(total=250).serve()
+        cls.fake_api, cls.url = cls.fake_server.__enter__()
+        cls.isogeo = Isogeo(
+            client_id=FAKE_CLIENT_ID,
+            client_secret=FAKE_CLIENT_SECRET,
+            auto_refresh_url="{}/oauth/token".format(cls.url),
+            platform="custom",
+            isogeo_urls={"api_url": cls.url},
+            max_retries=5,
+        )
+        cls.isogeo.connect()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after all tests."""
+        cls.isogeo.close()
+        cls.fake_server.__exit__(None, None, None)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.fake_api.error_rate = 0
+        self.fake_api.max_rps = None
+
+    # -- TESTS ---------------------------------------------------------
+    def test_generate_metadata(self):
+        """Synthetic metadata are reproducible."""
+        self.assertEqual(generate_metadata(5, seed=3), generate_metadata(5, seed=3))
+        self.assertNotEqual(generate_metadata(5, seed=3), generate_metadata(5, seed=4))
+
+    def test_plain_http(self):
+        """Custom platforms can be requested over plain HTTP."""
+        self.assertEqual(self.isogeo.utils.api_prot, "http")
+        self.assertTrue(
+            self.isogeo.utils.get_request_base_url("resources").startswith("http://")
+        )
+
+    def test_search(self):
+        """Search filters, pagination and includes."""
+        search = self.isogeo.search(query="type:dataset", page_size=10, include=("tags",))
+        self.assertIsInstance(search, MetadataSearch)
+        self.assertEqual(len(search.results), 10)
+        self.assertLess(search.total, 250)
+        for md in search.results:
+            self.assertIn(md.get("type"), ("vectorDataset", "rasterDataset"))
+            self.assertIn("tags", md)
+            self.assertNotIn("keywords", md)
+
+        # ordering
+        search = self.isogeo.search(order_by="modified", order_dir="asc", page_size=50)
+        modified = [md.get("_modified") for md in search.results]
+        self.assertEqual(modified, sorted(modified))
+
+    def test_search_fields_transfer(self):
+        """Projected searches, parsed from the response content, are recorded once."""
+        self.isogeo.custom_hooks.reset()
+        search = self.isogeo.search(page_size=50, fields=("_id", "title"), stream=False)
+        self.assertEqual(len(search.results), 50)
+        transfers = self.isogeo.custom_hooks.transfers.get("resources/search")
+        self.assertEqual(transfers.get("responses"), 1)
+
+    def test_search_whole_results(self):
+        """All the pages are retrieved once."""
+        search = self.isogeo.search(whole_results=1)
+        self.assertEqual(search.total, 250)
+        self.assertEqual(len({md.get("_id") for md in search.results}), 250)
+
+    def test_search_async(self):
+        """Coroutines run the searches on the client scheduler."""
+        scheduler = self.isogeo.scheduler
+        with mock.patch.object(scheduler, "submit", wraps=scheduler.submit) as submit:
+            search = asyncio.run(self.isogeo.search_async(page_size=5))
+            self.assertEqual(len(search.results), 5)
+            self.assertEqual(submit.call_args_list[0][0][0], self.isogeo.search)
+
+        # deprecated entry point
+        with self.assertLogs("isogeo_pysdk.api.routes_search", level="WARNING"):
+            search = asyncio.run(
+                self.isogeo._api_search.search_metadata_asynchronous(
+                    total_results=250, include=(), specific_md=()
+                )
+            )
+        self.assertEqual(len({md.get("_id") for md in search.results}), 250)
+
+    def test_search_resilience(self):
+        """Throttling and failures are retried."""
+        self.fake_api.error_rate = 0.2
+        self.fake_api.max_rps = 20
+        search = self.isogeo.search(whole_results=1)
+        self.assertEqual(len(search.results), 250)
+
+    def test_token_retries(self):
+        """Token requests sent to another host than the API are retried."""
+        token_url = "{}/oauth/token".format(self.url.replace("127.0.0.1", "localhost"))
+        isogeo = Isogeo(
+            client_id=FAKE_CLIENT_ID,
+            client_secret=FAKE_CLIENT_SECRET,
+            auto_refresh_url=token_url,
+            platform="custom",
+            isogeo_urls={"api_url": self.url},
+        )
+        self.addCleanup(isogeo.close)
+        isogeo.connect()
+        adapter = isogeo.get_adapter(token_url)
+        send = adapter.send
+        failures = []
+
+        def send_unavailable_once(request, **kwargs):
+            if request.url != token_url or failures:
+                return send(request, **kwargs)
+            response = Response()
+            response.status_code = 503
+            response.url = request.url
+            response.request = request
+            response._content = b"{}"
+            failures.append(response)
+            return response
+
+        with mock.patch.object(adapter, "send", side_effect=send_unavailable_once):
+            isogeo.token = isogeo.refresh_token(token_url)
+        self.assertTrue(failures)
+        self.assertIn("access_token", isogeo.token)
+        self.assertEqual(isogeo.limiter.in_flight, 0)
+
+    def test_hedged_latency(self):
+        """Only the latency of the request winning a hedging race is recorded."""
+        isogeo = Isogeo(
+            client_id=FAKE_CLIENT_ID,
+            client_secret=FAKE_CLIENT_SECRET,
+            auto_refresh_url="{}/oauth/token".format(self.url),
+            platform="custom",
+            isogeo_urls={"api_url": self.url},
+            hedge_requests=True,
+        )
+        self.addCleanup(isogeo.close)
+        isogeo.connect()
+        for _ in range(isogeo.latencies.min_samples):
+            isogeo.latencies.record("resources/search", 0.01)
+
+        self.fake_api.latency = 0.1
+        try:
+            isogeo.search(page_size=1)
+            # let the losing request end
+            sleep(0.3)
+        finally:
+            self.fake_api.latency = 0.0
+        self.assertEqual(
+            len(isogeo.latencies._latencies.get("resources/search")),
+            isogeo.latencies.min_samples + 1,
+        )
+        self.assertEqual(isogeo.limiter.in_flight, 0)
+
+    def test_limiter_release_on_error(self):
+        """Slots of requests failing with any exception are given back to the limiter."""
+        adapter = self.isogeo.get_adapter(self.url)
+        with mock.patch.object(adapter, "send", side_effect=ChunkedEncodingError("broken")):
+            for _ in range(self.isogeo.limiter.concurrency):
+                with self.assertRaises(ChunkedEncodingError):
+                    self.isogeo.search(page_size=1)
+        self.assertEqual(self.isogeo.limiter.in_flight, 0)
+        self.assertEqual(len(self.isogeo.search(page_size=1).results), 1)
+
+    def test_deadline_slot_wait(self):
+        """Waiting for a request slot counts against the deadline."""
+        slots = self.isogeo.limiter.concurrency
+        for _ in range(slots):
+            self.isogeo.limiter.acquire()
+        try:
+            start = monotonic()
+            with self.isogeo.deadline(0.2), self.assertRaises(DeadlineExceededError):
+                self.isogeo.search(page_size=1)
+            self.assertLess(monotonic() - start, 1)
+        finally:
+            for _ in range(slots):
+                self.isogeo.limiter.cancel()
+        self.assertEqual(self.isogeo.limiter.in_flight, 0)
+
+    def test_metadata_and_bulk(self):
+        """Metadata are read and edited in bulk."""
+        ids = [md.get("_id") for md in self.isogeo.search(page_size=2).results]
+        keyword = Keyword(_id="e" * 32, code="fake", text="Fake")
+        self.isogeo.metadata.bulk.prepare(
+            metadatas=ids + ["f" * 32], action="add", target="keywords", models=(keyword,)
+        )
+        reports = self.isogeo.metadata.bulk.send(compress=True)
+        self.assertEqual(reports[0].ignored, {"f" * 32: "notFound"})
+
+        md = self.isogeo.metadata.get(ids[0], include=("keywords",))
+        self.assertIn("Fake", [kw.get("text") for kw in md.keywords])
+
+    def test_listings(self):
+        """Workgroup catalogs, contacts and keywords are listed."""
+        catalogs = self.isogeo.catalog.listing(workgroup_id=FAKE_WORKGROUP_ID)
+        self.assertEqual(len(catalogs), 5)
+        contacts = self.isogeo.contact.listing(workgroup_id=FAKE_WORKGROUP_ID)
+        self.assertEqual(len(contacts), 10)
+        keywords = self.isogeo.keyword.workgroup(workgroup_id=FAKE_WORKGROUP_ID)
+        self.assertEqual(keywords.total, 20)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
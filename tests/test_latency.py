@@ -0,0 +1,96 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_latency
+# for specific
+python -m unittest tests.test_latency.TestLatency.test_deadline_nested
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from time import sleep
+
+# module target
+from isogeo_pysdk import (
+    DeadlineExceededError,
+    IsogeoLatencyTracker,
+    IsogeoScheduler,
+    deadline,
+)
+from isogeo_pysdk.latency import deadline_timeout, remaining_time
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestLatency(unittest.TestCase):
+    """Test latency tracking and deadlines."""
+
+    # -- TESTS ---------------------------------------------------------
+    def test_tracker_percentile(self):
+        """Percentiles are computed by route once there are enough samples."""
+        tracker = IsogeoLatencyTracker(window=100, min_samples=10)
+        for i in range(5):
+            tracker.record("resources/{id}", i)
+        self.assertIsNone(tracker.percentile("resources/{id}"))
+        for i in range(200):
+            tracker.record("resources/{id}", i)
+        # only the last 100 latencies are kept
+        self.assertEqual(tracker.percentile("resources/{id}", 0.5), 150)
+        self.assertEqual(tracker.percentile("resources/{id}", 0.95), 195)
+        self.assertIsNone(tracker.percentile("about"))
+        self.assertEqual(list(tracker.routes()), ["resources/{id}"])
+
+    def test_deadline_timeout(self):
+        """Timeouts are reduced to the remaining time."""
+        self.assertIsNone(remaining_time())
+        self.assertEqual(deadline_timeout((5, 200)), (5, 200))
+        with deadline(2):
+            connect, read = deadline_timeout((5, 200))
+            self.assertLessEqual(read, 2)
+            self.assertLessEqual(connect, 2)
+            self.assertLessEqual(deadline_timeout(1), 1)
+            self.assertLessEqual(deadline_timeout(None), 2)
+        with deadline(0.01):
+            sleep(0.02)
+            with self.assertRaises(DeadlineExceededError):
+                deadline_timeout(10)
+        self.assertIsNone(remaining_time())
+
+    def test_deadline_nested(self):
+        """Nested deadlines can't extend the enclosing one."""
+        with deadline(1):
+            with deadline(60):
+                self.assertLessEqual(remaining_time(), 1)
+            with deadline(0.5):
+                self.assertLessEqual(remaining_time(), 0.5)
+            self.assertGreater(remaining_time(), 0.5)
+
+    def test_deadline_propagation(self):
+        """Deadline is propagated to the scheduler workers."""
+        scheduler = IsogeoScheduler(max_workers=2)
+        try:
+            with deadline(5):
+                remaining = scheduler.submit(remaining_time).result()
+            self.assertIsNotNone(remaining)
+            self.assertLessEqual(remaining, 5)
+            self.assertIsNone(scheduler.submit(remaining_time).result())
+        finally:
+            scheduler.shutdown()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
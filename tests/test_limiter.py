@@ -0,0 +1,142 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_limiter
+# for specific
+python -m unittest tests.test_limiter.TestIsogeoLimiter.test_limiter_aimd
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+import unittest
+from email.utils import formatdate
+from time import monotonic, sleep, time
+
+# module target
+from isogeo_pysdk import IsogeoLimiter, priority
+from isogeo_pysdk.limiter import parse_retry_after
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoLimiter(unittest.TestCase):
+    """Test adaptive concurrency limiter."""
+
+    # -- TESTS ---------------------------------------------------------
+    def test_limiter_aimd(self):
+        """Limit grows while latency is healthy and is cut on overload."""
+        limiter = IsogeoLimiter(max_limit=20, initial_limit=4)
+        for _ in range(40):
+            self.assertTrue(limiter.acquire())
+            limiter.release(0.05)
+        self.assertGreater(limiter.concurrency, 4)
+        self.assertLessEqual(limiter.concurrency, 20)
+
+        before = limiter.limit
+        limiter.acquire()
+        limiter.release(0.05, overloaded=True)
+        self.assertAlmostEqual(limiter.limit, before / 2)
+        # a burst of failures only cuts once
+        limiter.acquire()
+        limiter.release(0.05, overloaded=True)
+        self.assertAlmostEqual(limiter.limit, before / 2)
+
+        # slow responses don't increase the limit
+        limit = limiter.limit
+        limiter.acquire()
+        limiter.release(10)
+        self.assertEqual(limiter.limit, limit)
+
+    def test_limiter_slots(self):
+        """No more requests than the limit are allowed."""
+        limiter = IsogeoLimiter(max_limit=2, initial_limit=2)
+        self.assertTrue(limiter.acquire())
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire(timeout=0.05))
+        limiter.release(0.01)
+        self.assertTrue(limiter.acquire(timeout=0.05))
+
+        # slots of requests not sent are given back as is
+        limit = limiter.limit
+        limiter.cancel()
+        self.assertEqual(limiter.in_flight, 1)
+        self.assertEqual(limiter.limit, limit)
+
+        # pause
+        limiter = IsogeoLimiter()
+        limiter.pause(0.2)
+        start = monotonic()
+        self.assertTrue(limiter.acquire())
+        self.assertGreaterEqual(monotonic() - start, 0.15)
+
+    def test_limiter_priorities(self):
+        """Batch requests use a share of the limit and give way to interactive ones."""
+        limiter = IsogeoLimiter(max_limit=4, initial_limit=4, batch_ratio=0.5)
+        with priority("batch"):
+            self.assertTrue(limiter.acquire(timeout=0.01))
+            self.assertTrue(limiter.acquire(timeout=0.01))
+            self.assertFalse(limiter.acquire(timeout=0.01))
+        self.assertEqual(limiter.in_flight_batch, 2)
+        self.assertTrue(limiter.acquire(timeout=0.01, priority="interactive"))
+        self.assertTrue(limiter.acquire(timeout=0.01))
+        self.assertFalse(limiter.acquire(timeout=0.01))
+
+        # freed slots go to interactive requests first
+        waiting = []
+        thread = threading.Thread(
+            target=lambda: waiting.append(limiter.acquire(timeout=2))
+        )
+        thread.start()
+        sleep(0.05)
+        with priority("batch"):
+            limiter.release(0.01)
+            self.assertFalse(limiter.acquire(timeout=0.05))
+        thread.join()
+        self.assertEqual(waiting, [True])
+        self.assertEqual(limiter.in_flight_batch, 1)
+
+        with self.assertRaises(ValueError):
+            with priority("urgent"):
+                pass
+
+    def test_limiter_retry_budget(self):
+        """Retries are limited by a budget credited by requests."""
+        limiter = IsogeoLimiter(retry_ratio=0.5, retry_reserve=2)
+        self.assertTrue(limiter.withdraw())
+        self.assertTrue(limiter.withdraw())
+        self.assertFalse(limiter.withdraw())
+        limiter.deposit()
+        limiter.deposit()
+        self.assertTrue(limiter.withdraw())
+
+        # backoff
+        for attempt in range(5):
+            self.assertLessEqual(limiter.backoff(attempt), 0.5 * 2 ** attempt)
+        self.assertGreaterEqual(limiter.backoff(0, retry_after=3), 3)
+
+    def test_retry_after(self):
+        """Retry-After header is read as seconds or HTTP date."""
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertAlmostEqual(
+            parse_retry_after(formatdate(time() + 60, usegmt=True)), 60, delta=2
+        )
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
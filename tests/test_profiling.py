@@ -0,0 +1,113 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_profiling
+# for specific
+python -m unittest tests.test_profiling.TestIsogeoProfiler.test_profile_search
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import Isogeo, IsogeoProfiler
+from isogeo_pysdk.profiling import profile_operation
+from isogeo_pysdk.testing import FAKE_CLIENT_ID, FAKE_CLIENT_SECRET, IsogeoFakeApi
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoProfiler(unittest.TestCase):
+    """Test profiling of the SDK operations."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.fake_server = IsogeoFakeApi(total=300, latency=0.01).serve()
+        _, url = cls.fake_server.__enter__()
+        cls.isogeo = Isogeo(
+            client_id=FAKE_CLIENT_ID,
+            client_secret=FAKE_CLIENT_SECRET,
+            auto_refresh_url="{}/oauth/token".format(url),
+            platform="custom",
+            isogeo_urls={"api_url": url},
+        )
+        cls.isogeo.connect()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after all tests."""
+        cls.isogeo.close()
+        cls.fake_server.__exit__(None, None, None)
+
+    # -- TESTS ---------------------------------------------------------
+    def test_disabled(self):
+        """Operations are not profiled without profiler."""
+        with profile_operation("nothing") as operation:
+            self.assertIsNone(operation)
+
+    def test_profile_search(self):
+        """Route methods are profiled, with their pages sent by the scheduler workers."""
+        with self.isogeo.profile(top=5) as profiler:
+            self.isogeo.search(whole_results=1, include=("tags",), tags_as_dicts=1)
+        self.isogeo.search(page_size=1)  # not profiled
+
+        operations = profiler.by_operation
+        self.assertEqual(list(operations), ["ApiSearch.search"])
+        search = operations.get("ApiSearch.search")
+        # whole search + its 3 pages of 100 metadata, run in workers
+        self.assertEqual(search.get("calls"), 4)
+        # 1 request for the total, then 1 per page counted in the page and in the whole search
+        self.assertEqual(search.get("requests"), 1 + 2 * 3)
+        self.assertGreaterEqual(search.get("network"), 0.01 * 4)
+        self.assertGreater(search.get("memory_peak"), 0)
+        whole = max(profiler.operations, key=lambda op: op.get("wall"))
+        self.assertLessEqual(whole.get("cpu"), whole.get("wall"))
+
+        summary = profiler.summary()
+        self.assertIn("ApiSearch.search", summary)
+        self.assertIn("Ordered by: cumulative time", summary)
+        self.assertIn("Memory allocated by ApiSearch.search", summary)
+
+        stacks = profiler.collapsed_stacks()
+        self.assertTrue(stacks)
+        for line in stacks:
+            stack, microseconds = line.rsplit(" ", 1)
+            self.assertTrue(stack)
+            self.assertGreater(int(microseconds), 0)
+        self.assertTrue(any("routes_search.py:search" in line for line in stacks))
+
+    def test_dump(self):
+        """Reports are written into a folder."""
+        with IsogeoProfiler(memory=False) as profiler:
+            self.isogeo.metadata.get(self.isogeo.search(page_size=1).results[0].get("_id"))
+        self.assertEqual(len(profiler.operations), 2)
+        self.assertIsNone(profiler.operations[0].get("memory_peak"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            summary, stats, collapsed = profiler.dump(Path(tmp_dir) / "profile")
+            self.assertIn("ApiMetadata.get", summary.read_text(encoding="utf-8"))
+            self.assertTrue(pstats.Stats(str(stats)).total_calls)
+            self.assertTrue(collapsed.read_text(encoding="utf-8").strip())
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
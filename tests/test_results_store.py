@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_results_store
+# for specific
+python -m unittest tests.test_results_store.TestIsogeoDiskResults.test_store_sequence
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# module target
+from isogeo_pysdk import IsogeoDiskResults
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoDiskResults(unittest.TestCase):
+    """Test disk-backed search results."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.records = [
+            {"_id": "{:032x}".format(i), "title": "Métadonnée {}".format(i)}
+            for i in range(250)
+        ]
+        self.store = IsogeoDiskResults()
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.store.close()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_store_sequence(self):
+        """Stored records are accessible as a sequence."""
+        self.store.extend(self.records[:100])
+        self.store.extend(self.records[100:])
+        self.store.append({"_id": "last"})
+
+        self.assertEqual(len(self.store), 251)
+        self.assertEqual(self.store[0], self.records[0])
+        self.assertEqual(self.store[-1], {"_id": "last"})
+        self.assertEqual(self.store[10:13], self.records[10:13])
+        self.assertEqual(list(self.store)[:250], self.records)
+        with self.assertRaises(IndexError):
+            self.store[251]
+
+    def test_store_append_while_reading(self):
+        """Records can be added after some have been read."""
+        self.store.extend(self.records[:10])
+        self.assertEqual(self.store[5], self.records[5])
+        self.store.extend(self.records[10:])
+        self.assertEqual(list(self.store), self.records)
+
+    def test_store_close(self):
+        """Closing deletes the temporary file."""
+        self.store.extend(self.records)
+        self.store.close()
+        self.assertTrue(self.store.closed)
+        with self.assertRaises(ValueError):
+            self.store[0]
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_scheduler
+# for specific
+python -m unittest tests.test_scheduler.TestIsogeoScheduler.test_scheduler_nested
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+import unittest
+from time import sleep
+
+# module target
+from isogeo_pysdk import IsogeoScheduler
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoScheduler(unittest.TestCase):
+    """Test shared executor."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.scheduler = IsogeoScheduler(max_workers=2)
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.scheduler.shutdown()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_scheduler_cap(self):
+        """No more tasks than workers run at the same time."""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def task(i):
+            with lock:
+                running.append(i)
+                peak.append(len(running))
+            sleep(0.01)
+            with lock:
+                running.remove(i)
+            return i
+
+        futures = [self.scheduler.submit(task, i) for i in range(10)]
+        self.assertEqual([f.result() for f in futures], list(range(10)))
+        self.assertLessEqual(max(peak), 2)
+
+    def test_scheduler_nested(self):
+        """Tasks submitted from a worker are executed inline instead of deadlocking."""
+
+        def fan_out():
+            futures = [self.scheduler.submit(pow, 2, i) for i in range(5)]
+            return [f.result(timeout=1) for f in futures]
+
+        outer = [self.scheduler.submit(fan_out) for _ in range(4)]
+        for future in outer:
+            self.assertEqual(future.result(timeout=5), [1, 2, 4, 8, 16])
+
+        # errors are set on the future
+        nested_error = self.scheduler.submit(
+            lambda: self.scheduler.submit(int, "a").exception()
+        )
+        self.assertIsInstance(nested_error.result(), ValueError)
+
+    def test_scheduler_shutdown(self):
+        """No task can be submitted after shutdown."""
+        self.assertEqual(self.scheduler.submit(sum, (1, 2)).result(), 3)
+        self.scheduler.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.scheduler.submit(sum, (1, 2))
+        with self.assertRaises(ValueError):
+            IsogeoScheduler(max_workers=0)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_search_keyset
+# for specific
+python -m unittest tests.test_search_keyset.TestSearchKeyset.test_concurrent_edits
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from datetime import datetime, timezone
+from itertools import islice
+
+# module target
+from isogeo_pysdk import Isogeo
+from isogeo_pysdk.testing import (
+    FAKE_CLIENT_ID,
+    FAKE_CLIENT_SECRET,
+    IsogeoFakeApi,
+    generate_metadata,
+)
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSearchKeyset(unittest.TestCase):
+    """Test keyset pagination of searches against the fake API."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Executed before each test."""
+        self.fake_api = IsogeoFakeApi(total=200)
+        self.fake_server = self.fake_api.serve()
+        _, url = self.fake_server.__enter__()
+        self.isogeo = Isogeo(
+            client_id=FAKE_CLIENT_ID,
+            client_secret=FAKE_CLIENT_SECRET,
+            auto_refresh_url="{}/oauth/token".format(url),
+            platform="custom",
+            isogeo_urls={"api_url": url},
+        )
+        self.isogeo.connect()
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.isogeo.close()
+        self.fake_server.__exit__(None, None, None)
+
+    def _edit_catalog(self, edited=(), deleted=(), created=()):
+        """Edit the fake API catalog as another client would do."""
+        now = datetime.now(timezone.utc).isoformat()
+        with self.fake_api._lock:
+            for md_id in edited:
+                self.fake_api.records.get(md_id)["_modified"] = now
+            for md_id in deleted:
+                del self.fake_api.records[md_id]
+            for md in created:
+                md["_created"] = md["_modified"] = now
+                self.fake_api.records[md.get("_id")] = md
+            self.fake_api._searches.clear()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_search_keyset(self):
+        """All the metadata are returned once, sorted, as they are consumed."""
+        for order_dir in ("asc", "desc"):
+            search = self.isogeo.search_keyset(page_size=30, order_dir=order_dir)
+            self.assertEqual(search.total, 200)
+            reference = self.isogeo.search(
+                order_by="_modified", order_dir=order_dir, whole_results=1
+            )
+            self.assertEqual(
+                [md.get("_id") for md in search.results],
+                [md.get("_id") for md in reference.results],
+            )
+
+        # fields required to paginate are kept
+        search = self.isogeo.search_keyset(order_by="_created", fields=("title",))
+        self.assertEqual(len({md.get("_id") for md in search.results}), 200)
+
+    def test_concurrent_edits(self):
+        """Edits during the harvest neither duplicate nor miss metadata."""
+        search = self.isogeo.search_keyset(page_size=20)
+        harvested = [md.get("_id") for md in islice(search.results, 55)]
+        remaining = [
+            md.get("_id")
+            for md in self.isogeo.search(
+                order_by="_modified", order_dir="asc", whole_results=1
+            ).results[55:]
+        ]
+        created = generate_metadata(2, seed=2)
+        # the page being consumed is already received: edit the metadata after it
+        self._edit_catalog(
+            edited=harvested[10:15] + remaining[10:15],
+            deleted=harvested[:3] + remaining[20:23],
+            created=created,
+        )
+        harvested.extend(md.get("_id") for md in search.results)
+
+        self.assertEqual(len(harvested), len(set(harvested)))
+        expected = set(self.fake_api.records) | set(harvested[:55])
+        self.assertEqual(set(harvested), expected)
+        self.assertTrue({md.get("_id") for md in created}.issubset(harvested))
+
+    def test_deletions_before_anchor(self):
+        """Deleting pages of metadata already received doesn't end the harvest early."""
+        all_ids = set(self.fake_api.records)
+        search = self.isogeo.search_keyset(page_size=20)
+        harvested = [md.get("_id") for md in islice(search.results, 150)]
+        # next page is requested past the new end of the results
+        self._edit_catalog(deleted=harvested[:100])
+        harvested.extend(md.get("_id") for md in search.results)
+
+        self.assertEqual(len(harvested), len(set(harvested)))
+        self.assertEqual(set(harvested), all_ids)
+
+    def test_bad_parameters(self):
+        """Only creation and modification dates can be used to paginate."""
+        with self.assertRaises(ValueError):
+            self.isogeo.search_keyset(order_by="title")
+        with self.assertRaises(ValueError):
+            self.isogeo.search_keyset(page_size=1)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
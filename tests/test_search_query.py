@@ -0,0 +1,88 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_search_query
+# for specific
+python -m unittest tests.test_search_query.TestSearchQuery.test_query_parse
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+
+# module target
+from isogeo_pysdk import IsogeoChecker, SearchQuery
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+checker = IsogeoChecker()
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestSearchQuery(unittest.TestCase):
+    """Test parsed search queries."""
+
+    # -- TESTS ---------------------------------------------------------
+    def test_query_parse(self):
+        """Terms and filters are split."""
+        query = SearchQuery.from_string(
+            "oil keyword:isogeo:2018 type:vector-dataset  keyword:inspire-theme:hydrography"
+        )
+        self.assertEqual(query.terms, ("oil",))
+        self.assertEqual(
+            query.filters.get("keyword"), ("isogeo:2018", "inspire-theme:hydrography")
+        )
+        self.assertEqual(query.filters.get("type"), ("vector-dataset",))
+        self.assertEqual(len(query.tokens), 4)
+
+    def test_query_immutable_hashable(self):
+        """Queries are immutable, cached and equal whatever the order of tokens."""
+        query = SearchQuery.from_string("oil format:shp")
+        self.assertIs(query, SearchQuery.from_string("oil format:shp"))
+        self.assertEqual(query, SearchQuery.from_string("format:shp oil"))
+        self.assertEqual(len({query, SearchQuery("format:shp  oil")}), 1)
+        with self.assertRaises(AttributeError):
+            query.foo = "bar"
+        with self.assertRaises(TypeError):
+            query.filters["format"] = ("dwg",)
+        with self.assertRaises(TypeError):
+            SearchQuery(["oil"])
+
+    def test_query_check(self):
+        """Queries are checked by the checker."""
+        checker.check_request_parameters({"q": "type:dataset share:" + "0" * 32})
+        checker.check_request_parameters({"q": SearchQuery.from_string("")})
+        checker.check_request_parameters({"q": None})
+        with self.assertRaises(ValueError):
+            checker.check_request_parameters({"q": "type:dataset type:service"})
+        with self.assertRaises(ValueError):
+            checker.check_request_parameters({"q": "type:nothing"})
+        with self.assertRaises(ValueError):
+            checker.check_request_parameters({"q": "provider:robot"})
+        with self.assertRaises(ValueError):
+            checker.check_request_parameters({"q": "action:eat"})
+
+        # every value is checked, whatever the order of the filters
+        for q in ("action:oops action:download", "action:download action:oops"):
+            with self.assertRaises(ValueError):
+                checker.check_request_parameters({"q": q})
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_singleflight
+# for specific
+python -m unittest tests.test_singleflight.TestIsogeoSingleFlight.test_single_flight_threads
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import threading
+import unittest
+from time import monotonic, sleep
+
+# module target
+from isogeo_pysdk import DeadlineExceededError, IsogeoSingleFlight, deadline
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoSingleFlight(unittest.TestCase):
+    """Test coalescing of identical calls."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.single_flight = IsogeoSingleFlight()
+        self.calls = []
+        self.release = threading.Event()
+
+    def _slow_call(self, value):
+        self.calls.append(value)
+        self.release.wait(timeout=5)
+        if value == "error":
+            raise ValueError(value)
+        return value
+
+    def _run_threads(self, keys_values: list) -> list:
+        results = []
+        errors = []
+
+        def target(key, value):
+            try:
+                results.append(self.single_flight.do(key, self._slow_call, value))
+            except ValueError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=target, args=kv) for kv in keys_values]
+        for thread in threads:
+            thread.start()
+        # let all the threads reach the registry before releasing the calls
+        sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    # -- TESTS ---------------------------------------------------------
+    def test_single_flight_threads(self):
+        """Identical concurrent calls are executed once."""
+        results, errors = self._run_threads([("a", "a")] * 5 + [("b", "b")])
+        self.assertEqual(sorted(self.calls), ["a", "b"])
+        self.assertEqual(len(results), 6)
+        self.assertEqual(sum(shared for _, shared in results), 4)
+        self.assertEqual(self.single_flight.shared, 4)
+        self.assertEqual(len(self.single_flight), 0)
+        self.assertFalse(errors)
+
+    def test_single_flight_error(self):
+        """Exception of the call is raised to all the callers."""
+        results, errors = self._run_threads([("e", "error")] * 3)
+        self.assertEqual(self.calls, ["error"])
+        self.assertEqual(len(errors), 3)
+        self.assertFalse(results)
+
+    def test_single_flight_deadline(self):
+        """Callers waiting for the call in flight give up at their deadline."""
+        leader = threading.Thread(target=self.single_flight.do, args=("a", self._slow_call, 1))
+        leader.start()
+        sleep(0.1)
+        start = monotonic()
+        with deadline(0.1), self.assertRaises(DeadlineExceededError):
+            self.single_flight.do("a", self._slow_call, 2)
+        self.assertLess(monotonic() - start, 1)
+        self.release.set()
+        leader.join()
+        self.assertEqual(self.calls, [1])
+
+    def test_single_flight_log(self):
+        """The key of the calls, which may hold a token, is not logged."""
+        key = ("GET", "https://api.isogeo.com/about", "secret_token")
+        leader = threading.Thread(target=self.single_flight.do, args=(key, self._slow_call, 1))
+        leader.start()
+        sleep(0.1)
+        threading.Timer(0.1, self.release.set).start()
+        with self.assertLogs("isogeo_pysdk.singleflight", level="DEBUG") as logs:
+            self.assertEqual(self.single_flight.do(key, self._slow_call, 2), (1, True))
+        leader.join()
+        self.assertNotIn("secret_token", "".join(logs.output))
+
+    def test_single_flight_sequential(self):
+        """Calls which don't overlap are not coalesced."""
+        self.release.set()
+        self.assertEqual(self.single_flight.do("a", self._slow_call, 1), (1, False))
+        self.assertEqual(self.single_flight.do("a", self._slow_call, 2), (2, False))
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_stream_parser
+# for specific
+python -m unittest tests.test_stream_parser.TestIsogeoStreamParser.test_stream_small_chunks
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import json
+import unittest
+from pathlib import Path
+
+# module target
+from isogeo_pysdk import IsogeoStreamParser
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+fixtures_dir = Path(__file__).parent / "fixtures"
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoStreamParser(unittest.TestCase):
+    """Test incremental parsing of search responses."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        with Path(fixtures_dir, "resource_complete_1.json").open(encoding="utf-8") as f:
+            metadata = json.load(f)
+        with Path(fixtures_dir, "out_api_search_tags_providers.json").open(
+            encoding="utf-8"
+        ) as f:
+            cls.search = json.load(f)
+        cls.search["results"] = [dict(metadata, _id=str(i)) for i in range(25)]
+        cls.search_bytes = json.dumps(cls.search, indent=2).encode("utf-8")
+
+    def _parse_by_chunks(self, chunk_size: int):
+        members = {}
+        parser = IsogeoStreamParser(on_member=members.__setitem__)
+        items = []
+        for i in range(0, len(self.search_bytes), chunk_size):
+            items.extend(parser.feed(self.search_bytes[i : i + chunk_size]))
+        items.extend(parser.close())
+        return items, members
+
+    # -- TESTS ---------------------------------------------------------
+    def test_stream_one_chunk(self):
+        """Parse a response received in one piece."""
+        items, members = self._parse_by_chunks(len(self.search_bytes))
+        self.assertEqual(items, self.search.get("results"))
+        self.assertEqual(members.get("total"), self.search.get("total"))
+        self.assertEqual(members.get("tags"), self.search.get("tags"))
+        self.assertNotIn("results", members)
+
+    def test_stream_small_chunks(self):
+        """Parse a response received in small pieces, splitting numbers and UTF-8 characters."""
+        for chunk_size in (1, 7, 1024):
+            items, members = self._parse_by_chunks(chunk_size)
+            self.assertEqual(items, self.search.get("results"))
+            self.assertEqual(members.get("total"), self.search.get("total"))
+            self.assertIsNone(members.get("envelope"))
+
+    def test_stream_items_before_end(self):
+        """Results are available before the end of the response."""
+        parser = IsogeoStreamParser()
+        half = len(self.search_bytes) // 2
+        self.assertGreater(len(parser.feed(self.search_bytes[:half])), 0)
+        self.assertTrue(parser.array_started)
+        self.assertFalse(parser.done)
+
+    def test_stream_item_hook(self):
+        """Hook is applied on each item."""
+        parser = IsogeoStreamParser(item_hook=lambda md: md.get("_id"))
+        items = parser.feed(self.search_bytes) + parser.close()
+        self.assertEqual(items, [str(i) for i in range(25)])
+
+    def test_stream_truncated(self):
+        """A truncated response raises an error."""
+        parser = IsogeoStreamParser()
+        parser.feed(self.search_bytes[:-10])
+        with self.assertRaises(ValueError):
+            parser.close()
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_tracing
+# for specific
+python -m unittest tests.test_tracing.TestTracing.test_span_scheduler
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import asyncio
+import unittest
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# module target
+from isogeo_pysdk import IsogeoScheduler, set_tracer
+from isogeo_pysdk.tracing import get_tracer, span
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+_current = ContextVar("test_span", default=None)
+
+
+class RecordingSpan(object):
+    """Minimal span keeping its parent and attributes."""
+
+    def __init__(self, name: str, parent, attributes: dict):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes)
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+
+class RecordingTracer(object):
+    """Minimal tracer with the OpenTelemetry `start_as_current_span` interface."""
+
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: dict = None):
+        current = RecordingSpan(name, _current.get(), attributes or {})
+        self.spans.append(current)
+        token = _current.set(current)
+        try:
+            yield current
+        finally:
+            _current.reset(token)
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestTracing(unittest.TestCase):
+    """Test optional tracing."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.tracer = RecordingTracer()
+        set_tracer(self.tracer)
+
+    def tearDown(self):
+        """Executed after each test."""
+        set_tracer(None)
+
+    # -- TESTS ---------------------------------------------------------
+    def test_noop(self):
+        """Spans are not created without tracer."""
+        set_tracer(None)
+        self.assertIsNone(get_tracer())
+        with span("search") as current:
+            self.assertIsNone(current)
+        with self.assertRaises(TypeError):
+            set_tracer(object())
+
+    def test_span_scheduler(self):
+        """Spans created in scheduler workers are children of the submitting span."""
+        scheduler = IsogeoScheduler(max_workers=4)
+
+        def page(offset: int):
+            with span("page", {"offset": offset}) as current:
+                return current
+
+        with span("search") as parent:
+            futures = [scheduler.submit(page, offset) for offset in range(0, 500, 100)]
+            pages = [future.result() for future in futures]
+        scheduler.shutdown()
+
+        self.assertEqual(len(self.tracer.spans), 6)
+        self.assertIsNone(parent.parent)
+        for index, current in enumerate(pages):
+            self.assertIs(current.parent, parent)
+            self.assertEqual(current.attributes.get("offset"), index * 100)
+
+    def test_span_async(self):
+        """Spans created in threads of async methods are children of the awaiting span."""
+
+        def keywords():
+            with span("keywords") as current:
+                return current
+
+        async def main():
+            with span("harvest") as parent:
+                return parent, await asyncio.to_thread(keywords)
+
+        parent, child = asyncio.run(main())
+        self.assertIs(child.parent, parent)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_transports
+# for specific
+python -m unittest tests.test_transports.TestIsogeoHttp2Adapter.test_adapter_get
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import gzip
+import json
+import tempfile
+import threading
+import unittest
+from os import environ
+from pathlib import Path
+from unittest import mock
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+# 3rd party
+import requests
+
+# module target
+from isogeo_pysdk import Isogeo, ResponseNotRecordedError, transports
+from isogeo_pysdk.testing import FAKE_CLIENT_ID, FAKE_CLIENT_SECRET, IsogeoFakeApi
+
+# #############################################################################
+# ######## Globals #################
+# ##################################
+
+
+def echo_app(environ, start_response):
+    """Minimal WSGI application echoing the request."""
+    length = int(environ.get("CONTENT_LENGTH") or 0)
+    body = json.dumps(
+        {
+            "method": environ.get("REQUEST_METHOD"),
+            "path": environ.get("PATH_INFO"),
+            "query": environ.get("QUERY_STRING"),
+            "body": environ["wsgi.input"].read(length).decode("utf-8"),
+            "results": list(range(1000)),
+        }
+    ).encode("utf-8")
+    start_response(
+        "200 OK",
+        [("Content-Type", "application/json"), ("Content-Length", str(len(body)))],
+    )
+    return [body]
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+@unittest.skipIf(transports.httpx is None, "httpx is not installed")
+class TestIsogeoHttp2Adapter(unittest.TestCase):
+    """Test httpx transport adapter (HTTP/1.1 fallback on a local server)."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.server = make_server("127.0.0.1", 0, echo_app, handler_class=QuietHandler)
+        cls.url = "http://127.0.0.1:{}".format(cls.server.server_port)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Executed after all tests."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.session = requests.Session()
+        self.session.mount("http://", transports.IsogeoHttp2Adapter(max_connections=2))
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.session.close()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_adapter_get(self):
+        """Responses are converted into requests ones."""
+        response = self.session.get(
+            self.url + "/resources/search", params={"q": "type:dataset"}, timeout=(2, 5)
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("content-type"), "application/json")
+        self.assertEqual(response.json().get("query"), "q=type%3Adataset")
+        self.assertEqual(len(response.json().get("results")), 1000)
+
+    def test_adapter_post(self):
+        """Request bodies are sent."""
+        response = self.session.post(self.url + "/resources", json={"title": "Métadonnée"})
+        self.assertEqual(response.json().get("method"), "POST")
+        self.assertEqual(json.loads(response.json().get("body")), {"title": "Métadonnée"})
+
+    def test_adapter_stream(self):
+        """Streamed responses can be read by chunks."""
+        response = self.session.get(self.url + "/resources/search", stream=True)
+        content = b"".join(response.iter_content(chunk_size=256))
+        self.assertEqual(len(json.loads(content).get("results")), 1000)
+        response.close()
+
+    def test_adapter_connection_error(self):
+        """Transport errors are raised as requests ones."""
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.session.get("http://127.0.0.1:1/about", timeout=1)
+
+
+class TestIsogeoRecordReplay(unittest.TestCase):
+    """Test record and replay of the API responses."""
+
+    # -- Standard methods --------------------------------------------------------
+    def setUp(self):
+        """Fixtures prepared before each test."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive = str(Path(self.tmp_dir.name) / "session.jsonl.gz")
+
+    def tearDown(self):
+        """Executed after each test."""
+        self.tmp_dir.cleanup()
+
+    def client(self, url: str, **kwargs) -> Isogeo:
+        """Client of the fake API, connected."""
+        isogeo = Isogeo(
+            client_id=FAKE_CLIENT_ID,
+            client_secret=FAKE_CLIENT_SECRET,
+            auto_refresh_url="{}/oauth/token".format(url),
+            platform="custom",
+            isogeo_urls={"api_url": url},
+            **kwargs,
+        )
+        isogeo.connect()
+        return isogeo
+
+    # -- TESTS ---------------------------------------------------------
+    def test_record_replay(self):
+        """Recorded responses are replayed without network."""
+        with IsogeoFakeApi(total=150).serve() as (app, url):
+            isogeo = self.client(url, record=self.archive)
+            recorded = isogeo.search(whole_results=1, include=("tags",))
+            md_id = recorded.results[0].get("_id")
+            recorded_md = isogeo.metadata.get(md_id)
+            isogeo.close()
+
+        with gzip.open(self.archive, "rt", encoding="utf-8") as archive:
+            entries = [json.loads(line) for line in archive]
+        self.assertEqual(len(entries), sum(app.hits.values()))
+        token = [e for e in entries if e.get("url").endswith("/oauth/token")][0]
+        self.assertEqual(json.loads(token.get("text")).get("access_token"), "redacted")
+
+        # server is stopped: everything comes from the archive
+        with mock.patch.dict(environ, {"OAUTHLIB_INSECURE_TRANSPORT": "1"}):
+            isogeo = self.client(url, replay=self.archive, replay_latency=0)
+            replayed = isogeo.search(whole_results=1, include=("tags",))
+            self.assertEqual(replayed.results, recorded.results)
+            self.assertEqual(isogeo.metadata.get(md_id).to_dict(), recorded_md.to_dict())
+            # the search is sent with another page size
+            with self.assertRaises(ResponseNotRecordedError):
+                isogeo.search(page_size=5)
+            isogeo.close()
+
+        with self.assertRaises(ValueError):
+            self.client(url, record=self.archive, replay=self.archive)
+
+    def test_warm_up(self):
+        """Connections are warmed up below the instrumented requests, on demand."""
+        with IsogeoFakeApi().serve() as (app, url):
+            isogeo = self.client(url, record=self.archive)
+            self.assertNotIn("HEAD about", app.hits)
+            routes = set(isogeo.custom_hooks.stats.get("routes"))
+            for future in isogeo.warm_up(3):
+                future.result()
+            self.assertEqual(app.hits.get("HEAD about"), 3)
+            self.assertEqual(set(isogeo.custom_hooks.stats.get("routes")), routes)
+            self.assertEqual(isogeo.limiter.in_flight, 0)
+            isogeo.close()
+
+        with gzip.open(self.archive, "rt", encoding="utf-8") as archive:
+            methods = [json.loads(line).get("method") for line in archive]
+        self.assertNotIn("HEAD", methods)
+
+    def test_replay_matching_timing(self):
+        """Requests are matched on normalized URLs and answered with the original timing."""
+        with IsogeoFakeApi().serve() as (app, url):
+            session = requests.Session()
+            adapter = transports.IsogeoRecordAdapter(self.archive)
+            session.mount("http://", adapter)
+            session.get(url + "/about/?b=2&a=1")
+            app.latency = 0.3
+            session.get(url + "/about")
+            session.close()
+
+        session = requests.Session()
+        adapter = transports.IsogeoReplayAdapter(self.archive, ignore_params=("b",))
+        session.mount("https://", adapter)
+        response = session.get("https://api.other.com/about?a=1&b=3", stream=True)
+        self.assertLess(response.elapsed.total_seconds(), 0.3)
+        content = b"".join(response.iter_content(8))
+        self.assertEqual(json.loads(content).get("version"), "fake")
+
+        response = session.get("https://api.other.com/about")
+        self.assertGreaterEqual(response.elapsed.total_seconds(), 0.3)
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            session.get("https://api.other.com/about", timeout=(1, 0.1))
+        adapter.latency = 0
+        response = session.get("https://api.other.com/about")
+        self.assertLess(response.elapsed.total_seconds(), 0.3)
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+# -*- coding: UTF-8 -*-
+#! python3  # noqa E265
+
+"""Usage from the repo root folder:
+
+```python
+# for whole test
+python -m unittest tests.test_utils_helpers
+# for specific
+python -m unittest tests.test_utils_helpers.TestIsogeoUtilsHelpers.test_project_fields
+```
+"""
+
+# #############################################################################
+# ########## Libraries #############
+# ##################################
+
+# Standard library
+import unittest
+from datetime import datetime
+
+# module target
+from isogeo_pysdk import IsogeoUtils
+
+# #############################################################################
+# ########## Classes ###############
+# ##################################
+
+
+class TestIsogeoUtilsHelpers(unittest.TestCase):
+    """Test utils helpers which don't request the API: no credentials required."""
+
+    # -- Standard methods --------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """Executed when module is loaded before any test."""
+        cls.utils = IsogeoUtils()
+
+    # -- TESTS ---------------------------------------------------------
+    def test_project_fields(self):
+        """Test results pruning with fields paths."""
+        record = {
+            "_id": "0269803d50c446b09f5060ef7fe3e22b",
+            "title": "Parcels",
+            "abstract": "Very long abstract",
+            "links": [
+                {"url": "https://example.com", "type": "url", "kind": "data"},
+                {"url": "https://example.org", "type": "hosted", "kind": "wms"},
+            ],
+            "contacts": [{"contact": {"name": "Isogeo", "email": "x@x.fr"}}],
+        }
+        projected = IsogeoUtils.project_fields(
+            record, fields=("_id", "title", "links[].url", "links.type", "contacts.contact.name")
+        )
+        self.assertEqual(
+            projected,
+            {
+                "_id": "0269803d50c446b09f5060ef7fe3e22b",
+                "title": "Parcels",
+                "links": [
+                    {"url": "https://example.com", "type": "url"},
+                    {"url": "https://example.org", "type": "hosted"},
+                ],
+                "contacts": [{"contact": {"name": "Isogeo"}}],
+            },
+        )
+        # a parent path keeps the whole subtree
+        self.assertEqual(
+            IsogeoUtils.project_fields(record, fields=("links.url", "links")),
+            {"links": record.get("links")},
+        )
+        # no fields, no projection
+        self.assertIs(IsogeoUtils.project_fields(record, fields=()), record)
+        with self.assertRaises(TypeError):
+            IsogeoUtils.project_fields(record, fields="_id")
+
+    def test_helper_datetimes_search(self):
+        """Test bulk conversion of results dates."""
+        results = [
+            {"_created": "2019-06-13T16:21:38.1917618+00:00", "modified": None},
+            {"_created": "2018-06-04T00:00:00+00:00", "modified": "2018-06-04"},
+        ]
+        dates = IsogeoUtils.hlpr_datetimes_search(
+            results, fields=("_created", "modified"), as_numpy=False
+        )
+        self.assertEqual(
+            dates.get("_created"),
+            [datetime(2019, 6, 13, 16, 21, 38, 191761), datetime(2018, 6, 4)],
+        )
+        self.assertEqual(dates.get("modified"), [None, datetime(2018, 6, 4)])
+
+    def test_tags_to_dict(self):
+        """Test search tags conversion into dicts by facet."""
+        wg_uuid = "0269803d50c446b09f5060ef7fe3e22b"
+        tags = {
+            "action:download": "Download",
+            "catalog:{}:633216a375ab48ca8ca72e4a1af7a266".format(wg_uuid): "Roads",
+            "catalog:32f7e95ec4e94ca3bc1afda960003882:633216a375ab48ca8ca72e4a1af7a267": "Roads",
+            "format:shp": "ESRI Shapefile",
+            "owner:{}".format(wg_uuid): "Isogeo Test",
+            "provider:auto": None,
+        }
+        query = {
+            "_tags": ["catalog:{}:633216a375ab48ca8ca72e4a1af7a266".format(wg_uuid)],
+            "_terms": ["roads"],
+        }
+        tags_dicts, query_dicts = self.utils.tags_to_dict(tags=tags, prev_query=query)
+        self.assertEqual(tags_dicts.get("formats"), {"ESRI Shapefile": "format:shp"})
+        self.assertEqual(tags_dicts.get("providers"), {"auto": "provider:auto"})
+        self.assertEqual(len(tags_dicts.get("catalogs")), 2)
+        self.assertIn("Roads (32f7e)", tags_dicts.get("catalogs"))
+        self.assertEqual(
+            query_dicts.get("_tags").get("catalogs"),
+            {"Roads": "catalog:{}:633216a375ab48ca8ca72e4a1af7a266".format(wg_uuid)},
+        )
+        self.assertEqual(query_dicts.get("_terms"), ["roads"])
+
+        # cached output must not be altered by modifications
+        tags_dicts.get("formats").clear()
+        tags_dicts_again, _ = self.utils.tags_to_dict(tags=tags, prev_query=query)
+        self.assertEqual(len(tags_dicts_again.get("formats")), 1)
+
+        # counts
+        counts = IsogeoUtils.tags_counts(
+            [{"tags": {"format:shp": "ESRI Shapefile"}}, {"tags": {"format:shp": None}}]
+        )
+        self.assertEqual(counts.get("formats"), {"format:shp": 2})
+
+        with self.assertRaises(ValueError):
+            self.utils.tags_to_dict(tags=tags, prev_query=query, duplicated="oops")
+
+    def test_route_template(self):
+        """Test route template extraction from URLs."""
+        self.assertEqual(
+            self.utils.route_template(
+                "https://v1.api.isogeo.com/groups/32f7e95ec4e94ca3bc1afda960003882"
+                "/resources/search/?_lang=fr"
+            ),
+            "groups/{id}/resources/search",
+        )
+        self.assertEqual(
+            self.utils.route_template(
+                "https://api.isogeo.com/resources/8d9ba5a3-d9b1-4f2a-a1c7-2e7a5a1b2c3d/links/9c1e"
+            ),
+            "resources/{id}/links/9c1e",
+        )
+        self.assertEqual(
+            self.utils.route_template("https://api.isogeo.com/coordinate-systems/2154/"),
+            "coordinate-systems/{id}",
+        )
+
+
+# ##############################################################################
+# ##### Stand alone program ########
+# ##################################
+if __name__ == "__main__":
+    unittest.main()